@@ -0,0 +1,26 @@
+"""Add composite city/state index on demographics
+
+Revision ID: 7a41f2d9c0e8
+Revises: 3bf360c86bbf
+Create Date: 2026-08-30 10:15:03.118274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a41f2d9c0e8'
+down_revision = '3bf360c86bbf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_demographics_city_state', 'demographics', ['city', 'state'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_demographics_city_state', table_name='demographics')
@@ -0,0 +1,56 @@
+"""Add geohash6 spatial key columns
+
+Revision ID: a6e3d7b5c210
+Revises: f0d2c6e8a914
+Create Date: 2026-08-30 13:02:14.518302
+
+"""
+from alembic import op
+import pygeohash
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6e3d7b5c210'
+down_revision = 'f0d2c6e8a914'
+branch_labels = None
+depends_on = None
+
+
+# Tables that get the geohash6 spatial key; prefix matches on the indexed key
+# turn nearest-neighbor scans into index range lookups.
+GEOHASH_TABLES = ['publix_stores', 'competitor_stores', 'parcels', 'shopping_centers']
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table in GEOHASH_TABLES:
+        op.add_column(table, sa.Column('geohash6', sa.String(length=6), nullable=True))
+        op.create_index(f'ix_{table}_geohash6', table, ['geohash6'], unique=False)
+
+        # Backfill existing rows; the ORM event listeners keep new rows in sync
+        rows = bind.execute(
+            sa.text(
+                f'SELECT id, latitude, longitude FROM {table} '
+                'WHERE latitude IS NOT NULL AND longitude IS NOT NULL'
+            )
+        ).fetchall()
+        if rows:
+            bind.execute(
+                sa.text(f'UPDATE {table} SET geohash6 = :geohash WHERE id = :id'),
+                [
+                    {
+                        'id': row.id,
+                        'geohash': pygeohash.encode(
+                            row.latitude, row.longitude, precision=6
+                        ),
+                    }
+                    for row in rows
+                ],
+            )
+
+
+def downgrade() -> None:
+    for table in GEOHASH_TABLES:
+        op.drop_index(f'ix_{table}_geohash6', table_name=table)
+        op.drop_column(table, 'geohash6')
@@ -0,0 +1,29 @@
+"""Add composite state/lat/lon index on competitor_stores
+
+Revision ID: b59c3e7d8f12
+Revises: 7a41f2d9c0e8
+Create Date: 2026-08-30 11:02:47.553190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b59c3e7d8f12'
+down_revision = '7a41f2d9c0e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_competitor_state_lat_lon',
+        'competitor_stores',
+        ['state', 'latitude', 'longitude'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_competitor_state_lat_lon', table_name='competitor_stores')
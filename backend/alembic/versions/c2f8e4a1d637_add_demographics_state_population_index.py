@@ -0,0 +1,31 @@
+"""Add demographics state/population index
+
+Revision ID: c2f8e4a1d637
+Revises: a6e3d7b5c210
+Create Date: 2026-08-30 13:58:47.209414
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f8e4a1d637'
+down_revision = 'a6e3d7b5c210'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Descending population so "largest cities in a state first" is an
+    # ordered index scan
+    op.create_index(
+        'ix_demo_state_pop',
+        'demographics',
+        ['state', sa.text('population DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_demo_state_pop', table_name='demographics')
@@ -0,0 +1,42 @@
+"""Promote saturation metrics to demographics columns
+
+Revision ID: d81f5a2c4b06
+Revises: b59c3e7d8f12
+Create Date: 2026-08-30 11:24:18.904412
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd81f5a2c4b06'
+down_revision = 'b59c3e7d8f12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('demographics', sa.Column('saturation_score', sa.Float(), nullable=True))
+    op.add_column('demographics', sa.Column('stores_per_sq_mile', sa.Float(), nullable=True))
+    op.create_index(
+        op.f('ix_demographics_saturation_score'),
+        'demographics',
+        ['saturation_score'],
+        unique=False,
+    )
+    # Backfill from the JSON blob the metrics used to live in
+    op.execute(
+        """
+        UPDATE demographics
+        SET saturation_score = (additional_data->>'saturation_score')::float,
+            stores_per_sq_mile = (additional_data->>'stores_per_sq_mile')::float
+        WHERE additional_data IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_demographics_saturation_score'), table_name='demographics')
+    op.drop_column('demographics', 'stores_per_sq_mile')
+    op.drop_column('demographics', 'saturation_score')
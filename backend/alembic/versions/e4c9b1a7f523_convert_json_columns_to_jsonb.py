@@ -0,0 +1,70 @@
+"""Convert json columns to jsonb
+
+Revision ID: e4c9b1a7f523
+Revises: d81f5a2c4b06
+Create Date: 2026-08-30 12:05:51.337618
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4c9b1a7f523'
+down_revision = 'd81f5a2c4b06'
+branch_labels = None
+depends_on = None
+
+
+# Every JSON column in the schema; jsonb is parsed once at write time instead
+# of on every read, and supports GIN indexing.
+JSON_COLUMNS = [
+    ('demographics', 'additional_data'),
+    ('parcels', 'boundary_geojson'),
+    ('parcels', 'existing_uses'),
+    ('parcels', 'proximity_to_anchors'),
+    ('parcels', 'additional_data'),
+    ('zoning_records', 'additional_data'),
+    ('predictions', 'key_factors'),
+    ('zoning_codes', 'permitted_uses'),
+    ('zoning_codes', 'additional_data'),
+    ('impact_fees', 'additional_data'),
+    ('planning_commission_records', 'additional_data'),
+    ('analysis_runs', 'additional_data'),
+    ('shopping_centers', 'anchor_tenants'),
+    ('shopping_centers', 'additional_data'),
+    ('traffic_data', 'additional_data'),
+    ('news_articles', 'additional_data'),
+    ('economic_indicators', 'additional_data'),
+    ('development_projects', 'additional_data'),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+    op.create_index(
+        'ix_parcels_proximity_anchors',
+        'parcels',
+        ['proximity_to_anchors'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'proximity_to_anchors': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_parcels_proximity_anchors', table_name='parcels')
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON(),
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,53 @@
+"""Add chat filter indexes (trigram city, predictions state/city)
+
+Revision ID: e7b3f19c4a52
+Revises: c2f8e4a1d637
+Create Date: 2026-08-30 14:41:22.187530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3f19c4a52'
+down_revision = 'c2f8e4a1d637'
+branch_labels = None
+depends_on = None
+
+
+# The chat query path filters these tables with ILIKE '%city%'; a trigram GIN
+# index serves that on PostgreSQL where a btree cannot.
+TRGM_TABLES = {
+    'publix_stores': 'ix_publix_city_trgm',
+    'parcels': 'ix_parcels_city_trgm',
+    'demographics': 'ix_demographics_city_trgm',
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, index_name in TRGM_TABLES.items():
+            op.create_index(
+                index_name,
+                table,
+                ['city'],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={'city': 'gin_trgm_ops'},
+            )
+
+    op.create_index(
+        'ix_predictions_state_city', 'predictions', ['state', 'city'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_predictions_state_city', table_name='predictions')
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        for table, index_name in TRGM_TABLES.items():
+            op.drop_index(index_name, table_name=table)
@@ -0,0 +1,39 @@
+"""Add state/city composite indexes on hot tables
+
+Revision ID: f0d2c6e8a914
+Revises: e4c9b1a7f523
+Create Date: 2026-08-30 12:31:26.702845
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f0d2c6e8a914'
+down_revision = 'e4c9b1a7f523'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_publix_state_city', 'publix_stores', ['state', 'city'], unique=False)
+    op.create_index(
+        'ix_competitor_state_city_name',
+        'competitor_stores',
+        ['state', 'city', 'competitor_name'],
+        unique=False,
+    )
+    op.create_index('ix_parcels_state_city', 'parcels', ['state', 'city'], unique=False)
+    op.create_index('ix_zoning_state_city', 'zoning_records', ['state', 'city'], unique=False)
+    op.create_index(
+        'ix_shopping_centers_state_city', 'shopping_centers', ['state', 'city'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_shopping_centers_state_city', table_name='shopping_centers')
+    op.drop_index('ix_zoning_state_city', table_name='zoning_records')
+    op.drop_index('ix_parcels_state_city', table_name='parcels')
+    op.drop_index('ix_competitor_state_city_name', table_name='competitor_stores')
+    op.drop_index('ix_publix_state_city', table_name='publix_stores')
@@ -0,0 +1,41 @@
+"""Add llm_batches table for OpenAI Batch API job tracking
+
+Revision ID: f9c5a27d3e81
+Revises: e7b3f19c4a52
+Create Date: 2026-08-30 17:02:45.913264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9c5a27d3e81'
+down_revision = 'e7b3f19c4a52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_batches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('batch_id', sa.String(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('input_file_id', sa.String(), nullable=True),
+        sa.Column('output_file_id', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_llm_batches_id'), 'llm_batches', ['id'], unique=False)
+    op.create_index(
+        op.f('ix_llm_batches_batch_id'), 'llm_batches', ['batch_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_llm_batches_batch_id'), table_name='llm_batches')
+    op.drop_index(op.f('ix_llm_batches_id'), table_name='llm_batches')
+    op.drop_table('llm_batches')
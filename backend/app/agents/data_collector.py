@@ -1,6 +1,7 @@
 """Data Collector Agent - Gathers store locations, demographics, and zoning data"""
 
 from typing import List, Dict, Any
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from app.services.llm_service import call_llm, create_agent_prompt
 from app.services.scraper import (
@@ -715,65 +716,56 @@ class DataCollectorAgent:
 
         # Collect Publix news
         publix_articles = self.news_service.search_publix_news(city, state, days)
-        saved_publix = 0
-
-        for article_data in publix_articles:
-            try:
-                existing = (
-                    self.db.query(NewsArticle)
-                    .filter_by(url=article_data.get("url"))
-                    .first()
-                )
-                if existing:
-                    continue
-
-                article = NewsArticle(**article_data)
-                self.db.add(article)
-                saved_publix += 1
-            except Exception as e:
-                logger.warning(f"Failed to add news article: {e}")
-                continue
-
         all_articles["publix"] = publix_articles
 
         # Collect competitor news
         competitors = ["Walmart", "Kroger", "Target", "Costco"]
         for competitor in competitors:
-            comp_articles = self.news_service.search_competitor_news(
+            all_articles[competitor.lower()] = self.news_service.search_competitor_news(
                 competitor, city, state, days
             )
-            saved_comp = 0
-
-            for article_data in comp_articles:
-                try:
-                    existing = (
-                        self.db.query(NewsArticle)
-                        .filter_by(url=article_data.get("url"))
-                        .first()
-                    )
-                    if existing:
-                        continue
-
-                    article = NewsArticle(**article_data)
-                    self.db.add(article)
-                    saved_comp += 1
-                except Exception as e:
-                    logger.warning(f"Failed to add competitor news article: {e}")
-                    continue
-
-            all_articles[competitor.lower()] = comp_articles
 
+        # One upsert for the whole batch: ON CONFLICT DO NOTHING on the url
+        # unique index replaces a SELECT-per-URL existence check
         try:
-            self.db.commit()
-            logger.info(
-                f"Saved {saved_publix} Publix articles and competitor articles to database"
+            saved = self._insert_news_articles(
+                [article for articles in all_articles.values() for article in articles]
             )
+            self.db.commit()
+            logger.info(f"Saved {saved} news articles to database")
         except Exception as e:
             logger.error(f"Database commit failed: {e}")
             self.db.rollback()
 
         return all_articles
 
+    def _insert_news_articles(self, articles: List[Dict]) -> int:
+        """Insert news rows in one statement, skipping URLs already stored
+
+        Returns:
+            Number of rows actually inserted
+        """
+        columns = {column.name for column in NewsArticle.__table__.columns}
+        rows = []
+        seen = set()
+        for article in articles:
+            url = article.get("url")
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            rows.append({key: article.get(key) for key in columns if key in article})
+        if not rows:
+            return 0
+
+        # Pad so every row binds the same parameter set (executemany requires it)
+        keys = set().union(*rows)
+        result = self.db.execute(
+            pg_insert(NewsArticle)
+            .values([{key: row.get(key) for key in keys} for row in rows])
+            .on_conflict_do_nothing(index_elements=["url"])
+        )
+        return result.rowcount
+
     def collect_economic_indicators(
         self, city: str, state: str, county: str = None
     ) -> Dict:
@@ -846,4 +838,12 @@ class DataCollectorAgent:
         self.s3_service.upload_collection_results(results, region=region)
         logger.info(f"Uploaded collection results for {region} to S3")
 
+        # Freshly collected rows should show up in chat context and
+        # expansion analyses right away
+        from app.services.chat_service import ChatService
+        from app.services.expansion_analyzer import ExpansionAnalyzer
+
+        ChatService.invalidate_context()
+        ExpansionAnalyzer.invalidate_caches()
+
         return results
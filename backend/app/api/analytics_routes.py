@@ -45,6 +45,17 @@ def get_expansion_heatmap(
             demographics_query = demographics_query.filter(Demographics.state == state)
         demographics = demographics_query.all()
 
+        # Store counts per city in one GROUP BY instead of a COUNT round
+        # trip for every demographics row below
+        store_count_query = db.query(
+            PublixStore.city, PublixStore.state, func.count()
+        ).group_by(PublixStore.city, PublixStore.state)
+        if state:
+            store_count_query = store_count_query.filter(PublixStore.state == state)
+        store_counts = {
+            (city, st): count for city, st, count in store_count_query.all()
+        }
+
         # Build heat map data
         heatmap_data = []
 
@@ -75,14 +86,7 @@ def get_expansion_heatmap(
                     opportunity_score += 0.2
 
                 # Get store count for saturation
-                store_count = (
-                    db.query(func.count(PublixStore.id))
-                    .filter(
-                        PublixStore.city == demo.city, PublixStore.state == demo.state
-                    )
-                    .scalar()
-                    or 0
-                )
+                store_count = store_counts.get((demo.city, demo.state), 0)
 
                 if store_count == 0 and opportunity_score > 0.3:
                     # High opportunity, no stores yet
@@ -1,6 +1,6 @@
 """Pydantic models for API requests and responses"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -67,6 +67,22 @@ class CityAnalysisRequest(BaseModel):
     state: str
 
 
+class AnalysisJobResponse(BaseModel):
+    """Response model for a queued analysis job"""
+
+    job_id: str
+    status: str
+
+
+class AnalysisJobStatusResponse(BaseModel):
+    """Status/result of a background analysis job"""
+
+    job_id: str
+    status: str  # queued, running, completed, failed
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
 class DemographicsResponse(BaseModel):
     """Demographics response model"""
 
@@ -104,6 +120,37 @@ class ZoningRecordResponse(BaseModel):
         from_attributes = True
 
 
+class BatchGeocodeRequest(BaseModel):
+    """Request model for batch geocoding"""
+
+    addresses: List[Dict[str, str]] = Field(
+        ..., description="Address dicts with address/city/state and optional zip_code"
+    )
+
+
+class ZoningRegionFilter(BaseModel):
+    """Parsed form of the /zoning/{region} path segment.
+
+    Accepts either a bare state ("FL") or "city,state" ("Tampa,FL") and
+    normalizes it once at validation time instead of per-request string
+    splitting in the handler.
+    """
+
+    city: Optional[str] = None
+    state: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def parse_region(cls, values):
+        region = values.get("region") if isinstance(values, dict) else None
+        if region is None:
+            return values
+        if "," in region:
+            city, state = region.split(",", 1)
+            return {"city": city.strip(), "state": state.strip() or None}
+        return {"state": region.strip()}
+
+
 class DashboardStatsResponse(BaseModel):
     """Dashboard statistics response"""
 
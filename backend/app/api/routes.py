@@ -1,9 +1,10 @@
 """FastAPI routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict
-from app.services.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, raiseload
+from typing import Annotated, List, Optional, Dict
+from app.services.database import get_db, SessionLocal
 from app.models.schemas import (
     PublixStore,
     CompetitorStore,
@@ -18,116 +19,445 @@ from app.models.schemas import (
     EconomicIndicator,
     DevelopmentProject,
 )
-from sqlalchemy import func
+from sqlalchemy import String, bindparam, func, or_, select
 from app.api.models import (
     StoreResponse,
     PredictionResponse,
     AnalysisRequest,
-    AnalysisResponse,
     CityAnalysisRequest,
     DemographicsResponse,
     ZoningRecordResponse,
     DashboardStatsResponse,
     ChatRequest,
     ChatResponse,
+    ZoningRegionFilter,
+    AnalysisJobResponse,
+    AnalysisJobStatusResponse,
+    BatchGeocodeRequest,
 )
 from app.api import analytics_routes
 from app.agents.orchestrator import Orchestrator
 from app.agents.reporter import ReporterAgent
+from app.services.smarty_service import SmartyService
+from app.services.parcel_service import ParcelService
+from app.services.chat_service import ChatService
+from functools import lru_cache
+from operator import attrgetter
+import json
 import logging
+import threading
+import uuid
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Shared query-param types: pydantic-core compiles each Annotated alias's
+# validator once, and every route reuses it instead of redeclaring (and
+# re-validating the metadata of) the same Query spec.
+StateFilter = Annotated[Optional[str], Query(description="Filter by state")]
+CityFilter = Annotated[Optional[str], Query(description="Filter by city")]
+Limit500 = Annotated[int, Query(ge=1, le=500)]
+Limit1000 = Annotated[int, Query(ge=1, le=1000)]
+Limit5000 = Annotated[int, Query(ge=1, le=5000)]
+
+
+@lru_cache()
+def _get_smarty_service() -> SmartyService:
+    """Lazy singleton so credentials are read once, not per request"""
+    return SmartyService()
+
+
+# Field tuples + attrgetters for the routes that serialize rows to plain
+# dicts. attrgetter pulls all attributes in one C-level call, so the hot
+# response loops avoid a Python attribute lookup per field per row.
+_COMPETITOR_FIELDS = (
+    "id",
+    "competitor_name",
+    "address",
+    "city",
+    "state",
+    "zip_code",
+    "latitude",
+    "longitude",
+)
+_COMPETITOR_GETTER = attrgetter(*_COMPETITOR_FIELDS)
+
+_PARCEL_FIELDS = (
+    "id",
+    "parcel_id",
+    "address",
+    "city",
+    "state",
+    "acreage",
+    "current_zoning",
+    "assessed_value",
+    "land_use_code",
+    "latitude",
+    "longitude",
+    "owner_name",
+    "owner_type",
+    "additional_data",
+)
+_PARCEL_GETTER = attrgetter(*_PARCEL_FIELDS)
+
+_SHOPPING_CENTER_FIELDS = (
+    "id",
+    "name",
+    "address",
+    "city",
+    "state",
+    "latitude",
+    "longitude",
+    "rating",
+    "anchor_tenants",
+    "co_tenancy_score",
+    "occupancy_rate",
+    "additional_data",
+)
+_SHOPPING_CENTER_GETTER = attrgetter(*_SHOPPING_CENTER_FIELDS)
+
+_TRAFFIC_FIELDS = (
+    "id",
+    "location_id",
+    "location_type",
+    "city",
+    "state",
+    "latitude",
+    "longitude",
+    "average_daily_traffic",
+    "peak_hour_volume",
+    "traffic_growth_rate",
+    "accessibility_score",
+    "source",
+)
+_TRAFFIC_GETTER = attrgetter(*_TRAFFIC_FIELDS)
+
+_NEWS_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "source",
+    "url",
+    "city",
+    "state",
+    "topic",
+    "sentiment",
+    "mentions_publix",
+    "mentions_competitor",
+    "relevance_score",
+)
+_NEWS_GETTER = attrgetter(*_NEWS_FIELDS)
+
+_ECONOMIC_FIELDS = (
+    "id",
+    "city",
+    "state",
+    "county",
+    "unemployment_rate",
+    "employment_growth_rate",
+    "average_wage",
+    "median_wage",
+    "retail_sales_per_capita",
+    "business_establishments",
+    "new_business_formations",
+    "gdp_per_capita",
+    "data_year",
+    "source",
+)
+_ECONOMIC_GETTER = attrgetter(*_ECONOMIC_FIELDS)
+
+_DEVELOPMENT_FIELDS = (
+    "id",
+    "project_name",
+    "address",
+    "city",
+    "state",
+    "latitude",
+    "longitude",
+    "project_type",
+    "square_feet",
+    "estimated_cost",
+    "status",
+    "developer_name",
+)
+_DEVELOPMENT_GETTER = attrgetter(*_DEVELOPMENT_FIELDS)
+
+
+def _rows_to_dicts(rows, fields, getter) -> List[Dict]:
+    """Serialize ORM rows to dicts using a precomputed attrgetter"""
+    return [dict(zip(fields, getter(row))) for row in rows]
+
+# Precompiled Core statements for the hot list endpoints. Building these once at
+# import time means each request only binds parameters instead of re-walking the
+# ORM query builder; optional filters are expressed as "param IS NULL OR col = param"
+# so a single cached statement covers every filter combination.
+_STORES_STMT = (
+    select(PublixStore)
+    .where(
+        or_(
+            bindparam("state", type_=String).is_(None),
+            PublixStore.state == bindparam("state", type_=String),
+        ),
+        or_(
+            bindparam("city", type_=String).is_(None),
+            PublixStore.city == bindparam("city", type_=String),
+        ),
+    )
+    .limit(bindparam("limit"))
+)
+
+# PredictionResponse doesn't serialize analysis_run, so any lazy load here
+# would be an accidental N+1; raiseload turns that into a loud error instead.
+_PREDICTIONS_STMT = (
+    select(Prediction)
+    .options(raiseload("*"))
+    .where(
+        or_(
+            bindparam("state", type_=String).is_(None),
+            Prediction.state == bindparam("state", type_=String),
+        ),
+        or_(
+            bindparam("city", type_=String).is_(None),
+            Prediction.city == bindparam("city", type_=String),
+        ),
+        or_(
+            bindparam("min_confidence").is_(None),
+            Prediction.confidence_score >= bindparam("min_confidence"),
+        ),
+    )
+    .order_by(Prediction.confidence_score.desc())
+    .limit(bindparam("limit"))
+)
+
+_DEMOGRAPHICS_STMT = (
+    select(Demographics)
+    .where(
+        or_(
+            bindparam("state", type_=String).is_(None),
+            Demographics.state == bindparam("state", type_=String),
+        ),
+        or_(
+            bindparam("city", type_=String).is_(None),
+            Demographics.city == bindparam("city", type_=String),
+        ),
+    )
+    .limit(bindparam("limit"))
+)
+
+_COMPETITORS_STMT = (
+    select(CompetitorStore)
+    .where(
+        or_(
+            bindparam("state", type_=String).is_(None),
+            CompetitorStore.state == bindparam("state", type_=String),
+        ),
+        or_(
+            bindparam("competitor_name", type_=String).is_(None),
+            CompetitorStore.competitor_name == bindparam("competitor_name", type_=String),
+        ),
+    )
+    .limit(bindparam("limit"))
+)
+
+_PARCELS_STMT = (
+    select(Parcel)
+    .where(
+        or_(
+            bindparam("city", type_=String).is_(None),
+            Parcel.city == bindparam("city", type_=String),
+        ),
+        or_(
+            bindparam("state", type_=String).is_(None),
+            Parcel.state == bindparam("state", type_=String),
+        ),
+        or_(
+            bindparam("min_acreage").is_(None),
+            Parcel.acreage >= bindparam("min_acreage"),
+        ),
+        or_(
+            bindparam("max_acreage").is_(None),
+            Parcel.acreage <= bindparam("max_acreage"),
+        ),
+    )
+    .limit(bindparam("limit"))
+)
+
+# Single-row demographics lookup; the composite (city, state) index makes this
+# one index probe, and LIMIT 1 stops the scan at the first hit.
+_DEMOGRAPHICS_ONE_STMT = (
+    select(Demographics)
+    .where(
+        Demographics.city == bindparam("city", type_=String),
+        Demographics.state == bindparam("state", type_=String),
+    )
+    .limit(1)
+)
+
+# Zoning filters shared by both region forms ("FL" vs "Tampa,FL"); the branch on
+# the parsed region picks one of two precompiled statements instead of growing a
+# fresh query per request.
+_ZONING_COMMON_FILTERS = (
+    or_(
+        bindparam("city", type_=String).is_(None),
+        ZoningRecord.city == bindparam("city", type_=String),
+    ),
+    or_(
+        bindparam("min_acreage").is_(None),
+        ZoningRecord.acreage >= bindparam("min_acreage"),
+    ),
+    or_(
+        bindparam("max_acreage").is_(None),
+        ZoningRecord.acreage <= bindparam("max_acreage"),
+    ),
+)
+
+_ZONING_BY_STATE = (
+    select(ZoningRecord)
+    .where(
+        ZoningRecord.state == bindparam("region_state", type_=String),
+        *_ZONING_COMMON_FILTERS,
+    )
+    .limit(bindparam("limit"))
+)
+
+_ZONING_BY_CITY_STATE = (
+    select(ZoningRecord)
+    .where(
+        ZoningRecord.city == bindparam("region_city", type_=String),
+        or_(
+            bindparam("region_state", type_=String).is_(None),
+            ZoningRecord.state == bindparam("region_state", type_=String),
+        ),
+        *_ZONING_COMMON_FILTERS,
+    )
+    .limit(bindparam("limit"))
+)
+
 
 @router.get("/stores", response_model=List[StoreResponse])
 def get_stores(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
-    limit: int = Query(100, ge=1, le=1000),
+    state: StateFilter = None,
+    city: CityFilter = None,
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get list of Publix stores"""
-    query = db.query(PublixStore)
-
-    if state:
-        query = query.filter(PublixStore.state == state)
-    if city:
-        query = query.filter(PublixStore.city == city)
-
-    stores = query.limit(limit).all()
+    stores = (
+        db.execute(_STORES_STMT, {"state": state, "city": city, "limit": limit})
+        .scalars()
+        .all()
+    )
     return stores
 
 
 @router.get("/predictions", response_model=List[PredictionResponse])
 def get_predictions(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
+    state: StateFilter = None,
+    city: CityFilter = None,
     min_confidence: Optional[float] = Query(
         None, ge=0.0, le=1.0, description="Minimum confidence score"
     ),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get predictions for new store locations"""
-    query = db.query(Prediction)
+    predictions = (
+        db.execute(
+            _PREDICTIONS_STMT,
+            {
+                "state": state,
+                "city": city,
+                "min_confidence": min_confidence,
+                "limit": limit,
+            },
+        )
+        .scalars()
+        .all()
+    )
+    return predictions
 
-    if state:
-        query = query.filter(Prediction.state == state)
-    if city:
-        query = query.filter(Prediction.city == city)
-    if min_confidence is not None:
-        query = query.filter(Prediction.confidence_score >= min_confidence)
 
-    predictions = query.order_by(Prediction.confidence_score.desc()).limit(limit).all()
-    return predictions
+# In-process registry of background analysis jobs. Analyses run multi-second
+# LLM + DB work, so the POST endpoints return 202 with a job id immediately and
+# clients poll /analyze/{job_id} instead of holding an HTTP worker for the
+# duration of the run.
+_analysis_jobs: Dict[str, Dict] = {}
+_analysis_jobs_lock = threading.Lock()
 
 
-@router.post("/analyze", response_model=AnalysisResponse)
-def trigger_analysis(request: AnalysisRequest, db: Session = Depends(get_db)):
-    """Trigger new analysis for a region"""
-    try:
-        orchestrator = Orchestrator(db)
-        results = orchestrator.run_analysis(
-            region=request.region, cities=request.cities
-        )
-        return results
-    except Exception as e:
-        logger.error(f"Analysis failed: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+def _set_job(job_id: str, **fields):
+    with _analysis_jobs_lock:
+        _analysis_jobs[job_id].update(fields)
 
 
-@router.post("/analyze/city")
-def analyze_city(request: CityAnalysisRequest, db: Session = Depends(get_db)):
-    """Analyze a single city for expansion potential"""
+def _run_analysis_job(job_id: str, method: str, **kwargs):
+    """Run an orchestrator analysis in the background with its own session"""
+    _set_job(job_id, status="running")
+    db = SessionLocal()
     try:
         orchestrator = Orchestrator(db)
-        results = orchestrator.analyze_single_city(
-            city=request.city, state=request.state
-        )
-        return results
+        results = getattr(orchestrator, method)(**kwargs)
+        _set_job(job_id, status="completed", result=results)
     except Exception as e:
-        logger.error(f"City analysis failed: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"City analysis failed: {str(e)}")
+        logger.error(f"Analysis job {job_id} failed: {str(e)}", exc_info=True)
+        _set_job(job_id, status="failed", error=str(e))
+    finally:
+        db.close()
+
+
+def _enqueue_analysis(background_tasks: BackgroundTasks, method: str, **kwargs) -> str:
+    job_id = uuid.uuid4().hex
+    with _analysis_jobs_lock:
+        _analysis_jobs[job_id] = {"status": "queued", "result": None, "error": None}
+    background_tasks.add_task(_run_analysis_job, job_id, method, **kwargs)
+    return job_id
+
+
+@router.post("/analyze", response_model=AnalysisJobResponse, status_code=202)
+def trigger_analysis(request: AnalysisRequest, background_tasks: BackgroundTasks):
+    """Queue a new analysis for a region and return a job id immediately"""
+    job_id = _enqueue_analysis(
+        background_tasks, "run_analysis", region=request.region, cities=request.cities
+    )
+    return {"job_id": job_id, "status": "queued"}
+
+
+@router.post("/analyze/city", response_model=AnalysisJobResponse, status_code=202)
+def analyze_city(request: CityAnalysisRequest, background_tasks: BackgroundTasks):
+    """Queue a single-city analysis and return a job id immediately"""
+    job_id = _enqueue_analysis(
+        background_tasks,
+        "analyze_single_city",
+        city=request.city,
+        state=request.state,
+    )
+    return {"job_id": job_id, "status": "queued"}
+
+
+@router.get("/analyze/{job_id}", response_model=AnalysisJobStatusResponse)
+def get_analysis_job(job_id: str):
+    """Poll the status/result of a background analysis job"""
+    with _analysis_jobs_lock:
+        job = _analysis_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    return {"job_id": job_id, **job}
 
 
 @router.get("/demographics", response_model=List[DemographicsResponse])
 def get_demographics_list(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
-    limit: int = Query(500, ge=1, le=5000),
+    state: StateFilter = None,
+    city: CityFilter = None,
+    limit: Limit5000 = 500,
     db: Session = Depends(get_db),
 ):
     """Get list of demographic records"""
-    query = db.query(Demographics)
-
-    if state:
-        query = query.filter(Demographics.state == state)
-    if city:
-        query = query.filter(Demographics.city == city)
-
-    demographics = query.limit(limit).all()
+    demographics = (
+        db.execute(_DEMOGRAPHICS_STMT, {"state": state, "city": city, "limit": limit})
+        .scalars()
+        .all()
+    )
     return demographics
 
 
@@ -139,8 +469,8 @@ def get_demographics(
 ):
     """Get demographic data for a city"""
     demographics = (
-        db.query(Demographics)
-        .filter(Demographics.city == city, Demographics.state == state)
+        db.execute(_DEMOGRAPHICS_ONE_STMT, {"city": city, "state": state})
+        .scalars()
         .first()
     )
 
@@ -153,111 +483,80 @@ def get_demographics(
 @router.get("/zoning/{region}", response_model=List[ZoningRecordResponse])
 def get_zoning_records(
     region: str,
-    city: Optional[str] = Query(None, description="Filter by city"),
+    city: CityFilter = None,
     min_acreage: Optional[float] = Query(15.0, ge=0.0, description="Minimum acreage"),
     max_acreage: Optional[float] = Query(25.0, ge=0.0, description="Maximum acreage"),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get zoning records for a region"""
-    query = db.query(ZoningRecord)
-
-    # Parse region - could be state or city,state
-    if "," in region:
-        parts = region.split(",")
-        city_filter = parts[0].strip()
-        state_filter = parts[1].strip() if len(parts) > 1 else None
-        query = query.filter(ZoningRecord.city == city_filter)
-        if state_filter:
-            query = query.filter(ZoningRecord.state == state_filter)
-    else:
-        query = query.filter(ZoningRecord.state == region)
-
-    if city:
-        query = query.filter(ZoningRecord.city == city)
-    if min_acreage:
-        query = query.filter(ZoningRecord.acreage >= min_acreage)
-    if max_acreage:
-        query = query.filter(ZoningRecord.acreage <= max_acreage)
-
-    records = query.limit(limit).all()
+    region_filter = ZoningRegionFilter.model_validate({"region": region})
+
+    stmt = _ZONING_BY_STATE if region_filter.city is None else _ZONING_BY_CITY_STATE
+    records = (
+        db.execute(
+            stmt,
+            {
+                "region_city": region_filter.city,
+                "region_state": region_filter.state,
+                "city": city,
+                "min_acreage": min_acreage,
+                "max_acreage": max_acreage,
+                "limit": limit,
+            },
+        )
+        .scalars()
+        .all()
+    )
     return records
 
 
 @router.get("/competitors", response_model=List[Dict])
 def get_competitor_stores(
-    state: Optional[str] = Query(None, description="Filter by state"),
+    state: StateFilter = None,
     competitor_name: Optional[str] = Query(
         None, description="Filter by competitor name"
     ),
-    limit: int = Query(1000, ge=1, le=5000),
+    limit: Limit5000 = 1000,
     db: Session = Depends(get_db),
 ):
     """Get competitor stores"""
-    query = db.query(CompetitorStore)
-
-    if state:
-        query = query.filter(CompetitorStore.state == state)
-    if competitor_name:
-        query = query.filter(CompetitorStore.competitor_name == competitor_name)
-
-    stores = query.limit(limit).all()
-    return [
-        {
-            "id": s.id,
-            "competitor_name": s.competitor_name,
-            "address": s.address,
-            "city": s.city,
-            "state": s.state,
-            "zip_code": s.zip_code,
-            "latitude": s.latitude,
-            "longitude": s.longitude,
-        }
-        for s in stores
-    ]
+    stores = (
+        db.execute(
+            _COMPETITORS_STMT,
+            {"state": state, "competitor_name": competitor_name, "limit": limit},
+        )
+        .scalars()
+        .all()
+    )
+    return _rows_to_dicts(stores, _COMPETITOR_FIELDS, _COMPETITOR_GETTER)
 
 
 @router.get("/parcels", response_model=List[Dict])
 def get_parcels(
-    city: Optional[str] = Query(None, description="Filter by city"),
-    state: Optional[str] = Query(None, description="Filter by state"),
+    city: CityFilter = None,
+    state: StateFilter = None,
     min_acreage: Optional[float] = Query(15.0, ge=0.0, description="Minimum acreage"),
     max_acreage: Optional[float] = Query(25.0, ge=0.0, description="Maximum acreage"),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get parcels matching criteria"""
-    query = db.query(Parcel)
-
-    if city:
-        query = query.filter(Parcel.city == city)
-    if state:
-        query = query.filter(Parcel.state == state)
-    if min_acreage:
-        query = query.filter(Parcel.acreage >= min_acreage)
-    if max_acreage:
-        query = query.filter(Parcel.acreage <= max_acreage)
-
-    parcels = query.limit(limit).all()
-    return [
-        {
-            "id": p.id,
-            "parcel_id": p.parcel_id,
-            "address": p.address,
-            "city": p.city,
-            "state": p.state,
-            "acreage": p.acreage,
-            "current_zoning": p.current_zoning,
-            "assessed_value": p.assessed_value,
-            "land_use_code": p.land_use_code,
-            "latitude": p.latitude,
-            "longitude": p.longitude,
-            "owner_name": p.owner_name,
-            "owner_type": p.owner_type,
-            "additional_data": p.additional_data,
-        }
-        for p in parcels
-    ]
+    parcels = (
+        db.execute(
+            _PARCELS_STMT,
+            {
+                "city": city,
+                "state": state,
+                "min_acreage": min_acreage,
+                "max_acreage": max_acreage,
+                "limit": limit,
+            },
+        )
+        .scalars()
+        .all()
+    )
+    return _rows_to_dicts(parcels, _PARCEL_FIELDS, _PARCEL_GETTER)
 
 
 @router.post("/smarty/geocode")
@@ -269,9 +568,7 @@ def geocode_address(
 ):
     """Geocode an address using Smarty API"""
     try:
-        from app.services.smarty_service import SmartyService
-
-        smarty = SmartyService()
+        smarty = _get_smarty_service()
         if not smarty.available:
             raise HTTPException(status_code=503, detail="Smarty API not configured")
 
@@ -287,6 +584,23 @@ def geocode_address(
         raise HTTPException(status_code=500, detail=f"Geocoding failed: {str(e)}")
 
 
+@router.post("/smarty/geocode-batch")
+def geocode_addresses_batch(request: BatchGeocodeRequest):
+    """Geocode a list of addresses in bulk via Smarty's batch API"""
+    try:
+        smarty = _get_smarty_service()
+        if not smarty.available:
+            raise HTTPException(status_code=503, detail="Smarty API not configured")
+
+        results = smarty.geocode_addresses(request.addresses)
+        return {"results": results, "count": len(results)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch geocoding failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Batch geocoding failed: {str(e)}")
+
+
 @router.post("/smarty/property")
 def get_property_data(
     address: str = Query(..., description="Street address"),
@@ -296,9 +610,7 @@ def get_property_data(
 ):
     """Get property data for an address using Smarty API"""
     try:
-        from app.services.smarty_service import SmartyService
-
-        smarty = SmartyService()
+        smarty = _get_smarty_service()
         if not smarty.available:
             raise HTTPException(status_code=503, detail="Smarty API not configured")
 
@@ -324,8 +636,6 @@ def search_parcels_smarty(
 ):
     """Search for parcels in a city using Smarty API"""
     try:
-        from app.services.parcel_service import ParcelService
-
         parcel_service = ParcelService(db=db)
         parcels = parcel_service.get_parcels_by_city(
             city=city,
@@ -399,16 +709,14 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
 
 
 @router.post("/chat", response_model=ChatResponse)
-def chat_endpoint(
+async def chat_endpoint(
     request: ChatRequest,
     db: Session = Depends(get_db),
 ):
     """Chat endpoint for LLM-powered queries about Publix expansion data"""
     try:
-        from app.services.chat_service import ChatService
-
         chat_service = ChatService(db)
-        result = chat_service.chat_with_data(
+        result = await chat_service.chat_with_data(
             request.message, request.conversation_history
         )
         return result
@@ -424,17 +732,52 @@ def chat_endpoint(
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    db: Session = Depends(get_db),
+):
+    """Streaming chat endpoint: token deltas as server-sent events
+
+    Emits `data: {"delta": ...}` events as the model produces tokens, then a
+    terminal `data: [DONE]` event, so clients render text as it arrives
+    instead of waiting out the full completion.
+    """
+    try:
+        chat_service = ChatService(db)
+        deltas = await chat_service.chat_with_data(
+            request.message, request.conversation_history, stream=True
+        )
+    except ImportError:
+        raise HTTPException(
+            status_code=503,
+            detail="OpenAI not available. Install with: poetry add openai",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    async def event_stream():
+        try:
+            async for delta in deltas:
+                if delta:
+                    yield f"data: {json.dumps({'delta': delta})}\n\n"
+        except Exception as e:
+            logger.error(f"Chat stream error: {str(e)}", exc_info=True)
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post("/chat/simple", response_model=ChatResponse)
-def chat_simple(
+async def chat_simple(
     message: str = Query(..., description="User message"),
     db: Session = Depends(get_db),
 ):
     """Simple chat endpoint without conversation history"""
     try:
-        from app.services.chat_service import ChatService
-
         chat_service = ChatService(db)
-        result = chat_service.chat_with_data(message)
+        result = await chat_service.chat_with_data(message)
         return result
     except ImportError:
         raise HTTPException(
@@ -450,10 +793,10 @@ def chat_simple(
 
 @router.get("/shopping-centers", response_model=List[Dict])
 def get_shopping_centers(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
+    state: StateFilter = None,
+    city: CityFilter = None,
     min_co_tenancy_score: Optional[float] = Query(None, ge=0.0, le=100.0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get shopping centers with co-tenancy data"""
@@ -467,31 +810,15 @@ def get_shopping_centers(
         query = query.filter(ShoppingCenter.co_tenancy_score >= min_co_tenancy_score)
 
     centers = query.order_by(ShoppingCenter.co_tenancy_score.desc()).limit(limit).all()
-    return [
-        {
-            "id": c.id,
-            "name": c.name,
-            "address": c.address,
-            "city": c.city,
-            "state": c.state,
-            "latitude": c.latitude,
-            "longitude": c.longitude,
-            "rating": c.rating,
-            "anchor_tenants": c.anchor_tenants,
-            "co_tenancy_score": c.co_tenancy_score,
-            "occupancy_rate": c.occupancy_rate,
-            "additional_data": c.additional_data,
-        }
-        for c in centers
-    ]
+    return _rows_to_dicts(centers, _SHOPPING_CENTER_FIELDS, _SHOPPING_CENTER_GETTER)
 
 
 @router.get("/traffic-data", response_model=List[Dict])
 def get_traffic_data(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
+    state: StateFilter = None,
+    city: CityFilter = None,
     min_accessibility_score: Optional[float] = Query(None, ge=0.0, le=1.0),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get traffic and accessibility data"""
@@ -505,35 +832,19 @@ def get_traffic_data(
         query = query.filter(TrafficData.accessibility_score >= min_accessibility_score)
 
     traffic = query.order_by(TrafficData.accessibility_score.desc()).limit(limit).all()
-    return [
-        {
-            "id": t.id,
-            "location_id": t.location_id,
-            "location_type": t.location_type,
-            "city": t.city,
-            "state": t.state,
-            "latitude": t.latitude,
-            "longitude": t.longitude,
-            "average_daily_traffic": t.average_daily_traffic,
-            "peak_hour_volume": t.peak_hour_volume,
-            "traffic_growth_rate": t.traffic_growth_rate,
-            "accessibility_score": t.accessibility_score,
-            "source": t.source,
-        }
-        for t in traffic
-    ]
+    return _rows_to_dicts(traffic, _TRAFFIC_FIELDS, _TRAFFIC_GETTER)
 
 
 @router.get("/news", response_model=List[Dict])
 def get_news_articles(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
+    state: StateFilter = None,
+    city: CityFilter = None,
     topic: Optional[str] = Query(None, description="Filter by topic"),
     sentiment: Optional[str] = Query(None, description="Filter by sentiment"),
     mentions_publix: Optional[bool] = Query(
         None, description="Filter by Publix mentions"
     ),
-    limit: int = Query(50, ge=1, le=500),
+    limit: Limit500 = 50,
     db: Session = Depends(get_db),
 ):
     """Get news articles about Publix and competitors"""
@@ -551,33 +862,19 @@ def get_news_articles(
         query = query.filter(NewsArticle.mentions_publix == mentions_publix)
 
     articles = query.order_by(NewsArticle.published_date.desc()).limit(limit).all()
-    return [
-        {
-            "id": a.id,
-            "title": a.title,
-            "content": a.content,
-            "source": a.source,
-            "url": a.url,
-            "published_date": (
-                a.published_date.isoformat() if a.published_date else None
-            ),
-            "city": a.city,
-            "state": a.state,
-            "topic": a.topic,
-            "sentiment": a.sentiment,
-            "mentions_publix": a.mentions_publix,
-            "mentions_competitor": a.mentions_competitor,
-            "relevance_score": a.relevance_score,
-        }
-        for a in articles
-    ]
+    results = _rows_to_dicts(articles, _NEWS_FIELDS, _NEWS_GETTER)
+    for result, article in zip(results, articles):
+        result["published_date"] = (
+            article.published_date.isoformat() if article.published_date else None
+        )
+    return results
 
 
 @router.get("/economic-indicators", response_model=List[Dict])
 def get_economic_indicators(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
-    limit: int = Query(100, ge=1, le=1000),
+    state: StateFilter = None,
+    city: CityFilter = None,
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get economic indicators by city/county"""
@@ -589,34 +886,16 @@ def get_economic_indicators(
         query = query.filter(EconomicIndicator.city == city)
 
     indicators = query.limit(limit).all()
-    return [
-        {
-            "id": e.id,
-            "city": e.city,
-            "state": e.state,
-            "county": e.county,
-            "unemployment_rate": e.unemployment_rate,
-            "employment_growth_rate": e.employment_growth_rate,
-            "average_wage": e.average_wage,
-            "median_wage": e.median_wage,
-            "retail_sales_per_capita": e.retail_sales_per_capita,
-            "business_establishments": e.business_establishments,
-            "new_business_formations": e.new_business_formations,
-            "gdp_per_capita": e.gdp_per_capita,
-            "data_year": e.data_year,
-            "source": e.source,
-        }
-        for e in indicators
-    ]
+    return _rows_to_dicts(indicators, _ECONOMIC_FIELDS, _ECONOMIC_GETTER)
 
 
 @router.get("/development-projects", response_model=List[Dict])
 def get_development_projects(
-    state: Optional[str] = Query(None, description="Filter by state"),
-    city: Optional[str] = Query(None, description="Filter by city"),
+    state: StateFilter = None,
+    city: CityFilter = None,
     project_type: Optional[str] = Query(None, description="Filter by project type"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(100, ge=1, le=1000),
+    limit: Limit1000 = 100,
     db: Session = Depends(get_db),
 ):
     """Get development projects"""
@@ -632,24 +911,12 @@ def get_development_projects(
         query = query.filter(DevelopmentProject.status == status)
 
     projects = query.order_by(DevelopmentProject.start_date.desc()).limit(limit).all()
-    return [
-        {
-            "id": p.id,
-            "project_name": p.project_name,
-            "address": p.address,
-            "city": p.city,
-            "state": p.state,
-            "latitude": p.latitude,
-            "longitude": p.longitude,
-            "project_type": p.project_type,
-            "square_feet": p.square_feet,
-            "estimated_cost": p.estimated_cost,
-            "start_date": p.start_date.isoformat() if p.start_date else None,
-            "completion_date": (
-                p.completion_date.isoformat() if p.completion_date else None
-            ),
-            "status": p.status,
-            "developer_name": p.developer_name,
-        }
-        for p in projects
-    ]
+    results = _rows_to_dicts(projects, _DEVELOPMENT_FIELDS, _DEVELOPMENT_GETTER)
+    for result, project in zip(results, projects):
+        result["start_date"] = (
+            project.start_date.isoformat() if project.start_date else None
+        )
+        result["completion_date"] = (
+            project.completion_date.isoformat() if project.completion_date else None
+        )
+    return results
@@ -2,8 +2,9 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from app.api import routes
 from app.api import analytics_routes
 from app.services.database import init_db
@@ -44,6 +45,9 @@ app = FastAPI(
     title="Publix Expansion Predictor API",
     description="Multi-agent LLM system to predict Publix store expansion locations",
     version="0.1.0",
+    # orjson serializes our large store/parcel lists several times faster than
+    # the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -55,14 +59,26 @@ else:
     # Split comma-separated origins
     allowed_origins = [origin.strip() for origin in allowed_origins_env.split(",")]
 
+# Optional regex for origin matching (e.g. preview deploys); Starlette compiles
+# it once at middleware construction so per-request checks stay cheap.
+allowed_origin_regex = os.getenv("ALLOWED_ORIGIN_REGEX")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
+    allow_origin_regex=allowed_origin_regex,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The API only serves GET/POST; enumerating methods and headers instead of
+    # "*" keeps preflight responses specific, and max_age lets browsers cache
+    # them for a day instead of preflighting every request.
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Compress API JSON and frontend assets over the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(routes.router, prefix="/api", tags=["api"])
 app.include_router(analytics_routes.router, prefix="/api", tags=["analytics"])
@@ -97,10 +113,26 @@ def health_check():
         content='{"status":"healthy"}', media_type="application/json", status_code=200
     )
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks responses as immutable.
+
+    Vite emits content-hashed filenames under /assets, so they can be cached
+    for a year and never revalidated.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
 if frontend_dist.exists():
-    app.mount("/assets", StaticFiles(directory=frontend_dist / "assets"), name="assets")
-    
+    app.mount(
+        "/assets", CachedStaticFiles(directory=frontend_dist / "assets"), name="assets"
+    )
+
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
         """Serve frontend for all non-API routes"""
@@ -110,4 +142,7 @@ if frontend_dist.exists():
         file_path = frontend_dist / full_path
         if file_path.exists() and file_path.is_file():
             return FileResponse(file_path)
-        return FileResponse(frontend_dist / "index.html")
+        # index.html must stay revalidated so deploys pick up new asset hashes
+        return FileResponse(
+            frontend_dist / "index.html", headers={"Cache-Control": "no-cache"}
+        )
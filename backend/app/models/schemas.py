@@ -1,158 +1,251 @@
 """SQLAlchemy database models"""
 
 from datetime import datetime
-from sqlalchemy import (
-    Column,
-    Integer,
-    String,
-    Float,
-    DateTime,
-    Text,
-    Boolean,
-    ForeignKey,
-    JSON,
-)
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-
-Base = declarative_base()
+from typing import List, Optional
+
+import pygeohash
+from sqlalchemy import ForeignKey, Index, JSON, String, Text, desc, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+class Base(DeclarativeBase):
+    """Typed declarative base (SQLAlchemy 2.0 style)"""
+
+
+# JSONB on PostgreSQL: parsed once at write time instead of re-parsed on every
+# read, and indexable with GIN. Other backends (sqlite in tests) fall back to
+# the generic JSON type.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Geohash cell size for the spatial key columns: precision 6 is ~1.2km x 0.6km,
+# fine enough that prefix matches at coarser precisions stay selective.
+GEOHASH_PRECISION = 6
 
 
 class PublixStore(Base):
     """Current Publix store locations"""
 
     __tablename__ = "publix_stores"
+    # One index probe for (state, city) filters and ordered scans of a state;
+    # the trigram GIN index serves the chat path's ILIKE '%city%' filters
+    # (PostgreSQL only).
+    __table_args__ = (
+        Index("ix_publix_state_city", "state", "city"),
+        Index(
+            "ix_publix_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    store_number = Column(String, unique=True, index=True)
-    address = Column(String, nullable=False)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    zip_code = Column(String)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
-    square_feet = Column(Integer)
-    opening_date = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    store_number: Mapped[Optional[str]] = mapped_column(unique=True, index=True)
+    address: Mapped[str]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    zip_code: Mapped[Optional[str]]
+    latitude: Mapped[float]
+    longitude: Mapped[float]
+    # Spatial key, maintained on write
+    geohash6: Mapped[Optional[str]] = mapped_column(String(6), index=True)
+    square_feet: Mapped[Optional[int]]
+    opening_date: Mapped[Optional[datetime]]
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class CompetitorStore(Base):
     """Competitor store locations (Walmart, Kroger, etc.)"""
 
     __tablename__ = "competitor_stores"
+    # Supports "competitors in state near (lat, lon)" bounding-box scans as an
+    # index range scan instead of a full state scan.
+    __table_args__ = (
+        Index("ix_competitor_state_lat_lon", "state", "latitude", "longitude"),
+        # Covers the per-city competitor counts as an index-only scan
+        Index("ix_competitor_state_city_name", "state", "city", "competitor_name"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    competitor_name = Column(
-        String, nullable=False, index=True
-    )  # Walmart, Kroger, etc.
-    address = Column(String, nullable=False)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    zip_code = Column(String)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
-    square_feet = Column(Integer)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    competitor_name: Mapped[str] = mapped_column(index=True)  # Walmart, Kroger, etc.
+    address: Mapped[str]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    zip_code: Mapped[Optional[str]]
+    latitude: Mapped[float]
+    longitude: Mapped[float]
+    # Spatial key, maintained on write
+    geohash6: Mapped[Optional[str]] = mapped_column(String(6), index=True)
+    square_feet: Mapped[Optional[int]]
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class Demographics(Base):
     """City/region demographic data"""
 
     __tablename__ = "demographics"
+    # Lookups are almost always by (city, state) together; the composite index
+    # lets those resolve in one index probe instead of intersecting the
+    # single-column indexes.
+    __table_args__ = (
+        Index("ix_demographics_city_state", "city", "state"),
+        # Ordered scan for "largest cities in a state first" queries like the
+        # expansion-opportunity ranking
+        Index("ix_demo_state_pop", "state", desc("population")),
+        # Trigram GIN for the chat path's ILIKE '%city%' filter (PostgreSQL only)
+        Index(
+            "ix_demographics_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    population = Column(Integer)
-    population_5yr_ago = Column(Integer)  # For growth calculation
-    median_income = Column(Float)
-    growth_rate = Column(Float)  # Annual population growth rate
-    median_age = Column(Float)
-    household_size = Column(Float)
-    metro_area = Column(String)  # MSA/CBSA code
-    stores_per_capita = Column(Float)  # Calculated: stores per 100K population
-    data_year = Column(Integer)
-    additional_data = Column(
-        JSON
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    population: Mapped[Optional[int]]
+    population_5yr_ago: Mapped[Optional[int]]  # For growth calculation
+    median_income: Mapped[Optional[float]]
+    growth_rate: Mapped[Optional[float]]  # Annual population growth rate
+    median_age: Mapped[Optional[float]]
+    household_size: Mapped[Optional[float]]
+    metro_area: Mapped[Optional[str]]  # MSA/CBSA code
+    stores_per_capita: Mapped[Optional[float]]  # Calculated: stores per 100K population
+    # Promoted out of additional_data: these are queried/sorted, so they live
+    # as real columns where the planner has statistics and indexes work
+    saturation_score: Mapped[Optional[float]] = mapped_column(
+        index=True
+    )  # 0-1, higher = more saturated
+    stores_per_sq_mile: Mapped[Optional[float]]
+    data_year: Mapped[Optional[int]]
+    additional_data: Mapped[Optional[dict]] = mapped_column(
+        JSONType
     )  # Additional demographic data (saturation scores, etc.)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class Parcel(Base):
     """Parcel/land data for site identification"""
 
     __tablename__ = "parcels"
+    # GIN over jsonb_path_ops supports containment predicates on the anchor
+    # distance blob without a full scan (PostgreSQL only).
+    __table_args__ = (
+        Index(
+            "ix_parcels_proximity_anchors",
+            "proximity_to_anchors",
+            postgresql_using="gin",
+            postgresql_ops={"proximity_to_anchors": "jsonb_path_ops"},
+        ),
+        Index("ix_parcels_state_city", "state", "city"),
+        # Trigram GIN for the chat path's ILIKE '%city%' filter (PostgreSQL only)
+        Index(
+            "ix_parcels_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    parcel_id = Column(String, unique=True, index=True)  # APN/PIN
-    address = Column(String)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    acreage = Column(Float, index=True)  # Filter 15-25 acres
-    current_zoning = Column(String)
-    owner_name = Column(String)
-    owner_type = Column(String)  # individual, LLC, corporation
-    assessed_value = Column(Float)
-    land_use_code = Column(String)
-    latitude = Column(Float, index=True)
-    longitude = Column(Float, index=True)
-    boundary_geojson = Column(JSON)  # Polygon coordinates
-    existing_uses = Column(JSON)  # List of current businesses
-    assemblage_score = Column(Float)  # Lower = easier to buy out
-    proximity_to_anchors = Column(JSON)  # Distances to Walmart, Kroger, etc.
-    retail_synergy_score = Column(Float)  # Number of anchors within 2 miles
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    parcel_id: Mapped[Optional[str]] = mapped_column(unique=True, index=True)  # APN/PIN
+    address: Mapped[Optional[str]]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    acreage: Mapped[Optional[float]] = mapped_column(index=True)  # Filter 15-25 acres
+    current_zoning: Mapped[Optional[str]]
+    owner_name: Mapped[Optional[str]]
+    owner_type: Mapped[Optional[str]]  # individual, LLC, corporation
+    assessed_value: Mapped[Optional[float]]
+    land_use_code: Mapped[Optional[str]]
+    latitude: Mapped[Optional[float]] = mapped_column(index=True)
+    longitude: Mapped[Optional[float]] = mapped_column(index=True)
+    # Spatial key, maintained on write
+    geohash6: Mapped[Optional[str]] = mapped_column(String(6), index=True)
+    boundary_geojson: Mapped[Optional[dict]] = mapped_column(
+        JSONType
+    )  # Polygon coordinates
+    existing_uses: Mapped[Optional[list]] = mapped_column(
+        JSONType
+    )  # List of current businesses
+    assemblage_score: Mapped[Optional[float]]  # Lower = easier to buy out
+    proximity_to_anchors: Mapped[Optional[dict]] = mapped_column(
+        JSONType
+    )  # Distances to Walmart, Kroger, etc.
+    retail_synergy_score: Mapped[Optional[float]]  # Number of anchors within 2 miles
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class ZoningRecord(Base):
     """Zoning/permitting records"""
 
     __tablename__ = "zoning_records"
-
-    id = Column(Integer, primary_key=True, index=True)
-    parcel_id = Column(String, index=True)
-    address = Column(String)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    latitude = Column(Float)
-    longitude = Column(Float)
-    acreage = Column(Float)  # Parcel size in acres
-    zoning_status = Column(String)  # pending, approved, denied
-    permit_type = Column(String)  # commercial, rezoning, etc.
-    description = Column(Text)  # Project description
-    record_date = Column(DateTime)
-    source_url = Column(String)
-    planning_commission_record_id = Column(
-        Integer, ForeignKey("planning_commission_records.id")
+    __table_args__ = (Index("ix_zoning_state_city", "state", "city"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    parcel_id: Mapped[Optional[str]] = mapped_column(index=True)
+    address: Mapped[Optional[str]]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    latitude: Mapped[Optional[float]]
+    longitude: Mapped[Optional[float]]
+    acreage: Mapped[Optional[float]]  # Parcel size in acres
+    zoning_status: Mapped[Optional[str]]  # pending, approved, denied
+    permit_type: Mapped[Optional[str]]  # commercial, rezoning, etc.
+    description: Mapped[Optional[str]] = mapped_column(Text)  # Project description
+    record_date: Mapped[Optional[datetime]]
+    source_url: Mapped[Optional[str]]
+    planning_commission_record_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("planning_commission_records.id")
+    )
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
     )
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class Prediction(Base):
     """Generated predictions for new store locations"""
 
     __tablename__ = "predictions"
+    # One index probe for the chat path's state filter plus city lookups
+    __table_args__ = (Index("ix_predictions_state_city", "state", "city"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    latitude: Mapped[Optional[float]]
+    longitude: Mapped[Optional[float]]
+    confidence_score: Mapped[float]  # 0.0 to 1.0
+    reasoning: Mapped[str] = mapped_column(Text)  # LLM-generated reasoning
+    predicted_store_size: Mapped[Optional[int]]  # Square feet
+    key_factors: Mapped[Optional[list]] = mapped_column(
+        JSONType
+    )  # List of key factors
+    analysis_run_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("analysis_runs.id")
+    )
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    latitude = Column(Float)
-    longitude = Column(Float)
-    confidence_score = Column(Float, nullable=False)  # 0.0 to 1.0
-    reasoning = Column(Text, nullable=False)  # LLM-generated reasoning
-    predicted_store_size = Column(Integer)  # Square feet
-    key_factors = Column(JSON)  # List of key factors
-    analysis_run_id = Column(Integer, ForeignKey("analysis_runs.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
-
-    analysis_run = relationship("AnalysisRun", back_populates="predictions")
+    analysis_run: Mapped[Optional["AnalysisRun"]] = relationship(
+        back_populates="predictions"
+    )
 
 
 class ZoningCode(Base):
@@ -160,23 +253,27 @@ class ZoningCode(Base):
 
     __tablename__ = "zoning_codes"
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    zone_code = Column(String)  # e.g., "C-2", "Commercial"
-    zone_name = Column(String)
-    permitted_uses = Column(JSON)  # List of allowed uses
-    setback_front = Column(Float)  # feet
-    setback_side = Column(Float)
-    setback_rear = Column(Float)
-    parking_spaces_per_1000sqft = Column(Float)
-    max_coverage = Column(Float)  # percentage
-    max_height = Column(Float)  # feet
-    source_url = Column(String)
-    raw_text = Column(Text)  # Original code text
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    zone_code: Mapped[Optional[str]]  # e.g., "C-2", "Commercial"
+    zone_name: Mapped[Optional[str]]
+    permitted_uses: Mapped[Optional[list]] = mapped_column(
+        JSONType
+    )  # List of allowed uses
+    setback_front: Mapped[Optional[float]]  # feet
+    setback_side: Mapped[Optional[float]]
+    setback_rear: Mapped[Optional[float]]
+    parking_spaces_per_1000sqft: Mapped[Optional[float]]
+    max_coverage: Mapped[Optional[float]]  # percentage
+    max_height: Mapped[Optional[float]]  # feet
+    source_url: Mapped[Optional[str]]
+    raw_text: Mapped[Optional[str]] = mapped_column(Text)  # Original code text
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class ImpactFee(Base):
@@ -184,18 +281,39 @@ class ImpactFee(Base):
 
     __tablename__ = "impact_fees"
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    fee_type = Column(String)  # utility, traffic, school, etc.
-    use_type = Column(String)  # commercial, retail, grocery, etc.
-    fee_per_sqft = Column(Float)
-    fee_methodology = Column(Text)  # How fee is calculated
-    source_url = Column(String)
-    effective_date = Column(DateTime)
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    fee_type: Mapped[Optional[str]]  # utility, traffic, school, etc.
+    use_type: Mapped[Optional[str]]  # commercial, retail, grocery, etc.
+    fee_per_sqft: Mapped[Optional[float]]
+    fee_methodology: Mapped[Optional[str]] = mapped_column(
+        Text
+    )  # How fee is calculated
+    source_url: Mapped[Optional[str]]
+    effective_date: Mapped[Optional[datetime]]
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class LLMBatch(Base):
+    """Submitted OpenAI Batch API jobs (so workers can resume after restart)"""
+
+    __tablename__ = "llm_batches"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    batch_id: Mapped[str] = mapped_column(unique=True, index=True)
+    kind: Mapped[str]  # zoning, impact_fees, etc.
+    status: Mapped[str]  # mirrors the OpenAI batch status
+    input_file_id: Mapped[Optional[str]]
+    output_file_id: Mapped[Optional[str]]
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class PlanningCommissionRecord(Base):
@@ -203,21 +321,25 @@ class PlanningCommissionRecord(Base):
 
     __tablename__ = "planning_commission_records"
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    meeting_date = Column(DateTime, index=True)
-    agenda_item = Column(String)
-    project_description = Column(Text)
-    parcel_address = Column(String)
-    application_status = Column(String)  # pending, approved, denied
-    project_type = Column(String)  # grocery, commercial, rezoning, etc.
-    square_feet = Column(Integer)  # If mentioned
-    source_url = Column(String)
-    raw_text = Column(Text)  # Original meeting minutes/agenda
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    meeting_date: Mapped[Optional[datetime]] = mapped_column(index=True)
+    agenda_item: Mapped[Optional[str]]
+    project_description: Mapped[Optional[str]] = mapped_column(Text)
+    parcel_address: Mapped[Optional[str]]
+    application_status: Mapped[Optional[str]]  # pending, approved, denied
+    project_type: Mapped[Optional[str]]  # grocery, commercial, rezoning, etc.
+    square_feet: Mapped[Optional[int]]  # If mentioned
+    source_url: Mapped[Optional[str]]
+    raw_text: Mapped[Optional[str]] = mapped_column(
+        Text
+    )  # Original meeting minutes/agenda
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class AnalysisRun(Base):
@@ -225,40 +347,55 @@ class AnalysisRun(Base):
 
     __tablename__ = "analysis_runs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    region = Column(String)  # State or region analyzed
-    status = Column(String, default="pending")  # pending, running, completed, failed
-    started_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime)
-    error_message = Column(Text)
-    additional_data = Column(JSON)
-
-    predictions = relationship("Prediction", back_populates="analysis_run")
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    region: Mapped[Optional[str]]  # State or region analyzed
+    status: Mapped[Optional[str]] = mapped_column(
+        default="pending"
+    )  # pending, running, completed, failed
+    started_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    completed_at: Mapped[Optional[datetime]]
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+
+    # Consumers of analysis runs always want their predictions; selectin loads
+    # them in one extra query per result set instead of one query per run
+    predictions: Mapped[List["Prediction"]] = relationship(
+        back_populates="analysis_run", lazy="selectin"
+    )
 
 
 class ShoppingCenter(Base):
     """Shopping centers and malls"""
 
     __tablename__ = "shopping_centers"
-
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    address = Column(String)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    zip_code = Column(String)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
-    place_id = Column(String, unique=True, index=True)  # Google Places ID
-    rating = Column(Float)
-    user_rating_count = Column(Integer)
-    square_feet = Column(Integer)  # Estimated or actual
-    occupancy_rate = Column(Float)  # 0.0 to 1.0
-    anchor_tenants = Column(JSON)  # List of anchor tenant names
-    co_tenancy_score = Column(Float)  # Calculated score
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    __table_args__ = (Index("ix_shopping_centers_state_city", "state", "city"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str]
+    address: Mapped[Optional[str]]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    zip_code: Mapped[Optional[str]]
+    latitude: Mapped[float]
+    longitude: Mapped[float]
+    # Spatial key, maintained on write
+    geohash6: Mapped[Optional[str]] = mapped_column(String(6), index=True)
+    place_id: Mapped[Optional[str]] = mapped_column(
+        unique=True, index=True
+    )  # Google Places ID
+    rating: Mapped[Optional[float]]
+    user_rating_count: Mapped[Optional[int]]
+    square_feet: Mapped[Optional[int]]  # Estimated or actual
+    occupancy_rate: Mapped[Optional[float]]  # 0.0 to 1.0
+    anchor_tenants: Mapped[Optional[list]] = mapped_column(
+        JSONType
+    )  # List of anchor tenant names
+    co_tenancy_score: Mapped[Optional[float]]  # Calculated score
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class TrafficData(Base):
@@ -266,23 +403,27 @@ class TrafficData(Base):
 
     __tablename__ = "traffic_data"
 
-    id = Column(Integer, primary_key=True, index=True)
-    location_id = Column(String, index=True)  # Reference to store/parcel
-    location_type = Column(String)  # store, parcel, intersection
-    road_name = Column(String)
-    city = Column(String, index=True)
-    state = Column(String, index=True)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
-    average_daily_traffic = Column(Integer)  # ADT
-    peak_hour_volume = Column(Integer)
-    traffic_growth_rate = Column(Float)  # Annual growth
-    accessibility_score = Column(Float)  # 0.0 to 1.0
-    data_year = Column(Integer)
-    source = Column(String)  # API source
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    location_id: Mapped[Optional[str]] = mapped_column(
+        index=True
+    )  # Reference to store/parcel
+    location_type: Mapped[Optional[str]]  # store, parcel, intersection
+    road_name: Mapped[Optional[str]]
+    city: Mapped[Optional[str]] = mapped_column(index=True)
+    state: Mapped[Optional[str]] = mapped_column(index=True)
+    latitude: Mapped[float]
+    longitude: Mapped[float]
+    average_daily_traffic: Mapped[Optional[int]]  # ADT
+    peak_hour_volume: Mapped[Optional[int]]
+    traffic_growth_rate: Mapped[Optional[float]]  # Annual growth
+    accessibility_score: Mapped[Optional[float]]  # 0.0 to 1.0
+    data_year: Mapped[Optional[int]]
+    source: Mapped[Optional[str]]  # API source
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class NewsArticle(Base):
@@ -290,22 +431,24 @@ class NewsArticle(Base):
 
     __tablename__ = "news_articles"
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
-    content = Column(Text)
-    source = Column(String)  # News source name
-    url = Column(String, unique=True, index=True)
-    published_date = Column(DateTime, index=True)
-    city = Column(String, index=True)
-    state = Column(String, index=True)
-    topic = Column(String)  # expansion, opening, closure, etc.
-    sentiment = Column(String)  # positive, negative, neutral
-    mentions_publix = Column(Boolean, default=False)
-    mentions_competitor = Column(String)  # Competitor name if mentioned
-    relevance_score = Column(Float)  # 0.0 to 1.0
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    title: Mapped[str]
+    content: Mapped[Optional[str]] = mapped_column(Text)
+    source: Mapped[Optional[str]]  # News source name
+    url: Mapped[Optional[str]] = mapped_column(unique=True, index=True)
+    published_date: Mapped[Optional[datetime]] = mapped_column(index=True)
+    city: Mapped[Optional[str]] = mapped_column(index=True)
+    state: Mapped[Optional[str]] = mapped_column(index=True)
+    topic: Mapped[Optional[str]]  # expansion, opening, closure, etc.
+    sentiment: Mapped[Optional[str]]  # positive, negative, neutral
+    mentions_publix: Mapped[Optional[bool]] = mapped_column(default=False)
+    mentions_competitor: Mapped[Optional[str]]  # Competitor name if mentioned
+    relevance_score: Mapped[Optional[float]]  # 0.0 to 1.0
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class EconomicIndicator(Base):
@@ -313,23 +456,25 @@ class EconomicIndicator(Base):
 
     __tablename__ = "economic_indicators"
 
-    id = Column(Integer, primary_key=True, index=True)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    county = Column(String, index=True)
-    unemployment_rate = Column(Float)
-    employment_growth_rate = Column(Float)  # Annual growth
-    average_wage = Column(Float)
-    median_wage = Column(Float)
-    retail_sales_per_capita = Column(Float)
-    business_establishments = Column(Integer)
-    new_business_formations = Column(Integer)
-    gdp_per_capita = Column(Float)
-    data_year = Column(Integer)
-    source = Column(String)  # BLS, FRED, Census, etc.
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    county: Mapped[Optional[str]] = mapped_column(index=True)
+    unemployment_rate: Mapped[Optional[float]]
+    employment_growth_rate: Mapped[Optional[float]]  # Annual growth
+    average_wage: Mapped[Optional[float]]
+    median_wage: Mapped[Optional[float]]
+    retail_sales_per_capita: Mapped[Optional[float]]
+    business_establishments: Mapped[Optional[int]]
+    new_business_formations: Mapped[Optional[int]]
+    gdp_per_capita: Mapped[Optional[float]]
+    data_year: Mapped[Optional[int]]
+    source: Mapped[Optional[str]]  # BLS, FRED, Census, etc.
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class DevelopmentProject(Base):
@@ -337,21 +482,38 @@ class DevelopmentProject(Base):
 
     __tablename__ = "development_projects"
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_name = Column(String)
-    address = Column(String)
-    city = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    latitude = Column(Float)
-    longitude = Column(Float)
-    project_type = Column(String)  # residential, commercial, mixed-use
-    square_feet = Column(Integer)
-    estimated_cost = Column(Float)
-    start_date = Column(DateTime)
-    completion_date = Column(DateTime)
-    status = Column(String)  # planned, under_construction, completed
-    developer_name = Column(String)
-    source_url = Column(String)
-    additional_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    project_name: Mapped[Optional[str]]
+    address: Mapped[Optional[str]]
+    city: Mapped[str] = mapped_column(index=True)
+    state: Mapped[str] = mapped_column(index=True)
+    latitude: Mapped[Optional[float]]
+    longitude: Mapped[Optional[float]]
+    project_type: Mapped[Optional[str]]  # residential, commercial, mixed-use
+    square_feet: Mapped[Optional[int]]
+    estimated_cost: Mapped[Optional[float]]
+    start_date: Mapped[Optional[datetime]]
+    completion_date: Mapped[Optional[datetime]]
+    status: Mapped[Optional[str]]  # planned, under_construction, completed
+    developer_name: Mapped[Optional[str]]
+    source_url: Mapped[Optional[str]]
+    additional_data: Mapped[Optional[dict]] = mapped_column(JSONType)
+    created_at: Mapped[Optional[datetime]] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+def _set_geohash(mapper, connection, target):
+    """Keep the geohash6 spatial key in sync with latitude/longitude"""
+    if target.latitude is not None and target.longitude is not None:
+        target.geohash6 = pygeohash.encode(
+            target.latitude, target.longitude, precision=GEOHASH_PRECISION
+        )
+    else:
+        target.geohash6 = None
+
+
+for _model in (PublixStore, CompetitorStore, Parcel, ShoppingCenter):
+    event.listen(_model, "before_insert", _set_geohash)
+    event.listen(_model, "before_update", _set_geohash)
@@ -0,0 +1,34 @@
+"""
+Shared HTTP session for synchronous scraping/fetching services
+
+One pooled requests.Session with retry-on-transient-status so callers
+reuse keepalive TCP/TLS connections across calls and survive 429/5xx
+blips instead of silently losing a page of results.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def make_session() -> requests.Session:
+    """Build a pooled session retrying transient failures.
+
+    Retries are limited to idempotent methods; Retry-After headers from
+    rate-limiting responses are honored.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = make_session()
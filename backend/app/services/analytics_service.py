@@ -5,17 +5,71 @@ Analytics service for calculating store density, market saturation, and expansio
 import logging
 from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, bindparam, case, func, or_, select, update
+from app.models.schemas import PublixStore, CompetitorStore, Demographics, Prediction
 import math
+import time
+import numpy as np
+import pygeohash
 
 logger = logging.getLogger(__name__)
 
+# Precompiled per-city statements. Explicit bindparams keep the compiled SQL
+# string identical across calls, so every execution hits SQLAlchemy's
+# statement cache instead of re-compiling.
+_DEMO_LOOKUP_STMT = (
+    select(Demographics)
+    .where(
+        Demographics.city == bindparam("city"),
+        Demographics.state == bindparam("state"),
+    )
+    .limit(1)
+)
+
+_PUBLIX_COUNT_STMT = (
+    select(func.count())
+    .select_from(PublixStore)
+    .where(
+        PublixStore.city == bindparam("city"),
+        PublixStore.state == bindparam("state"),
+    )
+)
+
+# Both competitor counts in one scan of the (state, city, competitor_name)
+# index via conditional aggregation, instead of one COUNT round-trip per chain
+_COMPETITOR_COUNTS_STMT = select(
+    func.sum(case((CompetitorStore.competitor_name == "Walmart", 1), else_=0)).label(
+        "walmart_count"
+    ),
+    func.sum(case((CompetitorStore.competitor_name == "Kroger", 1), else_=0)).label(
+        "kroger_count"
+    ),
+).where(
+    CompetitorStore.city == bindparam("city"),
+    CompetitorStore.state == bindparam("state"),
+)
+
+# Approximate minimum cell dimension in miles per geohash precision; used to
+# pick the coarsest prefix whose 3x3 neighborhood still covers a search radius
+_GEOHASH_CELL_MILES = {1: 3100.0, 2: 388.0, 3: 97.0, 4: 12.1, 5: 3.0, 6: 0.38}
+
+# Cross-request cache for per-city density metrics. Entries expire after a
+# short TTL and are evicted explicitly when update_demographics_metrics
+# rewrites a city's numbers.
+_DENSITY_CACHE_TTL = 60.0  # seconds
+_density_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+
 
 class AnalyticsService:
     """Service for calculating store analytics and market metrics"""
 
     def __init__(self, db: Session):
         self.db = db
+        # Competitor coordinate arrays (including pre-radianized forms) keyed
+        # by geohash neighborhood, loaded once per service instance so
+        # repeated distance queries near the same point skip both the DB
+        # fetch and the radians/cos conversions
+        self._comp_cache: Dict[Tuple[str, ...], Tuple[np.ndarray, ...]] = {}
 
     def calculate_store_density(self, city: str, state: str) -> Optional[Dict]:
         """
@@ -28,39 +82,47 @@ class AnalyticsService:
         Returns:
             Dictionary with density metrics
         """
-        from app.models.schemas import PublixStore, CompetitorStore, Demographics
+        cache_key = (city, state)
+        cached = _density_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _DENSITY_CACHE_TTL:
+            return cached[1]
+
+        params = {"city": city, "state": state}
 
         # Get demographics
-        demo = self.db.query(Demographics).filter_by(city=city, state=state).first()
+        demo = self.db.execute(_DEMO_LOOKUP_STMT, params).scalars().first()
         if not demo or not demo.population:
             logger.warning(f"No demographics data for {city}, {state}")
             return None
 
         # Count Publix stores in city
-        publix_count = (
-            self.db.query(PublixStore).filter_by(city=city, state=state).count()
-        )
+        publix_count = self.db.execute(_PUBLIX_COUNT_STMT, params).scalar()
 
-        # Count competitor stores
-        walmart_count = (
-            self.db.query(CompetitorStore)
-            .filter_by(city=city, state=state, competitor_name="Walmart")
-            .count()
-        )
-        kroger_count = (
-            self.db.query(CompetitorStore)
-            .filter_by(city=city, state=state, competitor_name="Kroger")
-            .count()
+        # Count competitor stores (SUM over no rows is NULL, hence the "or 0")
+        competitor_counts = self.db.execute(_COMPETITOR_COUNTS_STMT, params).one()
+
+        metrics = self._density_from_counts(
+            demo.population,
+            publix_count,
+            competitor_counts.walmart_count or 0,
+            competitor_counts.kroger_count or 0,
         )
+        _density_cache[cache_key] = (time.monotonic(), metrics)
+        return metrics
 
+    @staticmethod
+    def _density_from_counts(
+        population: int, publix_count: int, walmart_count: int, kroger_count: int
+    ) -> Dict:
+        """Compute density/saturation metrics from raw counts (pure Python, no DB)"""
         # Calculate stores per 100K population
         stores_per_100k = (
-            (publix_count / demo.population * 100000) if demo.population > 0 else 0
+            (publix_count / population * 100000) if population > 0 else 0
         )
 
         # Calculate stores per square mile (rough estimate using city area)
         # Using average city density: ~3,000 people per square mile for typical US city
-        estimated_sq_miles = demo.population / 3000 if demo.population > 0 else 0
+        estimated_sq_miles = population / 3000 if population > 0 else 0
         stores_per_sq_mile = (
             publix_count / estimated_sq_miles if estimated_sq_miles > 0 else 0
         )
@@ -71,7 +133,7 @@ class AnalyticsService:
         baseline_stores_per_100k = 2.0  # Baseline for "mature" market
         saturation_score = min(stores_per_100k / baseline_stores_per_100k, 1.0)
 
-        metrics = {
+        return {
             "publix_stores": publix_count,
             "walmart_stores": walmart_count,
             "kroger_stores": kroger_count,
@@ -79,13 +141,107 @@ class AnalyticsService:
             "stores_per_100k": round(stores_per_100k, 2),
             "stores_per_sq_mile": round(stores_per_sq_mile, 4),
             "saturation_score": round(saturation_score, 3),
-            "population": demo.population,
+            "population": population,
         }
 
-        return metrics
+    @staticmethod
+    def _store_count_subqueries(state: str):
+        """Per-city store count subqueries shared by the bulk analytics"""
+        publix_sq = (
+            select(
+                PublixStore.city,
+                PublixStore.state,
+                func.count().label("publix_count"),
+            )
+            .where(PublixStore.state == state)
+            .group_by(PublixStore.city, PublixStore.state)
+            .subquery()
+        )
+        competitor_sq = (
+            select(
+                CompetitorStore.city,
+                CompetitorStore.state,
+                func.sum(
+                    case((CompetitorStore.competitor_name == "Walmart", 1), else_=0)
+                ).label("walmart_count"),
+                func.sum(
+                    case((CompetitorStore.competitor_name == "Kroger", 1), else_=0)
+                ).label("kroger_count"),
+            )
+            .where(CompetitorStore.state == state)
+            .group_by(CompetitorStore.city, CompetitorStore.state)
+            .subquery()
+        )
+        return publix_sq, competitor_sq
+
+    def _density_bulk(self, state: str) -> List[Dict]:
+        """
+        Fetch per-city population and store counts for a whole state in one query
+
+        Replaces the per-city pattern (one Demographics lookup + three COUNTs
+        per city, O(4N) round-trips) with a single GROUP BY statement joining
+        pre-aggregated store counts against Demographics.
+
+        Returns:
+            List of dicts with city, state, population and density metrics
+        """
+        publix_sq, competitor_sq = self._store_count_subqueries(state)
+
+        stmt = (
+            select(
+                Demographics.city,
+                Demographics.state,
+                Demographics.population,
+                func.coalesce(publix_sq.c.publix_count, 0).label("publix_count"),
+                func.coalesce(competitor_sq.c.walmart_count, 0).label("walmart_count"),
+                func.coalesce(competitor_sq.c.kroger_count, 0).label("kroger_count"),
+            )
+            .outerjoin(
+                publix_sq,
+                and_(
+                    publix_sq.c.city == Demographics.city,
+                    publix_sq.c.state == Demographics.state,
+                ),
+            )
+            .outerjoin(
+                competitor_sq,
+                and_(
+                    competitor_sq.c.city == Demographics.city,
+                    competitor_sq.c.state == Demographics.state,
+                ),
+            )
+            .where(Demographics.state == state)
+        )
+
+        # Stream in batches over a server-side cursor (PostgreSQL) so a big
+        # state never materializes client-side all at once
+        stream = self.db.execute(
+            stmt.execution_options(stream_results=True, yield_per=1000)
+        )
+
+        results = []
+        for row in stream.mappings():
+            if not row["population"]:
+                continue
+            metrics = self._density_from_counts(
+                row["population"],
+                row["publix_count"],
+                row["walmart_count"],
+                row["kroger_count"],
+            )
+            metrics["city"] = row["city"]
+            metrics["state"] = row["state"]
+            results.append(metrics)
+
+        return results
 
     def calculate_nearest_competitor_distance(
-        self, latitude: float, longitude: float, city: str, state: str
+        self,
+        latitude: float,
+        longitude: float,
+        city: str,
+        state: str,
+        max_radius_miles: float = 50.0,
     ) -> Optional[Dict]:
         """
         Calculate distance to nearest competitor stores
@@ -93,32 +249,115 @@ class AnalyticsService:
         Args:
             latitude: Store latitude
             longitude: Store longitude
-            city: City name
-            state: State abbreviation
+            city: City name (unused; matching is purely spatial)
+            state: State abbreviation (unused; the geohash key crosses state
+                lines, so competitors just over a border are found too)
+            max_radius_miles: Only consider competitors within this radius
 
         Returns:
             Dictionary with distances to nearest competitors
         """
-        from app.models.schemas import CompetitorStore
+        # Coarse prefilter: an indexed prefix match on the geohash key pulls
+        # only the 3x3 cell neighborhood around the query point instead of
+        # scanning every competitor row
+        cells = self._geohash_cells(latitude, longitude, max_radius_miles)
+        names, lats, lons, lat_rad, cos_lat, lon_rad = self._competitor_arrays(cells)
+        if names.size == 0:
+            return None
 
-        # Get all competitor stores in the state
-        competitors = self.db.query(CompetitorStore).filter_by(state=state).all()
+        # The query point's radians/cosine are loop invariants: compute once
+        lat1_rad = math.radians(latitude)
+        cos_lat1 = math.cos(lat1_rad)
+        lon1_rad = math.radians(longitude)
+
+        # Cheap bounding-box prefilter: trig distance can't use an index (or
+        # vectorize cheaply), but a degree-box comparison prunes most rows
+        # before the Haversine evaluation. 1 degree latitude ~= 69 miles.
+        dlat_deg = max_radius_miles / 69.0
+        dlon_deg = max_radius_miles / (69.0 * max(cos_lat1, 0.01))
+        box = (
+            (lats >= latitude - dlat_deg)
+            & (lats <= latitude + dlat_deg)
+            & (lons >= longitude - dlon_deg)
+            & (lons <= longitude + dlon_deg)
+        )
+        names = names[box]
+        if names.size == 0:
+            return None
 
-        if not competitors:
+        # Vectorized Haversine on the pre-radianized arrays: only the deltas
+        # and sines are computed per call
+        dlat = lat_rad[box] - lat1_rad
+        dlon = lon_rad[box] - lon1_rad
+        a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat[box] * np.sin(dlon / 2) ** 2
+        dist = 2 * 3959 * np.arcsin(np.sqrt(a))
+
+        # The box is a superset of the circle; trim the corners
+        in_radius = dist <= max_radius_miles
+        names, dist = names[in_radius], dist[in_radius]
+        if names.size == 0:
             return None
 
-        distances = {}
-        for competitor in competitors:
-            if competitor.latitude and competitor.longitude:
-                distance = self._haversine_distance(
-                    latitude, longitude, competitor.latitude, competitor.longitude
-                )
-                comp_name = competitor.competitor_name
+        return {
+            str(name): round(float(dist[names == name].min()), 2)
+            for name in np.unique(names)
+        }
 
-                if comp_name not in distances or distance < distances[comp_name]:
-                    distances[comp_name] = round(distance, 2)
+    @staticmethod
+    def _geohash_cells(
+        latitude: float, longitude: float, radius_miles: float
+    ) -> Tuple[str, ...]:
+        """Geohash prefixes whose 3x3 neighborhood covers the search circle"""
+        precision = 1
+        for p in sorted(_GEOHASH_CELL_MILES):
+            if _GEOHASH_CELL_MILES[p] >= radius_miles:
+                precision = p
+        center = pygeohash.encode(latitude, longitude, precision=precision)
+        top = pygeohash.get_adjacent(center, "top")
+        bottom = pygeohash.get_adjacent(center, "bottom")
+        return tuple(
+            sorted(
+                pygeohash.get_adjacent(cell, side)
+                for cell in (center, top, bottom)
+                for side in ("left", "right")
+            )
+            + sorted((center, top, bottom))
+        )
 
-        return distances
+    def _competitor_arrays(self, cells: Tuple[str, ...]) -> Tuple[np.ndarray, ...]:
+        """Load competitor arrays for a geohash neighborhood, cached with
+        radians precomputed
+
+        Returns:
+            (names, latitudes, longitudes, lat_radians, cos_lat, lon_radians)
+        """
+        cached = self._comp_cache.get(cells)
+        if cached is None:
+            rows = [
+                row
+                for row in self.db.query(
+                    CompetitorStore.competitor_name,
+                    CompetitorStore.latitude,
+                    CompetitorStore.longitude,
+                )
+                .filter(
+                    or_(
+                        *[
+                            CompetitorStore.geohash6.like(cell + "%")
+                            for cell in cells
+                        ]
+                    )
+                )
+                .all()
+                if row[1] is not None and row[2] is not None
+            ]
+            names = np.array([row[0] for row in rows], dtype=object)
+            lats = np.array([row[1] for row in rows], dtype=np.float64)
+            lons = np.array([row[2] for row in rows], dtype=np.float64)
+            lat_rad = np.radians(lats)
+            cached = (names, lats, lons, lat_rad, np.cos(lat_rad), np.radians(lons))
+            self._comp_cache[cells] = cached
+        return cached
 
     def calculate_market_saturation_by_state(self, state: str) -> Dict:
         """
@@ -130,72 +369,111 @@ class AnalyticsService:
         Returns:
             Dictionary with saturation metrics by city
         """
-        from app.models.schemas import Demographics
-
-        cities = self.db.query(Demographics).filter_by(state=state).all()
-        results = {}
-
-        for demo in cities:
-            metrics = self.calculate_store_density(demo.city, demo.state)
-            if metrics:
-                results[demo.city] = metrics
-
-        return results
+        return {metrics["city"]: metrics for metrics in self._density_bulk(state)}
 
     def identify_expansion_opportunities(
-        self, state: str, min_population: int = 50000
+        self, state: str, min_population: int = 50000, limit: Optional[int] = 20
     ) -> List[Dict]:
         """
         Identify cities with expansion opportunities based on low saturation
 
+        The saturation and opportunity scores are computed in SQL so the
+        database sorts and (optionally) limits to the top-k rows; only the
+        winners cross the wire.
+
         Args:
             state: State abbreviation
             min_population: Minimum population to consider
+            limit: Return only the top-k opportunities (None for all)
 
         Returns:
             List of cities ranked by expansion opportunity
         """
-        from app.models.schemas import Demographics
+        publix_sq, _ = self._store_count_subqueries(state)
+        publix_count = func.coalesce(publix_sq.c.publix_count, 0)
 
-        cities = (
-            self.db.query(Demographics)
-            .filter_by(state=state)
-            .filter(Demographics.population >= min_population)
-            .all()
+        # Mirrors _density_from_counts: saturation = min(per-100k / 2.0, 1.0),
+        # expressed with CASE so it works on any backend
+        stores_per_100k = (
+            publix_count * 100000.0 / func.nullif(Demographics.population, 0)
+        )
+        saturation = case(
+            (stores_per_100k >= 2.0, 1.0), else_=stores_per_100k / 2.0
+        )
+        population_weight = case(
+            (Demographics.population >= 100000, 1.0),
+            else_=Demographics.population / 100000.0,
         )
+        opportunity = (1.0 - saturation) * 0.7 + population_weight * 0.3
+
+        stmt = (
+            select(
+                Demographics.city,
+                Demographics.state,
+                Demographics.population,
+                publix_count.label("publix_stores"),
+                stores_per_100k.label("stores_per_100k"),
+                saturation.label("saturation_score"),
+                opportunity.label("opportunity_score"),
+            )
+            .outerjoin(
+                publix_sq,
+                and_(
+                    publix_sq.c.city == Demographics.city,
+                    publix_sq.c.state == Demographics.state,
+                ),
+            )
+            .where(
+                Demographics.state == state,
+                Demographics.population >= min_population,
+            )
+            .order_by(opportunity.desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-        opportunities = []
-        for demo in cities:
-            metrics = self.calculate_store_density(demo.city, demo.state)
-            if not metrics:
-                continue
+        return [
+            {
+                "city": row["city"],
+                "state": row["state"],
+                "population": row["population"],
+                "publix_stores": row["publix_stores"],
+                "stores_per_100k": round(row["stores_per_100k"], 2),
+                "saturation_score": round(row["saturation_score"], 3),
+                "opportunity_score": round(row["opportunity_score"], 3),
+            }
+            for row in self.db.execute(stmt).mappings()
+        ]
 
-            # Calculate opportunity score (inverse of saturation)
-            opportunity_score = 1.0 - metrics["saturation_score"]
+    def save_predictions(self, run_id: Optional[int], predictions: List[Dict]) -> int:
+        """
+        Insert a batch of predictions for an analysis run
 
-            # Weight by population (larger cities = higher priority)
-            population_weight = (
-                min(demo.population / 100000, 1.0) if demo.population else 0
-            )
+        bulk_insert_mappings emits one executemany and skips per-instance
+        state tracking, which matters for wide JSON-bearing rows like
+        Prediction.key_factors.
 
-            # Combined score
-            combined_score = opportunity_score * 0.7 + population_weight * 0.3
-
-            opportunities.append(
-                {
-                    "city": demo.city,
-                    "state": demo.state,
-                    "population": demo.population,
-                    "publix_stores": metrics["publix_stores"],
-                    "stores_per_100k": metrics["stores_per_100k"],
-                    "saturation_score": metrics["saturation_score"],
-                    "opportunity_score": round(combined_score, 3),
-                }
-            )
+        Args:
+            run_id: AnalysisRun id the predictions belong to (or None)
+            predictions: List of dicts of Prediction column values
 
-        # Sort by opportunity score (highest first)
-        opportunities.sort(key=lambda x: x["opportunity_score"], reverse=True)
-        return opportunities
+        Returns:
+            Number of rows inserted
+        """
+        if not predictions:
+            return 0
+
+        try:
+            self.db.bulk_insert_mappings(
+                Prediction,
+                [{"analysis_run_id": run_id, **pred} for pred in predictions],
+            )
+            self.db.commit()
+            return len(predictions)
+        except Exception as e:
+            logger.error(f"Failed to save predictions: {e}")
+            self.db.rollback()
+            return 0
 
     def _haversine_distance(
         self, lat1: float, lon1: float, lat2: float, lon2: float
@@ -232,39 +510,99 @@ class AnalyticsService:
         Returns:
             True if updated successfully
         """
-        from app.models.schemas import Demographics
-
-        demo = self.db.query(Demographics).filter_by(city=city, state=state).first()
-        if not demo:
+        row = self.db.execute(
+            select(Demographics.id, Demographics.additional_data)
+            .where(Demographics.city == city, Demographics.state == state)
+            .limit(1)
+        ).first()
+        if not row:
             return False
 
         metrics = self.calculate_store_density(city, state)
         if not metrics:
             return False
 
-        # Update stores_per_capita
-        demo.stores_per_capita = metrics["stores_per_100k"]
-
-        # Update additional_data with saturation metrics
-        if not demo.additional_data:
-            demo.additional_data = {}
-
-        demo.additional_data.update(
-            {
-                "saturation_score": metrics["saturation_score"],
-                "stores_per_sq_mile": metrics["stores_per_sq_mile"],
-                "competitor_stores": {
-                    "walmart": metrics["walmart_stores"],
-                    "kroger": metrics["kroger_stores"],
-                },
-            }
-        )
+        # Only non-queried detail stays in the JSON blob
+        additional = dict(row.additional_data or {})
+        additional["competitor_stores"] = {
+            "walmart": metrics["walmart_stores"],
+            "kroger": metrics["kroger_stores"],
+        }
 
         try:
+            # Direct UPDATE: no ORM instance, no dirty-tracking flush — just
+            # the exact single-row statement
+            self.db.execute(
+                update(Demographics)
+                .where(Demographics.id == row.id)
+                .values(
+                    stores_per_capita=metrics["stores_per_100k"],
+                    saturation_score=metrics["saturation_score"],
+                    stores_per_sq_mile=metrics["stores_per_sq_mile"],
+                    additional_data=additional,
+                )
+            )
             self.db.commit()
+            _density_cache.pop((city, state), None)
             logger.info(f"Updated metrics for {city}, {state}")
             return True
         except Exception as e:
             logger.error(f"Failed to update metrics: {e}")
             self.db.rollback()
             return False
+
+    def update_demographics_metrics_bulk(self, state: str) -> int:
+        """
+        Update metrics for every city in a state with a single commit
+
+        Uses the one-query _density_bulk aggregation and commits once at the
+        end, instead of one commit (and WAL flush) per city.
+
+        Args:
+            state: State abbreviation
+
+        Returns:
+            Number of demographics rows updated
+        """
+        metrics_by_city = {m["city"]: m for m in self._density_bulk(state)}
+        if not metrics_by_city:
+            return 0
+
+        # yield_per keeps only a batch of ORM instances in memory at a time
+        # instead of loading the whole state into the identity map
+        demos = self.db.execute(
+            select(Demographics)
+            .where(Demographics.state == state)
+            .execution_options(stream_results=True, yield_per=1000)
+        ).scalars()
+        updated = []
+        for demo in demos:
+            metrics = metrics_by_city.get(demo.city)
+            if not metrics:
+                continue
+
+            demo.stores_per_capita = metrics["stores_per_100k"]
+            demo.saturation_score = metrics["saturation_score"]
+            demo.stores_per_sq_mile = metrics["stores_per_sq_mile"]
+
+            # Reassign (not mutate) so the JSON column is flagged dirty
+            additional = dict(demo.additional_data or {})
+            additional["competitor_stores"] = {
+                "walmart": metrics["walmart_stores"],
+                "kroger": metrics["kroger_stores"],
+            }
+            demo.additional_data = additional
+            updated.append(demo.city)
+
+        try:
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Failed to bulk-update metrics for {state}: {e}")
+            self.db.rollback()
+            return 0
+
+        for city in updated:
+            _density_cache.pop((city, state), None)
+
+        logger.info(f"Updated metrics for {len(updated)} cities in {state}")
+        return len(updated)
@@ -7,143 +7,631 @@ Uses US Census Bureau APIs:
 - Geographic Areas API for metro definitions
 """
 
+import asyncio
+import functools
 import os
+import httpx
 import requests
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timedelta
 import time
 
+from cachetools import TLRUCache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional persistence tier
+    requests_cache = None
+
+# ijson lets the state-wide place tables stream off the socket one row at a
+# time instead of materializing the whole list-of-lists
+try:
+    import ijson
+
+    _PLACE_PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:  # pragma: no cover - falls back to a full in-memory parse
+    ijson = None
+    _PLACE_PARSE_ERRORS = (ValueError,)
+
+# HTTP/2 lets the async client multiplex every in-flight Census request over
+# one connection; it needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - falls back to pooled HTTP/1.1
+    _HTTP2 = False
+
+# orjson decodes the large list-of-lists Census payloads 2-3x faster than
+# stdlib json; both raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
 
+def _cache_ttu(key, value, now):
+    """Per-endpoint expiry for the response cache
+
+    ACS five-year tables are immutable per vintage, so they can live for
+    months; everything else (PEP etc.) refreshes weekly.
+    """
+    endpoint = key[0]
+    ttl = 90 * 86400 if "/acs/acs5" in endpoint else 7 * 86400
+    return now + ttl
+
+
+# Shared pool for overlapping independent Census calls; sized to actually
+# exercise the session's connection pool. The token bucket still bounds the
+# aggregate request rate across workers.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="census")
+
+
+# FIPS lookup tables, built once at import time instead of on every call
+_STATE_FIPS_MAP = {
+    "AL": "01",
+    "AK": "02",
+    "AZ": "04",
+    "AR": "05",
+    "CA": "06",
+    "CO": "08",
+    "CT": "09",
+    "DE": "10",
+    "FL": "12",
+    "GA": "13",
+    "HI": "15",
+    "ID": "16",
+    "IL": "17",
+    "IN": "18",
+    "IA": "19",
+    "KS": "20",
+    "KY": "21",
+    "LA": "22",
+    "ME": "23",
+    "MD": "24",
+    "MA": "25",
+    "MI": "26",
+    "MN": "27",
+    "MS": "28",
+    "MO": "29",
+    "MT": "30",
+    "NE": "31",
+    "NV": "32",
+    "NH": "33",
+    "NJ": "34",
+    "NM": "35",
+    "NY": "36",
+    "NC": "37",
+    "ND": "38",
+    "OH": "39",
+    "OK": "40",
+    "OR": "41",
+    "PA": "42",
+    "RI": "43",
+    "SC": "45",
+    "SD": "46",
+    "TN": "47",
+    "TX": "48",
+    "UT": "49",
+    "VT": "50",
+    "VA": "51",
+    "WA": "53",
+    "WV": "54",
+    "WI": "55",
+    "WY": "56",
+    "DC": "11",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _state_fips(state: str) -> Optional[str]:
+    """State abbreviation -> FIPS, cached so hot loops skip the .upper() call"""
+    return _STATE_FIPS_MAP.get(state.upper())
+
+
+_CITY_FIPS_MAP = {
+    # Florida
+    ("Miami", "FL"): "1245000",
+    ("Tampa", "FL"): "1271000",
+    ("Orlando", "FL"): "1253000",
+    ("Jacksonville", "FL"): "1235000",
+    ("Lakeland", "FL"): "1238250",
+    ("Kissimmee", "FL"): "1236975",
+    ("Clearwater", "FL"): "1212875",
+    ("St. Petersburg", "FL"): "1263000",
+    ("Tallahassee", "FL"): "1270750",
+    ("Gainesville", "FL"): "1225875",
+    ("Pensacola", "FL"): "1255900",
+    ("Sarasota", "FL"): "1264175",
+    ("Naples", "FL"): "1247650",
+    ("Fort Myers", "FL"): "1224175",
+    ("West Palm Beach", "FL"): "1276675",
+    # Kentucky
+    ("Lexington", "KY"): "2146042",
+    ("Louisville", "KY"): "2148000",
+    ("Owensboro", "KY"): "2158624",
+    ("Bowling Green", "KY"): "2108992",
+    ("Covington", "KY"): "2117854",
+    ("Hopkinsville", "KY"): "2137852",
+    ("Richmond", "KY"): "2165202",
+    ("Florence", "KY"): "2127982",
+    ("Georgetown", "KY"): "2130700",
+    ("Henderson", "KY"): "2135896",
+    ("Elizabethtown", "KY"): "2124298",
+    ("Paducah", "KY"): "2158836",
+    ("Radcliff", "KY"): "2159364",
+    ("Ashland", "KY"): "2102206",
+    ("Madisonville", "KY"): "2149290",
+    ("Somerset", "KY"): "2161446",
+    ("Danville", "KY"): "2119890",
+    ("Fort Thomas", "KY"): "2128580",
+    ("Shively", "KY"): "2160306",
+    ("Newport", "KY"): "2155830",
+    ("St. Matthews", "KY"): "2160012",
+    ("Walton", "KY"): "2180524",
+    ("Erlanger", "KY"): "2125282",
+    ("Jeffersontown", "KY"): "2139988",
+    # Georgia
+    ("Atlanta", "GA"): "1304000",
+    ("Savannah", "GA"): "1369000",
+    ("Augusta", "GA"): "1304000",
+    ("Columbus", "GA"): "1319000",
+    ("Athens", "GA"): "1303456",
+    ("Sandy Springs", "GA"): "1368496",
+    ("Roswell", "GA"): "1367000",
+    ("Macon", "GA"): "1349000",
+    ("Johns Creek", "GA"): "1342424",
+    ("Albany", "GA"): "1301056",
+    ("Warner Robins", "GA"): "1380704",
+    ("Alpharetta", "GA"): "1301644",
+    ("Marietta", "GA"): "1349796",
+    ("Valdosta", "GA"): "1379000",
+    ("Smyrna", "GA"): "1371600",
+    # North Carolina
+    ("Charlotte", "NC"): "3712000",
+    ("Raleigh", "NC"): "3755000",
+    ("Greensboro", "NC"): "3728000",
+    ("Durham", "NC"): "3719000",
+    ("Winston-Salem", "NC"): "3775000",
+    ("Fayetteville", "NC"): "3722920",
+    ("Cary", "NC"): "3710700",
+    ("Wilmington", "NC"): "3774440",
+    ("High Point", "NC"): "3731000",
+    ("Asheville", "NC"): "3702140",
+    # Tennessee
+    ("Nashville", "TN"): "4752006",
+    ("Knoxville", "TN"): "4740000",
+    ("Memphis", "TN"): "4748000",
+    ("Chattanooga", "TN"): "4714000",
+    ("Clarksville", "TN"): "4715120",
+    ("Murfreesboro", "TN"): "4751580",
+    ("Franklin", "TN"): "4727740",
+    ("Jackson", "TN"): "4737680",
+    ("Johnson City", "TN"): "4738320",
+    ("Bartlett", "TN"): "4703280",
+    # Virginia
+    ("Richmond", "VA"): "5170000",
+    ("Virginia Beach", "VA"): "5181000",
+    ("Norfolk", "VA"): "5157000",
+    ("Chesapeake", "VA"): "5151000",
+    ("Newport News", "VA"): "5156000",
+    ("Alexandria", "VA"): "5151000",
+    ("Hampton", "VA"): "5145248",
+    ("Portsmouth", "VA"): "5164000",
+    ("Suffolk", "VA"): "5176000",
+    ("Roanoke", "VA"): "5168000",
+    # South Carolina
+    ("Charleston", "SC"): "4513300",
+    ("Columbia", "SC"): "4516000",
+    ("North Charleston", "SC"): "4550605",
+    ("Mount Pleasant", "SC"): "4548570",
+    ("Rock Hill", "SC"): "4546100",
+    ("Greenville", "SC"): "4532085",
+    ("Summerville", "SC"): "4541055",
+    ("Sumter", "SC"): "4541055",
+    ("Hilton Head Island", "SC"): "4534045",
+    ("Spartanburg", "SC"): "4536820",
+    # Alabama
+    ("Birmingham", "AL"): "0107000",
+    ("Mobile", "AL"): "0150000",
+    ("Montgomery", "AL"): "0151000",
+    ("Huntsville", "AL"): "0137000",
+    ("Tuscaloosa", "AL"): "0156000",
+    ("Hoover", "AL"): "0135856",
+    ("Auburn", "AL"): "0103084",
+    ("Dothan", "AL"): "0111204",
+    ("Decatur", "AL"): "0110128",
+    ("Madison", "AL"): "0145456",
+}
+
+# Pre-normalized view so lookups only need city.lower() (no .title() scan)
+_CITY_FIPS_MAP_CI = {
+    (city.lower(), state): fips for (city, state), fips in _CITY_FIPS_MAP.items()
+}
+
+
+def _to_int(value) -> Optional[int]:
+    return int(value) if value and value != "null" else None
+
+
+def _to_float(value) -> Optional[float]:
+    return float(value) if value and value != "null" else None
+
+
+# ACS variable -> (result key, converter); drives the response parser so
+# adding a variable is one line instead of another elif/try/except block
+_VAR_SPEC = {
+    "NAME": ("name", str),
+    "B01001_001E": ("population", _to_int),
+    "B19013_001E": ("median_income", _to_float),
+    "B01002_001E": ("median_age", _to_float),
+    "B25010_001E": ("household_size", _to_float),
+}
+
+
+def _place_name_stem(name_lower: str) -> str:
+    """Strip Census naming decorations from a lowercase place name
+
+    "tampa city, florida" -> "tampa", "the villages cdp, florida" ->
+    "the villages".
+    """
+    stem = name_lower.split(",")[0]
+    for suffix in (" (balance)", " city", " town", " village", " cdp"):
+        stem = stem.removesuffix(suffix)
+    return stem.strip()
+
+
+class _TokenBucket:
+    """Thread-safe token-bucket rate limiter
+
+    Unlike a fixed sleep per call, a bucket lets bursts up to `capacity`
+    proceed immediately and only blocks once the budget is spent, refilling
+    at `rate` tokens per second on the monotonic clock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim a token and return how long the caller must wait for it
+
+        The bookkeeping under the lock is non-blocking, so both the sync and
+        async acquire paths share it; only the sleep differs.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                self._tokens = 0.0
+            else:
+                wait = 0.0
+                self._tokens -= 1
+        return wait
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        wait = self._reserve()
+        # Sleep outside the lock so other threads can refill/acquire
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Take one token, yielding to the event loop until one is available"""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
 class CensusService:
     """Service for fetching demographic data from US Census Bureau APIs"""
 
     def __init__(self):
-        self.api_key = os.getenv("CENSUS_API_KEY")
+        # Normalize once here instead of stripping on every request
+        self.api_key = (os.getenv("CENSUS_API_KEY") or "").strip() or None
         self.base_url = "https://api.census.gov/data"
-        self.cache = {}  # Simple in-memory cache
-        self.rate_limiter_delay = 0.1  # 100ms between requests (500/day limit)
+        # Size-bounded, TTL-evicting response cache: a plain dict grows
+        # forever in long-lived workers and never picks up new vintages
+        self.cache = TLRUCache(maxsize=4096, ttu=_cache_ttu, timer=time.monotonic)
+        # Per-state {place_name_lower: place_fips} indexes, built lazily from
+        # one full-state download each, plus sorted key lists for the bisect
+        # prefix fallback
+        self._state_place_index: Dict[str, Dict[str, str]] = {}
+        self._state_place_keys: Dict[str, List[str]] = {}
+        # 10 req/s with burst headroom; cache hits never touch the limiter
+        self._limiter = _TokenBucket(rate=10, capacity=10)
+
+        # One pooled session for every Census/geocoder call: keep-alive reuse
+        # skips the TCP+TLS handshake per request, and transient 429/5xx
+        # responses retry with backoff instead of surfacing immediately.
+        # When requests-cache is available the session also persists response
+        # bodies to sqlite, so short-lived processes (CLI runs, recycled web
+        # workers) skip the rate-limited network re-fetch entirely. ACS
+        # vintages are immutable, so those never expire on disk.
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                os.getenv("CENSUS_CACHE_PATH", "census_cache.sqlite"),
+                backend="sqlite",
+                expire_after=timedelta(days=30),
+                allowable_methods=["GET"],
+                stale_if_error=True,
+                # Revalidate expired entries with If-None-Match /
+                # If-Modified-Since so refreshes cost a 304 instead of a
+                # full body re-download
+                cache_control=True,
+                urls_expire_after={"*/acs/acs5*": requests_cache.NEVER_EXPIRE},
+            )
+        else:
+            self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        # The state-wide place:* responses especially benefit from compression
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+
+        # Async client is built lazily on first use so sync-only callers
+        # never pay for it
+        self._aclient: Optional[httpx.AsyncClient] = None
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Lazily build the shared httpx client for the async request path
+
+        A single client multiplexes every in-flight Census call over a small
+        pool (one connection when HTTP/2 is available), so batch fetches are
+        bounded by the token bucket rather than connection setup.
+        """
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                timeout=10,
+                headers={"Accept-Encoding": "gzip"},
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client's connections, if one was created"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    @staticmethod
+    def _html_prefix(response) -> bytes:
+        """Cheap HTML sniff for error pages, without decoding the body
+
+        Successful Census responses are JSON arrays, often hundreds of KB for
+        state-wide queries; ``response.text`` would charset-decode all of it
+        just to look for ``<html``. Check the Content-Type header and a
+        bounded byte prefix instead. Returns the lowercased prefix when the
+        response looks like HTML (so callers can search it for specific error
+        strings), empty bytes otherwise.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if "html" in content_type.lower():
+            return response.content[:2048].lower()
+        head = response.content[:2048].lower()
+        if head.lstrip().startswith(b"<"):
+            return head
+        return b""
 
     def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """Make API request with rate limiting and error handling"""
-        # Census API: Key is optional for basic queries (500/day limit without key)
-        # If key is provided, add it but don't fail if it's invalid
-        # Some endpoints work without a key
-        params_to_use = params.copy()
-        if self.api_key:
-            params_to_use["key"] = self.api_key.strip()  # Remove any whitespace
-
-        # Check cache
-        cache_key = f"{endpoint}:{str(params)}"
+        # Check cache first: hits pay neither param copies nor rate limiting
+        # (frozenset keys hash without stringifying or sorting the dict)
+        cache_key = (endpoint, frozenset(params.items()))
         if cache_key in self.cache:
             return self.cache[cache_key]
 
+        # Census API: Key is optional for basic queries (500/day limit without key)
+        # If key is provided, add it but don't fail if it's invalid — only copy
+        # the params when there is actually a key to merge in
+        params_to_use = {**params, "key": self.api_key} if self.api_key else params
+
         try:
-            time.sleep(self.rate_limiter_delay)
             url = f"{self.base_url}/{endpoint}"
+            self._limiter.acquire()
 
-            # Try request with key if available
-            response = None
-            if self.api_key:
-                params_with_key = params_to_use.copy()
-                response = requests.get(url, params=params_with_key, timeout=10)
-
-                # Check if we got "Invalid Key" HTML response
-                if (
-                    response.status_code == 200
-                    and response.text
-                    and "<html" in response.text.lower()
-                ):
-                    if (
-                        "invalid key" in response.text.lower()
-                        or "Invalid Key" in response.text
-                    ):
-                        logger.warning(
-                            "Census API key appears invalid, trying without key..."
-                        )
-                        # Retry without key (works for basic queries up to 500/day)
-                        params_with_key = params.copy()
-                        response = requests.get(url, params=params_with_key, timeout=10)
-            else:
-                response = requests.get(url, params=params_to_use, timeout=10)
+            response = self.session.get(url, params=params_to_use, timeout=10)
+
+            # Check if we got "Invalid Key" HTML response
+            if (
+                self.api_key
+                and response.status_code == 200
+                and b"invalid key" in self._html_prefix(response)
+            ):
+                logger.warning("Census API key appears invalid, trying without key...")
+                # Retry without key (works for basic queries up to 500/day)
+                response = self.session.get(url, params=params, timeout=10)
 
             # Log response for debugging
-            logger.debug(f"Census API request: {url}")
-            logger.debug(f"Response status: {response.status_code}")
+            logger.debug("Census API request: %s", url)
+            logger.debug("Response status: %s", response.status_code)
 
             # Handle 204 No Content status (successful but no data)
             if response.status_code == 204:
                 logger.warning(
-                    f"Census API returned 204 No Content for {url} - data may not be available"
+                    "Census API returned 204 No Content for %s - data may not be available",
+                    url,
                 )
                 return None
 
             response.raise_for_status()
 
             # Check if response is empty
-            if not response.text or len(response.text.strip()) == 0:
-                logger.warning(f"Empty response from Census API: {url}")
+            body = response.content
+            if not body or not body.strip():
+                logger.warning("Empty response from Census API: %s", url)
                 return None
 
-            # Try to parse JSON
-            try:
-                data = response.json()
-            except ValueError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Response text: {response.text[:500]}")
+            # Valid Census payloads are JSON arrays/objects; a one-byte sniff
+            # routes error pages away without attempting the full parse
+            if body.lstrip()[:1] not in (b"[", b"{"):
+                logger.error(
+                    "Non-JSON response from Census API: %s",
+                    body[:500].decode(errors="replace"),
+                )
                 # If it's HTML (error page), try without key
-                if "<html" in response.text.lower() and self.api_key:
+                if self.api_key and self._html_prefix(response):
                     logger.info("Retrying Census API request without key...")
-                    params_no_key = params.copy()
-                    retry_response = requests.get(url, params=params_no_key, timeout=10)
-                    if retry_response.status_code == 200 and retry_response.text:
+                    retry_response = self.session.get(url, params=params, timeout=10)
+                    if retry_response.status_code == 200 and retry_response.content:
                         try:
-                            return retry_response.json()
-                        except:
+                            return _loads(retry_response.content)
+                        except ValueError:
                             pass
                 return None
 
+            # Try to parse JSON
+            try:
+                data = _loads(body)
+            except ValueError as e:
+                logger.error("Failed to parse JSON response: %s", e)
+                logger.error("Response text: %s", body[:500].decode(errors="replace"))
+                return None
+
             # Check for API errors in response
             if isinstance(data, dict) and "error" in data:
                 error_msg = data.get("error", "Unknown error")
-                logger.error(f"Census API error: {error_msg}")
+                logger.error("Census API error: %s", error_msg)
                 return None
 
             self.cache[cache_key] = data
             return data
 
         except requests.exceptions.HTTPError as e:
-            logger.error(f"Census API HTTP error: {e}")
-            if hasattr(e.response, "text"):
-                logger.error(f"Response: {e.response.text[:500]}")
+            logger.error("Census API HTTP error: %s", e)
+            if hasattr(e.response, "content"):
+                logger.error(
+                    "Response: %s",
+                    e.response.content[:500].decode(errors="replace"),
+                )
             return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"Census API request failed: {e}")
+            logger.error("Census API request failed: %s", e)
             return None
 
-    def get_city_demographics(self, city: str, state: str) -> Optional[Dict]:
+    async def _make_request_async(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """Async mirror of _make_request on the shared httpx client
+
+        Awaiting the token bucket instead of sleeping in it lets one event
+        loop keep hundreds of city fetches in flight at the capped request
+        rate, where the sync path burns a thread per concurrent call.
+        Shares the parsed-response cache with the sync path.
+        """
+        cache_key = (endpoint, frozenset(params.items()))
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+
+        params_to_use = {**params, "key": self.api_key} if self.api_key else params
+        client = self._async_client()
+
+        try:
+            url = f"{self.base_url}/{endpoint}"
+            await self._limiter.acquire_async()
+
+            response = await client.get(url, params=params_to_use)
+
+            if (
+                self.api_key
+                and response.status_code == 200
+                and b"invalid key" in self._html_prefix(response)
+            ):
+                logger.warning("Census API key appears invalid, trying without key...")
+                response = await client.get(url, params=params)
+
+            if response.status_code == 204:
+                logger.warning(
+                    "Census API returned 204 No Content for %s - data may not be available",
+                    url,
+                )
+                return None
+
+            response.raise_for_status()
+
+            body = response.content
+            if not body or not body.strip():
+                logger.warning("Empty response from Census API: %s", url)
+                return None
+
+            if body.lstrip()[:1] not in (b"[", b"{"):
+                logger.error(
+                    "Non-JSON response from Census API: %s",
+                    body[:500].decode(errors="replace"),
+                )
+                return None
+
+            try:
+                data = _loads(body)
+            except ValueError as e:
+                logger.error("Failed to parse JSON response: %s", e)
+                logger.error("Response text: %s", body[:500].decode(errors="replace"))
+                return None
+
+            if isinstance(data, dict) and "error" in data:
+                logger.error("Census API error: %s", data.get("error", "Unknown error"))
+                return None
+
+            self.cache[cache_key] = data
+            return data
+
+        except httpx.HTTPStatusError as e:
+            logger.error("Census API HTTP error: %s", e)
+            return None
+        except httpx.HTTPError as e:
+            logger.error("Census API request failed: %s", e)
+            return None
+
+    def get_city_demographics(
+        self,
+        city: str,
+        state: str,
+        place_fips: Optional[str] = None,
+        state_fips: Optional[str] = None,
+    ) -> Optional[Dict]:
         """
         Get demographics for a city using ACS 5-Year Estimates
 
         Args:
             city: City name
             state: State abbreviation (e.g., "FL")
+            place_fips: Pre-resolved place FIPS (skips a redundant lookup)
+            state_fips: Pre-resolved state FIPS
 
         Returns:
             Dictionary with demographic data or None
         """
         # First, get the place FIPS code
-        place_fips = self._get_place_fips(city, state)
+        place_fips = place_fips or self._get_place_fips(city, state)
         if not place_fips:
-            logger.warning(f"Could not find FIPS code for {city}, {state}")
+            logger.warning("Could not find FIPS code for %s, %s", city, state)
             return None
 
         # Get state FIPS code
-        state_fips = self._get_state_fips(state)
+        state_fips = state_fips or self._get_state_fips(state)
         if not state_fips:
-            logger.warning(f"Could not find state FIPS for {state}")
+            logger.warning("Could not find state FIPS for %s", state)
             return None
 
         # ACS 5-Year Estimates variables:
@@ -158,18 +646,59 @@ class CensusService:
         }
 
         data = self._make_request("2021/acs/acs5", params)
+        return self._parse_acs_demographics(data, city, state)
+
+    async def get_city_demographics_async(
+        self,
+        city: str,
+        state: str,
+        place_fips: Optional[str] = None,
+        state_fips: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Async variant of get_city_demographics for batch pipelines
+
+        FIPS resolution may build the per-state place index over the sync
+        session; that runs on the shared executor so the event loop is not
+        blocked.
+        """
+        if place_fips is None:
+            loop = asyncio.get_running_loop()
+            place_fips = await loop.run_in_executor(
+                _EXECUTOR, self._get_place_fips, city, state
+            )
+        if not place_fips:
+            logger.warning("Could not find FIPS code for %s, %s", city, state)
+            return None
+
+        state_fips = state_fips or self._get_state_fips(state)
+        if not state_fips:
+            logger.warning("Could not find state FIPS for %s", state)
+            return None
+
+        params = {
+            "get": "NAME,B01001_001E,B19013_001E,B01002_001E,B25010_001E",
+            "for": f"place:{place_fips}",
+            "in": f"state:{state_fips}",
+        }
+        data = await self._make_request_async("2021/acs/acs5", params)
+        return self._parse_acs_demographics(data, city, state)
+
+    def _parse_acs_demographics(
+        self, data, city: str, state: str
+    ) -> Optional[Dict]:
+        """Turn an ACS header/value row pair into the demographics dict"""
         if not data:
-            logger.warning(f"No data returned from Census API for {city}, {state}")
+            logger.warning("No data returned from Census API for %s, %s", city, state)
             return None
 
         # Check if we got an error response
         if isinstance(data, dict) and "error" in data:
             error_msg = data.get("error", "Unknown error")
-            logger.error(f"Census API error for {city}, {state}: {error_msg}")
+            logger.error("Census API error for %s, %s: %s", city, state, error_msg)
             return None
 
         if len(data) < 2:
-            logger.warning(f"Insufficient data returned for {city}, {state}: {data}")
+            logger.warning("Insufficient data returned for %s, %s: %s", city, state, data)
             return None
 
         # Parse response (first row is headers, second is data)
@@ -177,40 +706,15 @@ class CensusService:
         values = data[1]
 
         result = {}
-        for i, header in enumerate(headers):
-            if i >= len(values):
+        for header, value in zip(headers, values):
+            spec = _VAR_SPEC.get(header)
+            if not spec:
                 continue
-            value = values[i]
-            if header == "NAME":
-                result["name"] = value
-            elif header == "B01001_001E":
-                try:
-                    result["population"] = (
-                        int(value) if value and value != "null" else None
-                    )
-                except (ValueError, TypeError):
-                    result["population"] = None
-            elif header == "B19013_001E":
-                try:
-                    result["median_income"] = (
-                        float(value) if value and value != "null" else None
-                    )
-                except (ValueError, TypeError):
-                    result["median_income"] = None
-            elif header == "B01002_001E":
-                try:
-                    result["median_age"] = (
-                        float(value) if value and value != "null" else None
-                    )
-                except (ValueError, TypeError):
-                    result["median_age"] = None
-            elif header == "B25010_001E":
-                try:
-                    result["household_size"] = (
-                        float(value) if value and value != "null" else None
-                    )
-                except (ValueError, TypeError):
-                    result["household_size"] = None
+            key, convert = spec
+            try:
+                result[key] = convert(value)
+            except (ValueError, TypeError):
+                result[key] = None
 
         # Determine data year from the endpoint used
         result["data_year"] = (
@@ -218,7 +722,80 @@ class CensusService:
         )
         return result
 
-    def get_population_growth(self, city: str, state: str) -> Optional[float]:
+    def get_city_demographics_batch(
+        self, city_state_pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """
+        Get demographics for many cities with one ACS request per state
+
+        The ACS API accepts a comma-separated FIPS list in the ``for``
+        clause, returning one row per place, so a 10-city state costs one
+        rate-limited round trip instead of ten. Requests are chunked at 50
+        places to stay under URL-length limits.
+
+        Args:
+            city_state_pairs: (city, state abbreviation) tuples
+
+        Returns:
+            Dict keyed by the input tuples; value is the demographics dict
+            or None where the city could not be resolved or returned no row
+        """
+        results: Dict[Tuple[str, str], Optional[Dict]] = {
+            pair: None for pair in city_state_pairs
+        }
+
+        # Group resolvable cities by state FIPS
+        by_state: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        for city, state in results:
+            state_fips = self._get_state_fips(state)
+            if not state_fips:
+                logger.warning("Could not find state FIPS for %s", state)
+                continue
+            place_fips = self._get_place_fips(city, state)
+            if not place_fips:
+                logger.warning("Could not find FIPS code for %s, %s", city, state)
+                continue
+            # Key by the 5-digit place code: the static table carries
+            # state-prefixed 7-digit codes but the response's place column
+            # (and the for= clause) use the bare place code
+            by_state.setdefault(state_fips, {})[place_fips[-5:]] = (city, state)
+
+        for state_fips, places in by_state.items():
+            fips_list = sorted(places)
+            for start in range(0, len(fips_list), 50):
+                chunk = fips_list[start : start + 50]
+                params = {
+                    "get": "NAME,B01001_001E,B19013_001E,B01002_001E,B25010_001E",
+                    "for": f"place:{','.join(chunk)}",
+                    "in": f"state:{state_fips}",
+                }
+                data = self._make_request("2021/acs/acs5", params)
+                if not data or not isinstance(data, list) or len(data) < 2:
+                    continue
+
+                headers = data[0]
+                try:
+                    place_idx = headers.index("place")
+                except ValueError:
+                    continue
+                for row in data[1:]:
+                    pair = places.get(row[place_idx][-5:])
+                    if pair is None:
+                        continue
+                    results[pair] = self._parse_acs_demographics(
+                        [headers, row], pair[0], pair[1]
+                    )
+
+        return results
+
+    def get_population_growth(
+        self,
+        city: str,
+        state: str,
+        place_fips: Optional[str] = None,
+        state_fips: Optional[str] = None,
+        current_population: Optional[int] = None,
+    ) -> Optional[float]:
         """
         Calculate 5-year population growth rate
 
@@ -228,43 +805,53 @@ class CensusService:
         Args:
             city: City name
             state: State abbreviation
+            place_fips: Pre-resolved place FIPS (skips a redundant lookup)
+            state_fips: Pre-resolved state FIPS
+            current_population: Known current population (e.g. from an ACS
+                fetch); when given, the current-year PEP request is skipped
+                and growth is computed against 2017 PEP directly
 
         Returns:
             Annual growth rate (as decimal, e.g., 0.02 for 2%) or None
         """
-        place_fips = self._get_place_fips(city, state)
-        state_fips = self._get_state_fips(state)
+        place_fips = place_fips or self._get_place_fips(city, state)
+        state_fips = state_fips or self._get_state_fips(state)
         if not place_fips or not state_fips:
             return None
 
         # Try PEP API first (more accurate for growth)
         try:
-            # Get current population (2022)
-            current_params = {
+            # Current (2022) and five-years-ago (2017) populations are
+            # independent requests: issue them concurrently. A caller-supplied
+            # current population saves the current-year request entirely.
+            pep_params = {
                 "get": "POP",
                 "for": f"place:{place_fips}",
                 "in": f"state:{state_fips}",
             }
-            current_data = self._make_request("2022/pep/population", current_params)
-
-            # Get population 5 years ago (2017)
-            past_params = {
-                "get": "POP",
-                "for": f"place:{place_fips}",
-                "in": f"state:{state_fips}",
-            }
-            past_data = self._make_request("2017/pep/population", past_params)
+            current_future = (
+                None
+                if current_population
+                else _EXECUTOR.submit(
+                    self._make_request, "2022/pep/population", pep_params
+                )
+            )
+            past_future = _EXECUTOR.submit(
+                self._make_request, "2017/pep/population", pep_params
+            )
+            current_data = current_future.result() if current_future else None
+            past_data = past_future.result()
 
-            if (
-                current_data
-                and past_data
-                and len(current_data) >= 2
-                and len(past_data) >= 2
-            ):
+            if past_data and len(past_data) >= 2:
                 try:
-                    current_pop = (
-                        int(current_data[1][0]) if current_data[1][0] else None
-                    )
+                    if current_population:
+                        current_pop = current_population
+                    elif current_data and len(current_data) >= 2:
+                        current_pop = (
+                            int(current_data[1][0]) if current_data[1][0] else None
+                        )
+                    else:
+                        current_pop = None
                     past_pop = int(past_data[1][0]) if past_data[1][0] else None
 
                     if current_pop and past_pop and past_pop > 0:
@@ -274,12 +861,12 @@ class CensusService:
                 except (ValueError, IndexError):
                     pass
         except Exception as e:
-            logger.debug(f"PEP API failed for {city}, {state}: {e}")
+            logger.debug("PEP API failed for %s, %s: %s", city, state, e)
 
         # Fallback: Use ACS data comparison (less accurate but available)
         # Compare current ACS data with older ACS data
         try:
-            current_demo = self.get_city_demographics(city, state)
+            current_demo = self.get_city_demographics(city, state, place_fips, state_fips)
             if current_demo and current_demo.get("population"):
                 # Try to get older ACS data (2016 ACS 5-year)
                 old_params = {
@@ -301,11 +888,97 @@ class CensusService:
                     except (ValueError, IndexError):
                         pass
         except Exception as e:
-            logger.debug(f"ACS fallback failed for {city}, {state}: {e}")
+            logger.debug("ACS fallback failed for %s, %s: %s", city, state, e)
 
         # If all methods fail, return None (growth rate will be missing)
         return None
 
+    async def get_population_growth_async(
+        self,
+        city: str,
+        state: str,
+        place_fips: Optional[str] = None,
+        state_fips: Optional[str] = None,
+        current_population: Optional[int] = None,
+    ) -> Optional[float]:
+        """Async variant of get_population_growth
+
+        Same PEP-first, ACS-comparison-fallback logic, but the independent
+        requests are awaited together on the event loop instead of occupying
+        executor threads.
+        """
+        if place_fips is None:
+            loop = asyncio.get_running_loop()
+            place_fips = await loop.run_in_executor(
+                _EXECUTOR, self._get_place_fips, city, state
+            )
+        state_fips = state_fips or self._get_state_fips(state)
+        if not place_fips or not state_fips:
+            return None
+
+        try:
+            pep_params = {
+                "get": "POP",
+                "for": f"place:{place_fips}",
+                "in": f"state:{state_fips}",
+            }
+            if current_population:
+                current_data = None
+                past_data = await self._make_request_async(
+                    "2017/pep/population", pep_params
+                )
+            else:
+                current_data, past_data = await asyncio.gather(
+                    self._make_request_async("2022/pep/population", pep_params),
+                    self._make_request_async("2017/pep/population", pep_params),
+                )
+
+            if past_data and len(past_data) >= 2:
+                try:
+                    if current_population:
+                        current_pop = current_population
+                    elif current_data and len(current_data) >= 2:
+                        current_pop = (
+                            int(current_data[1][0]) if current_data[1][0] else None
+                        )
+                    else:
+                        current_pop = None
+                    past_pop = int(past_data[1][0]) if past_data[1][0] else None
+
+                    if current_pop and past_pop and past_pop > 0:
+                        return ((current_pop / past_pop) ** (1 / 5)) - 1
+                except (ValueError, IndexError):
+                    pass
+        except Exception as e:
+            logger.debug("PEP API failed for %s, %s: %s", city, state, e)
+
+        try:
+            current_demo = await self.get_city_demographics_async(
+                city, state, place_fips, state_fips
+            )
+            if current_demo and current_demo.get("population"):
+                old_params = {
+                    "get": "B01001_001E",  # Total population
+                    "for": f"place:{place_fips}",
+                    "in": f"state:{state_fips}",
+                }
+                old_data = await self._make_request_async("2016/acs/acs5", old_params)
+
+                if old_data and len(old_data) >= 2:
+                    try:
+                        old_pop = int(old_data[1][0]) if old_data[1][0] else None
+                        current_pop = current_demo.get("population")
+
+                        if old_pop and current_pop and old_pop > 0:
+                            # 6 year span for 2016-2022
+                            return ((current_pop / old_pop) ** (1 / 6)) - 1
+                    except (ValueError, IndexError):
+                        pass
+        except Exception as e:
+            logger.debug("ACS fallback failed for %s, %s: %s", city, state, e)
+
+        return None
+
     def get_metro_area(self, city: str, state: str) -> Optional[str]:
         """
         Get metro area (MSA/CBSA) code for a city
@@ -324,64 +997,11 @@ class CensusService:
 
     def _get_state_fips(self, state: str) -> Optional[str]:
         """Get state FIPS code"""
-        state_fips_map = {
-            "AL": "01",
-            "AK": "02",
-            "AZ": "04",
-            "AR": "05",
-            "CA": "06",
-            "CO": "08",
-            "CT": "09",
-            "DE": "10",
-            "FL": "12",
-            "GA": "13",
-            "HI": "15",
-            "ID": "16",
-            "IL": "17",
-            "IN": "18",
-            "IA": "19",
-            "KS": "20",
-            "KY": "21",
-            "LA": "22",
-            "ME": "23",
-            "MD": "24",
-            "MA": "25",
-            "MI": "26",
-            "MN": "27",
-            "MS": "28",
-            "MO": "29",
-            "MT": "30",
-            "NE": "31",
-            "NV": "32",
-            "NH": "33",
-            "NJ": "34",
-            "NM": "35",
-            "NY": "36",
-            "NC": "37",
-            "ND": "38",
-            "OH": "39",
-            "OK": "40",
-            "OR": "41",
-            "PA": "42",
-            "RI": "43",
-            "SC": "45",
-            "SD": "46",
-            "TN": "47",
-            "TX": "48",
-            "UT": "49",
-            "VT": "50",
-            "VA": "51",
-            "WA": "53",
-            "WV": "54",
-            "WI": "55",
-            "WY": "56",
-            "DC": "11",
-        }
-        return state_fips_map.get(state.upper())
+        return _state_fips(state)
 
     def _get_fips_from_census_api(self, city: str, state: str) -> Optional[str]:
         """
-        Get place FIPS code by querying Census API for all places in state
+        Get place FIPS code from the memoized per-state place index
         This is more reliable than static lookup tables
         """
         try:
@@ -389,185 +1009,115 @@ class CensusService:
             if not state_fips:
                 return None
 
-            # Query Census API for all places in state and find matching city
-            url = f"{self.base_url}/2022/acs/acs5"
-            params = {
-                "get": "NAME,PLACE",
-                "for": "place:*",
-                "in": f"state:{state_fips}",
-            }
-            if self.api_key:
-                params["key"] = self.api_key.strip()
-
-            time.sleep(self.rate_limiter_delay)
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code != 200 or not response.text:
+            index = self._state_place_index.get(state_fips)
+            if index is None:
+                index = self._build_state_place_index(state_fips)
+            if not index:
                 return None
 
-            try:
-                data = response.json()
-                if not data or len(data) < 2:
-                    return None
-
-                # Search for city name in results
-                city_lower = city.lower()
-                for row in data[1:]:  # Skip header row
-                    if len(row) >= 2:
-                        place_name = row[0].lower()
-                        place_fips = row[1]
-
-                        # Check if city name matches (handle variations like "Lexington-Fayette")
-                        if city_lower in place_name or place_name.startswith(
-                            city_lower
-                        ):
-                            logger.debug(
-                                f"Found FIPS {place_fips} for {city}, {state} via Census API"
-                            )
-                            return place_fips
-
-            except (ValueError, IndexError) as e:
-                logger.debug(f"Failed to parse Census API response: {e}")
-                return None
+            city_lower = city.lower()
+            fips = index.get(city_lower)
+            if fips:
+                return fips
+
+            # Exact miss: prefix-search the sorted keys with bisect to catch
+            # variations ("lexington" -> "lexington-fayette urban county")
+            keys = self._state_place_keys[state_fips]
+            pos = bisect_left(keys, city_lower)
+            if pos < len(keys) and keys[pos].startswith(city_lower):
+                place_fips = index[keys[pos]]
+                logger.debug(
+                    "Found FIPS %s for %s, %s via Census API", place_fips, city, state
+                )
+                return place_fips
 
         except Exception as e:
-            logger.debug(f"Census API FIPS lookup failed for {city}, {state}: {e}")
+            logger.debug("Census API FIPS lookup failed for %s, %s: %s", city, state, e)
 
         return None
 
-    def _get_place_fips(self, city: str, state: str) -> Optional[str]:
+    def _build_state_place_index(self, state_fips: str) -> Optional[Dict[str, str]]:
         """
-        Get place FIPS code for a city using Census API lookup or fallback table
+        Download a state's full place table once and memoize {name_lower: fips}
+
+        One full-state query per state replaces one per city: subsequent
+        lookups in that state are dict hits with no HTTP round trip.
         """
-        # First try to get from Census API dynamically (most reliable)
-        fips_from_api = self._get_fips_from_census_api(city, state)
-        if fips_from_api:
-            return fips_from_api
-
-        # Fallback to lookup table
-        city_fips_map = {
-            # Florida
-            ("Miami", "FL"): "1245000",
-            ("Tampa", "FL"): "1271000",
-            ("Orlando", "FL"): "1253000",
-            ("Jacksonville", "FL"): "1235000",
-            ("Lakeland", "FL"): "1238250",
-            ("Kissimmee", "FL"): "1236975",
-            ("Clearwater", "FL"): "1212875",
-            ("St. Petersburg", "FL"): "1263000",
-            ("Tallahassee", "FL"): "1270750",
-            ("Gainesville", "FL"): "1225875",
-            ("Pensacola", "FL"): "1255900",
-            ("Sarasota", "FL"): "1264175",
-            ("Naples", "FL"): "1247650",
-            ("Fort Myers", "FL"): "1224175",
-            ("West Palm Beach", "FL"): "1276675",
-            # Kentucky
-            ("Lexington", "KY"): "2146042",
-            ("Louisville", "KY"): "2148000",
-            ("Owensboro", "KY"): "2158624",
-            ("Bowling Green", "KY"): "2108992",
-            ("Covington", "KY"): "2117854",
-            ("Hopkinsville", "KY"): "2137852",
-            ("Richmond", "KY"): "2165202",
-            ("Florence", "KY"): "2127982",
-            ("Georgetown", "KY"): "2130700",
-            ("Henderson", "KY"): "2135896",
-            ("Elizabethtown", "KY"): "2124298",
-            ("Paducah", "KY"): "2158836",
-            ("Radcliff", "KY"): "2159364",
-            ("Ashland", "KY"): "2102206",
-            ("Madisonville", "KY"): "2149290",
-            ("Somerset", "KY"): "2161446",
-            ("Danville", "KY"): "2119890",
-            ("Fort Thomas", "KY"): "2128580",
-            ("Shively", "KY"): "2160306",
-            ("Newport", "KY"): "2155830",
-            ("St. Matthews", "KY"): "2160012",
-            ("Walton", "KY"): "2180524",
-            ("Erlanger", "KY"): "2125282",
-            ("Jeffersontown", "KY"): "2139988",
-            # Georgia
-            ("Atlanta", "GA"): "1304000",
-            ("Savannah", "GA"): "1369000",
-            ("Augusta", "GA"): "1304000",
-            ("Columbus", "GA"): "1319000",
-            ("Athens", "GA"): "1303456",
-            ("Sandy Springs", "GA"): "1368496",
-            ("Roswell", "GA"): "1367000",
-            ("Macon", "GA"): "1349000",
-            ("Johns Creek", "GA"): "1342424",
-            ("Albany", "GA"): "1301056",
-            ("Warner Robins", "GA"): "1380704",
-            ("Alpharetta", "GA"): "1301644",
-            ("Marietta", "GA"): "1349796",
-            ("Valdosta", "GA"): "1379000",
-            ("Smyrna", "GA"): "1371600",
-            # North Carolina
-            ("Charlotte", "NC"): "3712000",
-            ("Raleigh", "NC"): "3755000",
-            ("Greensboro", "NC"): "3728000",
-            ("Durham", "NC"): "3719000",
-            ("Winston-Salem", "NC"): "3775000",
-            ("Fayetteville", "NC"): "3722920",
-            ("Cary", "NC"): "3710700",
-            ("Wilmington", "NC"): "3774440",
-            ("High Point", "NC"): "3731000",
-            ("Asheville", "NC"): "3702140",
-            # Tennessee
-            ("Nashville", "TN"): "4752006",
-            ("Knoxville", "TN"): "4740000",
-            ("Memphis", "TN"): "4748000",
-            ("Chattanooga", "TN"): "4714000",
-            ("Clarksville", "TN"): "4715120",
-            ("Murfreesboro", "TN"): "4751580",
-            ("Franklin", "TN"): "4727740",
-            ("Jackson", "TN"): "4737680",
-            ("Johnson City", "TN"): "4738320",
-            ("Bartlett", "TN"): "4703280",
-            # Virginia
-            ("Richmond", "VA"): "5170000",
-            ("Virginia Beach", "VA"): "5181000",
-            ("Norfolk", "VA"): "5157000",
-            ("Chesapeake", "VA"): "5151000",
-            ("Newport News", "VA"): "5156000",
-            ("Alexandria", "VA"): "5151000",
-            ("Hampton", "VA"): "5145248",
-            ("Portsmouth", "VA"): "5164000",
-            ("Suffolk", "VA"): "5176000",
-            ("Roanoke", "VA"): "5168000",
-            # South Carolina
-            ("Charleston", "SC"): "4513300",
-            ("Columbia", "SC"): "4516000",
-            ("North Charleston", "SC"): "4550605",
-            ("Mount Pleasant", "SC"): "4548570",
-            ("Rock Hill", "SC"): "4546100",
-            ("Greenville", "SC"): "4532085",
-            ("Summerville", "SC"): "4541055",
-            ("Sumter", "SC"): "4541055",
-            ("Hilton Head Island", "SC"): "4534045",
-            ("Spartanburg", "SC"): "4536820",
-            # Alabama
-            ("Birmingham", "AL"): "0107000",
-            ("Mobile", "AL"): "0150000",
-            ("Montgomery", "AL"): "0151000",
-            ("Huntsville", "AL"): "0137000",
-            ("Tuscaloosa", "AL"): "0156000",
-            ("Hoover", "AL"): "0135856",
-            ("Auburn", "AL"): "0103084",
-            ("Dothan", "AL"): "0111204",
-            ("Decatur", "AL"): "0110128",
-            ("Madison", "AL"): "0145456",
+        params = {
+            "get": "NAME,PLACE",
+            "for": "place:*",
+            "in": f"state:{state_fips}",
         }
+        if self.api_key:
+            params["key"] = self.api_key
+
+        self._limiter.acquire()
+        response = self.session.get(
+            f"{self.base_url}/2022/acs/acs5",
+            params=params,
+            timeout=10,
+            stream=ijson is not None,
+        )
+        if response.status_code != 200:
+            return None
 
-        key = (city.title(), state.upper())
-        fips = city_fips_map.get(key)
+        # Key by the Census-normalized name stem ("Tampa city, Florida" ->
+        # "tampa") so the common case is a single dict hit; keep the full
+        # lowercase name as a secondary key for callers that pass it verbatim
+        index = {}
+        try:
+            if ijson is not None:
+                # Stream rows one at a time; peak memory is a single row
+                # regardless of state size (~1500 places for CA)
+                response.raw.decode_content = True  # undo gzip before parsing
+                rows = ijson.items(response.raw, "item")
+                next(rows, None)  # skip the header row
+            else:
+                if not response.content:
+                    return None
+                data = _loads(response.content)
+                if not data or len(data) < 2:
+                    return None
+                rows = iter(data[1:])
+            for row in rows:
+                if len(row) < 2:
+                    continue
+                name_lower, place_fips = row[0].lower(), row[1]
+                index.setdefault(name_lower, place_fips)
+                index.setdefault(_place_name_stem(name_lower), place_fips)
+        except _PLACE_PARSE_ERRORS as e:
+            logger.debug("Failed to parse Census API response: %s", e)
+            return None
+        finally:
+            response.close()
 
-        # If not in lookup table, try Census Geocoder API as final fallback
-        if not fips:
-            fips = self._get_fips_from_geocoder(city, state)
-            if fips:
-                logger.info(f"Found FIPS {fips} for {city}, {state} via geocoder")
+        self._state_place_index[state_fips] = index
+        self._state_place_keys[state_fips] = sorted(index)
+        return index
+
+    def _get_place_fips(self, city: str, state: str) -> Optional[str]:
+        """
+        Get place FIPS code for a city: static table, then Census API, then
+        the geocoder
+        """
+        # The static table answers the common known-city case in-process,
+        # without an HTTP round trip or a rate-limit token. It carries
+        # state-prefixed 7-digit codes; callers build for=place:{fips}
+        # clauses, which take the bare 5-digit place code like the place
+        # index and geocoder return
+        fips = _CITY_FIPS_MAP_CI.get((city.lower(), state.upper()))
+        if fips:
+            return fips[-5:]
+
+        # Then the (memoized) full-state Census place index
+        fips = self._get_fips_from_census_api(city, state)
+        if fips:
+            return fips
+
+        # Census Geocoder API as final fallback
+        fips = self._get_fips_from_geocoder(city, state)
+        if fips:
+            logger.info("Found FIPS %s for %s, %s via geocoder", fips, city, state)
 
         return fips
 
@@ -588,11 +1138,11 @@ class CensusService:
                 "format": "json",
             }
 
-            time.sleep(self.rate_limiter_delay)
-            response = requests.get(geocoder_url, params=params, timeout=10)
+            self._limiter.acquire()
+            response = self.session.get(geocoder_url, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             if data.get("result") and data["result"].get("addressMatches"):
                 match = data["result"]["addressMatches"][0]
                 geographies = match.get("geographies", {})
@@ -601,12 +1151,15 @@ class CensusService:
                     place_fips = places[0].get("PLACE", "")
                     if place_fips:
                         logger.debug(
-                            f"Found FIPS {place_fips} for {city}, {state} via geocoder"
+                            "Found FIPS %s for %s, %s via geocoder",
+                            place_fips,
+                            city,
+                            state,
                         )
                         return place_fips
 
         except Exception as e:
-            logger.debug(f"Geocoder API failed for {city}, {state}: {e}")
+            logger.debug("Geocoder API failed for %s, %s: %s", city, state, e)
 
         return None
 
@@ -621,17 +1174,33 @@ class CensusService:
         Returns:
             Dictionary with all demographic data
         """
-        demographics = self.get_city_demographics(city, state)
+        # Resolve FIPS once up front so the demographics and growth paths
+        # don't each redo the (potentially remote) lookup
+        place_fips = self._get_place_fips(city, state)
+        state_fips = self._get_state_fips(state)
+
+        # The ACS demographics fetch and the growth-rate calculation hit
+        # disjoint endpoints; run them concurrently so total latency is
+        # the max of the two rather than the sum
+        demographics_future = _EXECUTOR.submit(
+            self.get_city_demographics, city, state, place_fips, state_fips
+        )
+        growth_future = _EXECUTOR.submit(
+            self.get_population_growth, city, state, place_fips, state_fips
+        )
+
+        demographics = demographics_future.result()
         if not demographics:
+            growth_future.cancel()
             return None
 
         # Add growth rate (skip if PEP API fails - it's not critical)
         try:
-            growth_rate = self.get_population_growth(city, state)
+            growth_rate = growth_future.result()
             if growth_rate is not None:
                 demographics["growth_rate"] = growth_rate
         except Exception as e:
-            logger.debug(f"Could not calculate growth rate for {city}, {state}: {e}")
+            logger.debug("Could not calculate growth rate for %s, %s: %s", city, state, e)
             # Growth rate is optional, continue without it
 
         # Add metro area (if available)
@@ -640,3 +1209,36 @@ class CensusService:
             demographics["metro_area"] = metro_area
 
         return demographics
+
+    async def get_comprehensive_demographics_async(
+        self, city: str, state: str
+    ) -> Optional[Dict]:
+        """Async variant of get_comprehensive_demographics
+
+        Demographics and growth are gathered concurrently on the event loop,
+        so a caller can fan this out across hundreds of cities with
+        asyncio.gather and stay bounded by the token bucket rather than the
+        executor's thread count.
+        """
+        loop = asyncio.get_running_loop()
+        place_fips = await loop.run_in_executor(
+            _EXECUTOR, self._get_place_fips, city, state
+        )
+        state_fips = self._get_state_fips(state)
+
+        demographics, growth_rate = await asyncio.gather(
+            self.get_city_demographics_async(city, state, place_fips, state_fips),
+            self.get_population_growth_async(city, state, place_fips, state_fips),
+            return_exceptions=False,
+        )
+        if not demographics:
+            return None
+
+        if growth_rate is not None:
+            demographics["growth_rate"] = growth_rate
+
+        metro_area = self.get_metro_area(city, state)
+        if metro_area:
+            demographics["metro_area"] = metro_area
+
+        return demographics
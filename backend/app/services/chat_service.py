@@ -7,13 +7,25 @@ about Publix stores, parcels, demographics, and expansion predictions.
 Integrated with LangSmith for monitoring and tracing.
 """
 
+import asyncio
 import os
 import logging
+import re
+import threading
+import time
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import func, select
 from dotenv import load_dotenv
 
+from app.models.schemas import (
+    PublixStore,
+    CompetitorStore,
+    Parcel,
+    Demographics,
+    Prediction,
+)
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -36,7 +48,7 @@ langsmith_project = None
 logger.info("LangSmith tracing disabled (commented out due to 403 errors)")
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 
     # from langsmith import traceable  # COMMENTED OUT: LangSmith causing 403 errors
 
@@ -61,6 +73,70 @@ def traceable(name=None):
 class ChatService:
     """Service for LLM-powered chat about Publix expansion data with LangSmith tracing"""
 
+    # Keyword/state detection compiled once: one linear regex pass over the
+    # message replaces four any()-substring scans plus an 8-state loop per
+    # branch. Keywords are stems (leading boundary only) so "stores",
+    # "acreage", "expanding" still match; ties between query types resolve
+    # by the historical branch order via _QUERY_PRIORITY.
+    _KEYWORD_RE = re.compile(
+        r"\b(store|location"
+        r"|parcel|land|property|acre"
+        r"|demographic|population|income|growth"
+        r"|prediction|expand|opportunit|next)",
+        re.IGNORECASE,
+    )
+    _KEYWORD_TO_QUERY = {
+        "store": "stores",
+        "location": "stores",
+        "parcel": "parcels",
+        "land": "parcels",
+        "property": "parcels",
+        "acre": "parcels",
+        "demographic": "demographics",
+        "population": "demographics",
+        "income": "demographics",
+        "growth": "demographics",
+        "prediction": "predictions",
+        "expand": "predictions",
+        "opportunit": "predictions",
+        "next": "predictions",
+    }
+    _QUERY_PRIORITY = {
+        "stores": 0,
+        "parcels": 1,
+        "demographics": 2,
+        "predictions": 3,
+    }
+    _STATE_RE = re.compile(r"\b(FL|GA|AL|SC|NC|TN|VA|KY)\b", re.IGNORECASE)
+
+    # System prompt for turns that don't reference the data ("hello" style
+    # greetings): skips the context-summary queries entirely
+    _BASE_SYSTEM_PROMPT = (
+        "You are an AI assistant helping with Publix grocery store "
+        "expansion analysis."
+    )
+
+    # Context summary cache, shared across the per-request instances the
+    # routes create: the embedded table counts change slowly, so one
+    # process-wide recomputation per TTL replaces two queries per chat turn.
+    # The lock keeps concurrent expiries from recomputing in a herd.
+    _context_cache: Optional[tuple] = None
+    _context_lock = threading.Lock()
+    _CONTEXT_TTL = 60.0
+
+    # Completion coalescer: under bursty traffic, concurrent non-streaming
+    # requests queue for up to _COALESCE_WINDOW seconds and dispatch together
+    # with asyncio.gather, so the provider round trips overlap instead of
+    # each request paying its own scheduling latency. Streaming requests
+    # bypass the coalescer — their first token must not wait on the window.
+    # (Offline bulk work should use OpenAI's Batch API instead; nothing in
+    # this service is offline today.)
+    _COALESCE_WINDOW = 0.01
+    _COALESCE_MAX = 8
+    _coalesce_queue: Optional[asyncio.Queue] = None
+    _coalesce_loop = None
+    _coalesce_task = None
+
     def __init__(self, db: Session):
         self.db = db
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -74,7 +150,9 @@ class ChatService:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not set in environment")
 
-        self.client = OpenAI(api_key=self.api_key)
+        # Async client: the OpenAI round trip awaits on the event loop
+        # instead of pinning a worker thread per concurrent chat
+        self.client = AsyncOpenAI(api_key=self.api_key)
         self.model = "gpt-4o-mini"  # Using cost-effective model
 
         # Disable LangChain tracing completely
@@ -85,30 +163,59 @@ class ChatService:
         logger.info("LangSmith/LangChain tracing disabled - using direct OpenAI client")
 
     def get_context_summary(self) -> str:
-        """Get summary of available data for context"""
-        from app.models.schemas import (
-            PublixStore,
-            CompetitorStore,
-            Parcel,
-            Demographics,
-            Prediction,
-        )
-
-        total_stores = self.db.query(PublixStore).count()
-        total_competitors = self.db.query(CompetitorStore).count()
-        total_parcels = self.db.query(Parcel).count()
-        total_demographics = self.db.query(Demographics).count()
-        total_predictions = self.db.query(Prediction).count()
+        """Get summary of available data for context (cached for _CONTEXT_TTL)"""
+        cached = ChatService._context_cache
+        if cached is not None and time.monotonic() - cached[0] < self._CONTEXT_TTL:
+            return cached[1]
+
+        with ChatService._context_lock:
+            # Re-check under the lock: another request may have refreshed it
+            cached = ChatService._context_cache
+            if cached is not None and time.monotonic() - cached[0] < self._CONTEXT_TTL:
+                return cached[1]
+            context = self._build_context_summary()
+            ChatService._context_cache = (time.monotonic(), context)
+            return context
+
+    @classmethod
+    def invalidate_context(cls) -> None:
+        """Drop the cached context summary; call after bulk ingestion writes"""
+        cls._context_cache = None
+
+    def _build_context_summary(self) -> str:
+        """Compute the context summary from the database"""
+        # One round trip for all five table counts via scalar subqueries,
+        # instead of five sequential COUNT(*) queries per chat turn
+        def _count(model):
+            return select(func.count()).select_from(model).scalar_subquery()
+
+        (
+            total_stores,
+            total_competitors,
+            total_parcels,
+            total_demographics,
+            total_predictions,
+        ) = self.db.execute(
+            select(
+                _count(PublixStore),
+                _count(CompetitorStore),
+                _count(Parcel),
+                _count(Demographics),
+                _count(Prediction),
+            )
+        ).one()
 
-        # Get stores by state
+        # Get stores by state (top 5, counted server-side)
         stores_by_state = (
-            self.db.query(PublixStore.state, text("COUNT(*)"))
+            self.db.query(PublixStore.state, func.count())
             .group_by(PublixStore.state)
+            .order_by(func.count().desc())
+            .limit(5)
             .all()
         )
 
         states_summary = ", ".join(
-            [f"{state}: {count}" for state, count in stores_by_state[:5]]
+            [f"{state}: {count}" for state, count in stores_by_state]
         )
 
         context = f"""You are an AI assistant helping with Publix grocery store expansion analysis.
@@ -136,14 +243,6 @@ Be helpful, accurate, and cite specific numbers when available."""
     @traceable(name="chat_database_query")
     def query_database(self, query_type: str, params: Dict) -> Optional[List[Dict]]:
         """Query the database based on the query type"""
-        from app.models.schemas import (
-            PublixStore,
-            CompetitorStore,
-            Parcel,
-            Demographics,
-            Prediction,
-        )
-
         try:
             if query_type == "stores":
                 q = self.db.query(PublixStore)
@@ -213,7 +312,13 @@ Be helpful, accurate, and cite specific numbers when available."""
         return None
 
     @traceable(name="chat_llm_call")
-    def chat(self, user_message: str, conversation_history: List[Dict] = None) -> Dict:
+    async def chat(
+        self,
+        user_message: str,
+        conversation_history: List[Dict] = None,
+        stream: bool = False,
+        need_context: bool = True,
+    ):
         """
         Process a chat message and return AI response
         Traced with LangSmith for monitoring.
@@ -221,15 +326,25 @@ Be helpful, accurate, and cite specific numbers when available."""
         Args:
             user_message: User's question/message
             conversation_history: Previous messages in format [{"role": "user/assistant", "content": "..."}]
+            stream: When True, return a generator of token deltas instead of
+                waiting for the full completion — time-to-first-token drops
+                from the whole round trip to the first SSE chunk
+            need_context: When False, use the static base prompt and skip
+                the data context summary (and its queries) entirely
 
         Returns:
-            Dict with "response" and optionally "data" fields
+            Dict with "response" and optionally "data" fields, or a generator
+            of text deltas when stream=True
         """
         if conversation_history is None:
             conversation_history = []
 
-        # Get context about available data
-        context = self.get_context_summary()
+        # Get context about available data (unless the caller determined
+        # this turn doesn't reference the data)
+        if need_context:
+            context = self.get_context_summary()
+        else:
+            context = self._BASE_SYSTEM_PROMPT
 
         # Build system message
         system_message = {
@@ -249,7 +364,19 @@ Be helpful, accurate, and cite specific numbers when available."""
             # Use direct OpenAI client (LangChain/LangSmith disabled)
             # COMMENTED OUT: LangChain ChatOpenAI automatically traces to LangSmith
             # Using direct OpenAI client to avoid LangSmith 403 errors
-            response = self.client.chat.completions.create(
+            if stream:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=500,
+                    stream=True,
+                )
+                return self._stream_deltas(response)
+
+            # Non-streaming calls go through the coalescer so concurrent
+            # chats dispatch to the provider as one gathered burst
+            response = await self._coalesced_create(
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
@@ -264,64 +391,102 @@ Be helpful, accurate, and cite specific numbers when available."""
 
         except Exception as e:
             logger.error(f"OpenAI API error: {e}", exc_info=True)
+            if stream:
+                return self._error_stream(str(e))
             return {
                 "response": f"I apologize, but I encountered an error: {str(e)}",
                 "error": True,
             }
 
+    async def _coalesced_create(self, **kwargs):
+        """Submit a completion call through the shared micro-batch queue"""
+        cls = ChatService
+        loop = asyncio.get_running_loop()
+        # Lazily (re)start the dispatcher; the queue is bound to the running
+        # loop, so a new loop (tests, reload) gets a fresh queue and task
+        if cls._coalesce_queue is None or cls._coalesce_loop is not loop:
+            cls._coalesce_queue = asyncio.Queue()
+            cls._coalesce_loop = loop
+            cls._coalesce_task = loop.create_task(
+                cls._coalesce_worker(cls._coalesce_queue)
+            )
+
+        future = loop.create_future()
+        await cls._coalesce_queue.put(
+            (lambda: self.client.chat.completions.create(**kwargs), future)
+        )
+        return await future
+
+    @classmethod
+    async def _coalesce_worker(cls, queue: asyncio.Queue):
+        """Collect requests for up to _COALESCE_WINDOW and fire them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + cls._COALESCE_WINDOW
+            while len(batch) < cls._COALESCE_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *(make_call() for make_call, _ in batch), return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    @staticmethod
+    async def _stream_deltas(response):
+        """Yield token deltas from an OpenAI streaming response"""
+        async for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    @staticmethod
+    async def _error_stream(message: str):
+        """Single-delta stream used when the streaming call itself fails"""
+        yield f"I apologize, but I encountered an error: {message}"
+
     @traceable(name="chat_with_data")
-    def chat_with_data(
-        self, user_message: str, conversation_history: List[Dict] = None
-    ) -> Dict:
+    async def chat_with_data(
+        self,
+        user_message: str,
+        conversation_history: List[Dict] = None,
+        stream: bool = False,
+    ):
         """
         Enhanced chat that can query database and include results in response
         Traced with LangSmith for monitoring.
+
+        With stream=True the return value is the delta generator from chat();
+        the queried data is folded into the prompt but not echoed back.
         """
-        # Simple keyword-based query detection
+        # Simple keyword-based query detection (precompiled regexes).
+        # Querying requires a keyword AND a concrete state token: "tell me
+        # about stores" gets the context summary, "stores in FL" gets data,
+        # and a plain greeting skips the database entirely.
         query_type = None
         params = {}
 
-        user_lower = user_message.lower()
-
-        # Detect query type
-        if any(word in user_lower for word in ["store", "publix store", "location"]):
-            query_type = "stores"
-            # Extract state/city if mentioned
-            states = ["FL", "GA", "AL", "SC", "NC", "TN", "VA", "KY"]
-            for state in states:
-                if state.lower() in user_lower or state in user_message:
-                    params["state"] = state
-                    break
-
-        elif any(word in user_lower for word in ["parcel", "land", "property", "acre"]):
-            query_type = "parcels"
-            states = ["FL", "GA", "AL", "SC", "NC", "TN", "VA", "KY"]
-            for state in states:
-                if state.lower() in user_lower or state in user_message:
-                    params["state"] = state
-                    break
-
-        elif any(
-            word in user_lower
-            for word in ["demographic", "population", "income", "growth"]
-        ):
-            query_type = "demographics"
-            states = ["FL", "GA", "AL", "SC", "NC", "TN", "VA", "KY"]
-            for state in states:
-                if state.lower() in user_lower or state in user_message:
-                    params["state"] = state
-                    break
-
-        elif any(
-            word in user_lower
-            for word in ["prediction", "expand", "opportunity", "next"]
-        ):
-            query_type = "predictions"
-            states = ["FL", "GA", "AL", "SC", "NC", "TN", "VA", "KY"]
-            for state in states:
-                if state.lower() in user_lower or state in user_message:
-                    params["state"] = state
-                    break
+        keywords = self._KEYWORD_RE.findall(user_message)
+        need_context = bool(keywords)
+        if keywords:
+            state_match = self._STATE_RE.search(user_message)
+            if state_match:
+                params["state"] = state_match.group(1).upper()
+                query_type = min(
+                    (self._KEYWORD_TO_QUERY[k.lower()] for k in keywords),
+                    key=self._QUERY_PRIORITY.__getitem__,
+                )
 
         # Query database if needed
         data = None
@@ -334,7 +499,17 @@ Be helpful, accurate, and cite specific numbers when available."""
             enhanced_message += f"\n\nRelevant data: {str(data)[:500]}"
 
         # Get AI response
-        result = self.chat(enhanced_message, conversation_history)
+        if stream:
+            return await self.chat(
+                enhanced_message,
+                conversation_history,
+                stream=True,
+                need_context=need_context,
+            )
+
+        result = await self.chat(
+            enhanced_message, conversation_history, need_context=need_context
+        )
 
         # Add data to result
         if data:
@@ -2,12 +2,16 @@
 Economic Indicator Service - Collects economic data from BLS, FRED, and Census APIs
 """
 
+import asyncio
 import os
+import httpx
 import requests
 import logging
-from typing import List, Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import time
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -30,15 +34,74 @@ class EconomicService:
         # Census Business Patterns API
         self.census_business_url = "https://api.census.gov/data"
 
+        # One pooled session for every BLS/FRED/Census call: keep-alive reuse
+        # skips the TCP+TLS handshake per request, and transient 429/5xx
+        # responses retry with backoff instead of surfacing immediately
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+
+        # Unemployment changes at most daily; memoize per (state, county) so
+        # repeated city lookups in the same county skip the BLS round trip
+        self._unemployment_cache: Dict[Tuple[str, str], Optional[float]] = {}
+
+        # Async client for the per-city fetch fan-out, built lazily
+        self._aclient: Optional[httpx.AsyncClient] = None
+
         self.available = True  # BLS is free, others optional
         logger.info("Economic service initialized")
 
+    def _async_client(self) -> httpx.AsyncClient:
+        """Lazily build the shared httpx client for the async fetchers"""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=10,
+            )
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client's connections, if one was created"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def get_economic_indicators(
         self, city: str, state: str, county: Optional[str] = None
     ) -> Dict:
         """
         Get comprehensive economic indicators for a city/county
 
+        Synchronous facade over get_economic_indicators_async for callers
+        outside an event loop (the data collection agent).
+
+        Args:
+            city: City name
+            state: State abbreviation
+            county: Optional county name
+
+        Returns:
+            Dictionary with economic indicators
+        """
+        return asyncio.run(self.get_economic_indicators_async(city, state, county))
+
+    async def get_economic_indicators_async(
+        self, city: str, state: str, county: Optional[str] = None
+    ) -> Dict:
+        """
+        Async variant of get_economic_indicators: the four upstream fetches
+        are independent, so they run concurrently instead of back to back
+
         Args:
             city: City name
             state: State abbreviation
@@ -53,87 +116,90 @@ class EconomicService:
             "county": county,
         }
 
-        # Get unemployment data (if county available)
-        if county:
-            unemployment = self._get_unemployment_rate(state, county)
-            if unemployment:
-                indicators["unemployment_rate"] = unemployment
+        async def _no_county() -> None:
+            return None
 
-        # Get employment data
-        employment = self._get_employment_data(state, county)
-        if employment:
+        unemployment, employment, wages, retail = await asyncio.gather(
+            # Unemployment needs a county; skip the fetch without one
+            self._get_unemployment_rate(state, county) if county else _no_county(),
+            self._get_employment_data(state, county),
+            self._get_wage_data(state, county),
+            self._get_retail_data(city, state),
+            return_exceptions=True,
+        )
+
+        # One failed source should not void the others
+        if isinstance(unemployment, BaseException):
+            logger.debug(f"Error getting unemployment rate: {unemployment}")
+        elif unemployment:
+            indicators["unemployment_rate"] = unemployment
+
+        if isinstance(employment, BaseException):
+            logger.debug(f"Error getting employment data: {employment}")
+        elif employment:
             indicators.update(employment)
 
-        # Get wage data
-        wages = self._get_wage_data(state, county)
-        if wages:
+        if isinstance(wages, BaseException):
+            logger.debug(f"Error getting wage data: {wages}")
+        elif wages:
             indicators.update(wages)
 
-        # Get retail sales data (from Census Business Patterns)
-        retail = self._get_retail_data(city, state)
-        if retail:
+        if isinstance(retail, BaseException):
+            logger.debug(f"Error getting retail data: {retail}")
+        elif retail:
             indicators.update(retail)
 
         return indicators
 
-    def _get_unemployment_rate(self, state: str, county: str) -> Optional[float]:
-        """Get unemployment rate from BLS API"""
-        try:
-            # BLS requires specific series IDs - this is simplified
-            # In production, you'd need to map counties to BLS series IDs
-            # For now, return None (would need proper series ID mapping)
-            logger.debug("Unemployment rate lookup requires BLS series ID mapping")
-            return None
-        except Exception as e:
-            logger.debug(f"Error getting unemployment rate: {e}")
-            return None
+    async def _get_unemployment_rate(self, state: str, county: str) -> Optional[float]:
+        """Get unemployment rate from BLS API (memoized per state/county)"""
+        cache_key = (state, county)
+        if cache_key in self._unemployment_cache:
+            return self._unemployment_cache[cache_key]
+
+        # BLS requires specific series IDs - this is simplified
+        # In production, you'd call self._async_client() with the mapped
+        # series ID; for now, return None (would need proper series mapping)
+        logger.debug("Unemployment rate lookup requires BLS series ID mapping")
+        rate = None
 
-    def _get_employment_data(
+        self._unemployment_cache[cache_key] = rate
+        return rate
+
+    async def _get_employment_data(
         self, state: str, county: Optional[str] = None
     ) -> Optional[Dict]:
         """Get employment growth data"""
-        try:
-            # Simplified - would use BLS or FRED APIs with proper series IDs
-            # For now, return placeholder structure
-            return {
-                "employment_growth_rate": None,  # Would calculate from time series
-                "business_establishments": None,  # From Census Business Patterns
-                "new_business_formations": None,  # From Census or state data
-            }
-        except Exception as e:
-            logger.debug(f"Error getting employment data: {e}")
-            return None
+        # Simplified - would use BLS or FRED APIs (via self._async_client())
+        # with proper series IDs. For now, return placeholder structure
+        return {
+            "employment_growth_rate": None,  # Would calculate from time series
+            "business_establishments": None,  # From Census Business Patterns
+            "new_business_formations": None,  # From Census or state data
+        }
 
-    def _get_wage_data(
+    async def _get_wage_data(
         self, state: str, county: Optional[str] = None
     ) -> Optional[Dict]:
         """Get wage data from BLS"""
-        try:
-            # Simplified - would use BLS Occupational Employment Statistics
-            # For now, return placeholder structure
-            return {
-                "average_wage": None,  # Would get from BLS OES
-                "median_wage": None,  # Would get from BLS OES
-            }
-        except Exception as e:
-            logger.debug(f"Error getting wage data: {e}")
-            return None
+        # Simplified - would use BLS Occupational Employment Statistics
+        # For now, return placeholder structure
+        return {
+            "average_wage": None,  # Would get from BLS OES
+            "median_wage": None,  # Would get from BLS OES
+        }
 
-    def _get_retail_data(self, city: str, state: str) -> Optional[Dict]:
+    async def _get_retail_data(self, city: str, state: str) -> Optional[Dict]:
         """Get retail sales data from Census Business Patterns"""
         if not self.census_api_key:
             return None
 
-        try:
-            # Census Business Patterns API
-            # Would need proper geography codes (FIPS)
-            # This is a placeholder structure
-            return {
-                "retail_sales_per_capita": None,  # Would calculate from Census BP data
-            }
-        except Exception as e:
-            logger.debug(f"Error getting retail data: {e}")
-            return None
+        # Census Business Patterns API
+        # Would need proper geography codes (FIPS)
+        # This is a placeholder structure
+        return {
+            "retail_sales_per_capita": None,  # Would calculate from Census BP data
+        }
 
     def get_county_economic_data(self, county: str, state: str) -> Dict:
         """
@@ -3,11 +3,18 @@ Expansion analyzer for identifying historical patterns and predicting future exp
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Callable, Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from app.models.schemas import Demographics, PublixStore
+from app.services.analytics_service import AnalyticsService
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +22,35 @@ logger = logging.getLogger(__name__)
 class ExpansionAnalyzer:
     """Analyzer for Publix expansion patterns and predictions"""
 
+    # Prediction/market-comparison results cache, shared across the
+    # per-request instances like ChatService._context_cache: both entry
+    # points run heavy scans over data that changes at most daily, so
+    # repeated chat-UI queries within the TTL reuse the computed result.
+    # The data collector invalidates on re-ingestion.
+    _result_cache: Dict[tuple, tuple] = {}
+    _cache_lock = threading.Lock()
+    _CACHE_TTL = 3600.0
+
     def __init__(self, db: Session):
         self.db = db
 
+    @classmethod
+    def invalidate_caches(cls) -> None:
+        """Drop cached analysis results; call after bulk ingestion writes"""
+        with cls._cache_lock:
+            cls._result_cache.clear()
+
+    def _cached(self, key: tuple, compute: Callable):
+        """Return the cached value for key, recomputing after _CACHE_TTL"""
+        with ExpansionAnalyzer._cache_lock:
+            hit = ExpansionAnalyzer._result_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self._CACHE_TTL:
+                return hit[1]
+        value = compute()
+        with ExpansionAnalyzer._cache_lock:
+            ExpansionAnalyzer._result_cache[key] = (time.monotonic(), value)
+        return value
+
     def analyze_expansion_timeline(self, state: str) -> Dict:
         """
         Analyze expansion timeline for a state
@@ -28,55 +61,52 @@ class ExpansionAnalyzer:
         Returns:
             Dictionary with expansion timeline data
         """
-        from app.models.schemas import PublixStore
-
-        stores = (
-            self.db.query(PublixStore)
+        # Aggregate in SQL: two grouped queries move O(years + cities) rows
+        # over the wire instead of every store row in the state
+        year_counts = (
+            self.db.query(
+                func.extract("year", PublixStore.opening_date).label("year"),
+                func.count(),
+            )
             .filter_by(state=state)
             .filter(PublixStore.opening_date.isnot(None))
-            .order_by(PublixStore.opening_date)
+            .group_by("year")
             .all()
         )
 
-        if not stores:
+        if not year_counts:
             return {"error": "No stores with opening dates found"}
 
-        # Group by year
-        stores_by_year = defaultdict(list)
-        cities_entered = {}
-        first_store_date = None
-
-        for store in stores:
-            if store.opening_date:
-                year = store.opening_date.year
-                stores_by_year[year].append(store)
-
-                # Track first store in each city
-                city_key = f"{store.city},{store.state}"
-                if city_key not in cities_entered:
-                    cities_entered[city_key] = store.opening_date
+        city_first_dates = (
+            self.db.query(PublixStore.city, func.min(PublixStore.opening_date))
+            .filter_by(state=state)
+            .filter(PublixStore.opening_date.isnot(None))
+            .group_by(PublixStore.city)
+            .yield_per(2000)
+        )
 
-                if not first_store_date or store.opening_date < first_store_date:
-                    first_store_date = store.opening_date
+        stores_by_year = {int(year): count for year, count in year_counts}
+        cities_entered = {
+            f"{city},{state}": first_date for city, first_date in city_first_dates
+        }
+        first_store_date = min(cities_entered.values())
+        total_stores = sum(stores_by_year.values())
 
         # Calculate expansion velocity
         years = sorted(stores_by_year.keys())
         if len(years) > 1:
             total_years = years[-1] - years[0] + 1
-            total_stores = len(stores)
             stores_per_year = total_stores / total_years if total_years > 0 else 0
         else:
-            stores_per_year = len(stores)
+            stores_per_year = total_stores
 
         return {
             "state": state,
             "first_store_date": (
                 first_store_date.isoformat() if first_store_date else None
             ),
-            "total_stores": len(stores),
-            "stores_by_year": {
-                year: len(stores_list) for year, stores_list in stores_by_year.items()
-            },
+            "total_stores": total_stores,
+            "stores_by_year": stores_by_year,
             "cities_entered": len(cities_entered),
             "expansion_velocity": round(stores_per_year, 2),
             "cities_entry_sequence": {
@@ -92,15 +122,88 @@ class ExpansionAnalyzer:
         Returns:
             Dictionary with expansion patterns
         """
-        from app.models.schemas import PublixStore
-
         # Get all states with stores
-        states = self.db.query(PublixStore.state).distinct().all()
+        states = [s for (s,) in self.db.query(PublixStore.state).distinct().all()]
+
+        # One scan grouped by (state, year, city) replaces the two grouped
+        # queries analyze_expansion_timeline would issue per state.
+        query = (
+            self.db.query(
+                PublixStore.state,
+                func.extract("year", PublixStore.opening_date).label("year"),
+                PublixStore.city,
+                func.count(),
+                func.min(PublixStore.opening_date),
+            )
+            .filter(PublixStore.opening_date.isnot(None))
+            .group_by(PublixStore.state, "year", PublixStore.city)
+        )
+
+        bind = self.db.get_bind()
+        if bind.dialect.name == "postgresql":
+            # Fetch through the raw DBAPI cursor: psycopg2 already returns
+            # native str/int/datetime values for these columns, so skipping
+            # SQLAlchemy's per-row adaptation trims the dominant Python
+            # cost of this repo-wide scan
+            sql = str(
+                query.statement.compile(
+                    dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+            cursor = self.db.connection().connection.cursor()
+            try:
+                cursor.execute(sql)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        else:
+            # Other dialects (sqlite in tests) keep the streamed ORM path
+            rows = query.yield_per(2000)
+
+        rows_by_state = defaultdict(list)
+        for state, year, city, count, first_date in rows:
+            rows_by_state[state].append((int(year), city, count, first_date))
 
         patterns = {}
-        for (state,) in states:
-            timeline = self.analyze_expansion_timeline(state)
-            patterns[state] = timeline
+        for state in states:
+            state_rows = rows_by_state.get(state)
+            if not state_rows:
+                patterns[state] = {"error": "No stores with opening dates found"}
+                continue
+
+            # Counter sums the grouped counts per year; no per-store
+            # objects are ever held here
+            stores_by_year = Counter()
+            cities_entered = {}
+            for year, city, count, first_date in state_rows:
+                stores_by_year[year] += count
+                city_key = f"{city},{state}"
+                if city_key not in cities_entered or first_date < cities_entered[city_key]:
+                    cities_entered[city_key] = first_date
+
+            total_stores = sum(stores_by_year.values())
+            first_store_date = min(cities_entered.values())
+            years = sorted(stores_by_year)
+            if len(years) > 1:
+                total_years = years[-1] - years[0] + 1
+                stores_per_year = total_stores / total_years if total_years > 0 else 0
+            else:
+                stores_per_year = total_stores
+
+            patterns[state] = {
+                "state": state,
+                "first_store_date": first_store_date.isoformat(),
+                "total_stores": total_stores,
+                "stores_by_year": dict(stores_by_year),
+                "cities_entered": len(cities_entered),
+                "expansion_velocity": round(stores_per_year, 2),
+                "cities_entry_sequence": {
+                    city: date.isoformat()
+                    for city, date in sorted(
+                        cities_entered.items(), key=lambda x: x[1]
+                    )
+                },
+            }
 
         # Classify states by maturity
         maturity_classification = {}
@@ -127,6 +230,7 @@ class ExpansionAnalyzer:
     def predict_next_expansion_cities(self, state: str, top_n: int = 10) -> List[Dict]:
         """
         Predict which cities Publix is likely to expand into next
+        (cached per (state, top_n) for _CACHE_TTL)
 
         Args:
             state: State abbreviation
@@ -135,13 +239,20 @@ class ExpansionAnalyzer:
         Returns:
             List of predicted cities with reasoning
         """
-        from app.models.schemas import Demographics
-        from app.services.analytics_service import AnalyticsService
+        return self._cached(
+            ("predict", state, top_n),
+            lambda: self._predict_next_expansion_cities(state, top_n),
+        )
 
+    def _predict_next_expansion_cities(self, state: str, top_n: int) -> List[Dict]:
+        """Uncached body of predict_next_expansion_cities"""
         analytics = AnalyticsService(self.db)
 
-        # Get expansion opportunities
-        opportunities = analytics.identify_expansion_opportunities(state)
+        # Get expansion opportunities; fetch extra headroom so filtering out
+        # cities that already have stores still leaves top_n candidates
+        opportunities = analytics.identify_expansion_opportunities(
+            state, limit=max(top_n * 2, 20)
+        )
 
         # Enhance with historical patterns
         timeline = self.analyze_expansion_timeline(state)
@@ -150,21 +261,45 @@ class ExpansionAnalyzer:
             for city in timeline.get("cities_entry_sequence", {}).keys()
         )
 
+        candidates = opportunities[:top_n]
+        if not candidates:
+            return []
+
+        # Score all candidates at once: vectorized compares replace the
+        # per-row dict lookups and branches of the old loop
+        saturation = np.fromiter(
+            (o["saturation_score"] for o in candidates), dtype=np.float32
+        )
+        population = np.fromiter(
+            (o["population"] for o in candidates), dtype=np.float64
+        )
+        per_100k = np.fromiter(
+            (o["stores_per_100k"] for o in candidates), dtype=np.float32
+        )
+        opp_score = np.fromiter(
+            (o["opportunity_score"] for o in candidates), dtype=np.float64
+        )
+
+        low_saturation = saturation < 0.3
+        large_population = population > 100000
+        under_served = per_100k < 1.0
+        confidence = np.minimum(opp_score * 1.2, 1.0)
+
         predictions = []
-        for opp in opportunities[:top_n]:
+        for i, opp in enumerate(candidates):
             city = opp["city"]
 
             # Skip if already has stores
             if city in existing_cities:
                 continue
 
-            # Build reasoning
+            # Build reasoning from the precomputed masks
             reasoning_factors = []
-            if opp["saturation_score"] < 0.3:
+            if low_saturation[i]:
                 reasoning_factors.append("Low market saturation")
-            if opp["population"] > 100000:
+            if large_population[i]:
                 reasoning_factors.append("Large population base")
-            if opp["stores_per_100k"] < 1.0:
+            if under_served[i]:
                 reasoning_factors.append("Under-served market")
 
             predictions.append(
@@ -175,7 +310,7 @@ class ExpansionAnalyzer:
                     "current_stores": opp["publix_stores"],
                     "opportunity_score": opp["opportunity_score"],
                     "reasoning_factors": reasoning_factors,
-                    "confidence": min(opp["opportunity_score"] * 1.2, 1.0),
+                    "confidence": float(confidence[i]),
                 }
             )
 
@@ -184,6 +319,7 @@ class ExpansionAnalyzer:
     def compare_to_similar_markets(self, target_city: str, target_state: str) -> Dict:
         """
         Compare target city to similar markets where Publix has expanded
+        (cached per (target_city, target_state) for _CACHE_TTL)
 
         Args:
             target_city: City to analyze
@@ -192,9 +328,13 @@ class ExpansionAnalyzer:
         Returns:
             Dictionary with comparison data
         """
-        from app.models.schemas import Demographics, PublixStore
-        from app.services.analytics_service import AnalyticsService
+        return self._cached(
+            ("compare", target_city, target_state),
+            lambda: self._compare_to_similar_markets(target_city, target_state),
+        )
 
+    def _compare_to_similar_markets(self, target_city: str, target_state: str) -> Dict:
+        """Uncached body of compare_to_similar_markets"""
         analytics = AnalyticsService(self.db)
 
         # Get target city demographics
@@ -207,37 +347,51 @@ class ExpansionAnalyzer:
         if not target_demo or not target_demo.population:
             return {"error": "No demographics data for target city"}
 
-        # Find similar cities (similar population, same state or adjacent states)
+        # Find similar cities (similar population, same state or adjacent
+        # states). Only three columns are read, so fetch tuples and stream
+        # them instead of materializing full ORM rows for every match.
+        pop_lo = target_demo.population * 0.7
+        pop_hi = target_demo.population * 1.3
         similar_cities = (
-            self.db.query(Demographics)
-            .filter(
-                Demographics.population.between(
-                    target_demo.population * 0.7, target_demo.population * 1.3
-                )
+            self.db.query(
+                Demographics.city, Demographics.state, Demographics.population
             )
-            .all()
+            .filter(Demographics.population.between(pop_lo, pop_hi))
+            .yield_per(1000)
         )
 
-        # Get Publix presence in similar cities
-        comparisons = []
-        for city_demo in similar_cities:
-            store_count = (
-                self.db.query(PublixStore)
-                .filter_by(city=city_demo.city, state=city_demo.state)
-                .count()
+        # Get Publix presence in similar cities: one join + GROUP BY instead
+        # of a COUNT(*) round trip per city
+        store_counts = {
+            (city, state): count
+            for city, state, count in (
+                self.db.query(PublixStore.city, PublixStore.state, func.count())
+                .join(
+                    Demographics,
+                    and_(
+                        Demographics.city == PublixStore.city,
+                        Demographics.state == PublixStore.state,
+                    ),
+                )
+                .filter(Demographics.population.between(pop_lo, pop_hi))
+                .group_by(PublixStore.city, PublixStore.state)
+                .all()
             )
+        }
+
+        comparisons = []
+        for city, state, population in similar_cities:
+            store_count = store_counts.get((city, state), 0)
 
             if store_count > 0:  # Only include cities with Publix
                 comparisons.append(
                     {
-                        "city": city_demo.city,
-                        "state": city_demo.state,
-                        "population": city_demo.population,
+                        "city": city,
+                        "state": state,
+                        "population": population,
                         "publix_stores": store_count,
                         "stores_per_100k": (
-                            store_count / city_demo.population * 100000
-                            if city_demo.population > 0
-                            else 0
+                            store_count / population * 100000 if population > 0 else 0
                         ),
                     }
                 )
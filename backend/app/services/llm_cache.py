@@ -0,0 +1,90 @@
+"""Response cache for deterministic LLM calls
+
+Temperature-0 completions are reproducible, so re-running a pipeline on
+the same inputs (municipal code extraction, impact fee parsing) can skip
+the model entirely. Keys are a sha256 over model + messages + response
+format; values are the raw completion text. Backed by Redis when
+REDIS_URL is set, with an in-process LRU in front of (or instead of) it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from cachetools import LRUCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+_REDIS_TTL = 7 * 24 * 3600  # prompts rarely change week to week
+
+
+class LLMCache:
+    """Two-tier (local LRU + optional Redis) cache for completion text"""
+
+    def __init__(self, maxsize: int = 2048, redis_url: Optional[str] = None):
+        self.stats = {"hits": 0, "misses": 0}
+        self._local: LRUCache = LRUCache(maxsize=maxsize)
+
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        if redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(redis_url)
+        else:
+            if redis_url:
+                logger.warning(
+                    "REDIS_URL set but redis package not installed; "
+                    "LLM cache is in-memory only"
+                )
+            self._redis = None
+
+    @staticmethod
+    def key_for(
+        model: str,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict] = None,
+    ) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "rf": response_format},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._local.get(key)
+        if value is None and self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+            except Exception as e:
+                logger.debug("LLM cache redis get failed: %s", e)
+                raw = None
+            if raw is not None:
+                value = raw.decode() if isinstance(raw, bytes) else raw
+                self._local[key] = value
+
+        if value is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+
+        lookups = self.stats["hits"] + self.stats["misses"]
+        if lookups % 100 == 0:
+            logger.info(
+                "LLM cache hit rate: %.1f%% over %d lookups",
+                100.0 * self.stats["hits"] / lookups,
+                lookups,
+            )
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._local[key] = value
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, value, ex=_REDIS_TTL)
+            except Exception as e:
+                logger.debug("LLM cache redis set failed: %s", e)
@@ -0,0 +1,241 @@
+"""Rate-limited parallel dispatcher for OpenAI chat completions
+
+Keeps bulk agent runs under the account's requests-per-minute and
+tokens-per-minute ceilings instead of tripping 429s and retrying
+serially. Modeled on OpenAI's api_request_parallel_processor: a queue
+of pending requests, capacities that refill with elapsed wall time, and
+exponential backoff re-queueing on rate-limit errors.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional, langchain-openai ships it
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Cached tiktoken encodings per model; False marks models whose encoding
+# could not be loaded (unknown name, or the BPE download failed offline)
+_encodings: Dict[str, Any] = {}
+
+
+def get_encoding(model: str):
+    """Return the cached tiktoken encoding for model, or None.
+
+    None means tiktoken is absent or the encoding couldn't be loaded;
+    callers should fall back to a character-based heuristic.
+    """
+    if tiktoken is None:
+        return None
+    encoding = _encodings.get(model)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except Exception:
+            # Unknown model, or tiktoken couldn't fetch its BPE table
+            # (first use downloads it) — fall back for good
+            encoding = False
+        _encodings[model] = encoding
+    return encoding or None
+
+
+@dataclass
+class APIRequest:
+    """One pending chat completion waiting for dispatch capacity"""
+
+    messages: List[Dict[str, str]]
+    kwargs: Dict[str, Any]
+    token_estimate: int
+    retries_left: int
+    future: asyncio.Future = field(repr=False)
+
+
+class ParallelLLMDispatcher:
+    """Throttle concurrent LLM calls to RPM/TPM budgets with retry.
+
+    Requests submitted while capacity is available dispatch immediately
+    and run concurrently; the rest queue until enough of both budgets
+    has refilled. A 429 from the provider drains the remaining capacity
+    (the account ceiling has been hit regardless of our bookkeeping) and
+    re-queues the request with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        call: Callable,
+        max_requests_per_minute: int = 500,
+        max_tokens_per_minute: int = 150_000,
+        max_retries: int = 5,
+    ):
+        self._call = call
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_retries = max_retries
+
+        self._request_capacity = float(max_requests_per_minute)
+        self._token_capacity = float(max_tokens_per_minute)
+        self._last_refill = time.monotonic()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task = None
+        self._loop = None
+        self._inflight = set()
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict[str, str]], model: str) -> int:
+        """Rough token count for TPM accounting (exactness not required)"""
+        text = json.dumps(messages)
+        encoding = get_encoding(model)
+        if encoding is not None:
+            return len(encoding.encode(text))
+        # ~4 chars per token is close enough for budget bookkeeping
+        return len(text) // 4
+
+    async def submit(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Queue a completion call and await its result"""
+        loop = asyncio.get_running_loop()
+        # The queue and worker are bound to the running loop; rebuild on a
+        # new loop (each asyncio.run from the sync facades starts one)
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker_task = loop.create_task(self._worker(self._queue))
+
+        request = APIRequest(
+            messages=messages,
+            kwargs=kwargs,
+            token_estimate=self.estimate_tokens(
+                messages, kwargs.get("model", "gpt-4-turbo-preview")
+            ),
+            retries_left=self.max_retries,
+            future=loop.create_future(),
+        )
+        await self._queue.put(request)
+        return await request.future
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_capacity = min(
+            self._request_capacity + self.max_requests_per_minute * elapsed / 60.0,
+            float(self.max_requests_per_minute),
+        )
+        self._token_capacity = min(
+            self._token_capacity + self.max_tokens_per_minute * elapsed / 60.0,
+            float(self.max_tokens_per_minute),
+        )
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """Pop requests as capacity allows and dispatch them concurrently"""
+        while True:
+            request = await queue.get()
+            while True:
+                self._refill()
+                if (
+                    self._request_capacity >= 1
+                    and self._token_capacity >= request.token_estimate
+                ):
+                    break
+                await asyncio.sleep(0.05)
+
+            self._request_capacity -= 1
+            self._token_capacity -= request.token_estimate
+            task = asyncio.get_running_loop().create_task(self._dispatch(request))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, request: APIRequest) -> None:
+        try:
+            result = await self._call(request.messages, **request.kwargs)
+        except Exception as e:
+            if self._is_rate_limit(e) and request.retries_left > 0:
+                request.retries_left -= 1
+                attempt = self.max_retries - request.retries_left
+                # Our bookkeeping was optimistic — the ceiling is hit
+                self._request_capacity = 0.0
+                self._token_capacity = min(
+                    self._token_capacity, float(self.max_tokens_per_minute) * 0.1
+                )
+                backoff = min(2.0**attempt, 30.0)
+                logger.warning(
+                    "LLM rate limited; retrying in %.1fs (%d retries left)",
+                    backoff,
+                    request.retries_left,
+                )
+                await asyncio.sleep(backoff)
+                await self._queue.put(request)
+                return
+            if not request.future.cancelled():
+                request.future.set_exception(e)
+        else:
+            if not request.future.cancelled():
+                request.future.set_result(result)
+
+    @staticmethod
+    def _is_rate_limit(error: Exception) -> bool:
+        text = str(error).lower()
+        return "429" in text or "rate limit" in text or "rate_limit" in text
+
+
+class LLMBatcher:
+    """Coalesce concurrent completion calls into shared gather batches.
+
+    Calls arriving within a short window ship as one asyncio.gather, so a
+    burst of agent requests pays a single scheduler pass instead of one
+    event-loop round trip each. Same shape as the chat service's request
+    coalescer; a lone request waits at most the window.
+    """
+
+    def __init__(self, window: float = 0.02, max_batch: int = 32):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task = None
+        self._loop = None
+
+    async def submit(self, factory: Callable[[], Any]) -> Any:
+        """Queue a zero-arg coroutine factory and await its result"""
+        loop = asyncio.get_running_loop()
+        # Queue and worker are bound to the running loop; rebuild on a new
+        # loop (each asyncio.run from the sync facades starts one)
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker_task = loop.create_task(self._worker(self._queue))
+        future = loop.create_future()
+        self._queue.put_nowait((factory, future))
+        return await future
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            items = [await queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(items) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(
+                        await asyncio.wait_for(queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *(factory() for factory, _ in items), return_exceptions=True
+            )
+            for (_, future), result in zip(items, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
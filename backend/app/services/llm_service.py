@@ -1,11 +1,13 @@
 """OpenAI LLM service with LangSmith integration"""
 
+import asyncio
 import os
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import AsyncIterator, List, Dict, Any, Optional
+
+import httpx
+from openai import AsyncOpenAI
 
 # from langsmith import traceable  # COMMENTED OUT: LangSmith causing 403 errors
-from langchain_openai import ChatOpenAI
 
 
 # No-op decorator to replace @traceable
@@ -16,24 +18,69 @@ def traceable(name=None):
     return decorator
 
 
-from langchain_core.messages import HumanMessage, SystemMessage
 import json
 
 openai_client = None
+_client_loop = None
 llm = None
 
-def _get_openai_client():
-    global openai_client
-    if openai_client is None:
+# Shared HTTP tuning for every OpenAI client in the app: generous
+# keep-alive so agent fan-out reuses TLS connections instead of
+# re-handshaking per call, and a connect timeout far shorter than the
+# read timeout (completions are slow; connects should not be)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=60
+)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Opt-in RPM/TPM throttling for bulk agent runs (see llm_dispatcher.py)
+_LLM_PARALLEL = os.getenv("LLM_PARALLEL", "").lower() in ("1", "true", "yes")
+# Opt-in 20ms coalescing of concurrent calls into shared gather batches
+_LLM_COALESCE = os.getenv("LLM_COALESCE", "").lower() in ("1", "true", "yes")
+_dispatcher = None
+_batcher = None
+_response_cache = None
+
+
+def _get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        from app.services.llm_cache import LLMCache
+
+        _response_cache = LLMCache()
+    return _response_cache
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Lazily build the shared AsyncOpenAI client.
+
+    The underlying httpx pool is bound to the loop that created it, so the
+    client is rebuilt whenever the running loop changes (each asyncio.run
+    from the sync facades starts a fresh loop).
+    """
+    global openai_client, _client_loop
+    loop = asyncio.get_running_loop()
+    if openai_client is None or _client_loop is not loop:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        openai_client = OpenAI(api_key=api_key)
+        openai_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        )
+        _client_loop = loop
     return openai_client
 
+
 def _get_llm():
     global llm
     if llm is None:
+        # Deferred: langchain pulls in pydantic-v1 compat shims and adds
+        # a few hundred ms to cold import, and nothing on the call_llm
+        # path touches it
+        from langchain_openai import ChatOpenAI
+
+
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
@@ -45,17 +92,74 @@ def _get_llm():
     return llm
 
 
-@traceable(name="llm_call")
-def call_llm(
+def _scan_json_progress(
+    chunk: str, depth: int, in_string: bool, escape: bool, started: bool
+):
+    """Advance a brace-depth scan over one streamed text delta.
+
+    Tracks string/escape state so braces inside JSON strings don't count.
+    The document is complete once started is True and depth is back to 0.
+    """
+    for ch in chunk:
+        if escape:
+            escape = False
+        elif in_string:
+            if ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+            started = True
+        elif ch in "}]":
+            depth -= 1
+    return depth, in_string, escape, started
+
+
+async def _call_llm_direct(
     messages: List[Dict[str, str]],
     model: str = "gpt-4-turbo-preview",
     temperature: float = 0.7,
     response_format: Optional[Dict] = None,
 ) -> str:
-    """Call OpenAI API with LangSmith tracing"""
+    """Issue one completion call without dispatcher throttling.
+
+    json_object requests are streamed: deltas accumulate while a brace-depth
+    scan watches for the top-level object to close, and the stream is shut
+    down the moment it does instead of waiting out any trailing tokens.
+    """
     try:
-        client = _get_openai_client()
-        response = client.chat.completions.create(
+        client = _get_async_client()
+        if response_format and response_format.get("type") == "json_object":
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                response_format=response_format,
+                stream=True,
+            )
+            parts = []
+            depth, in_string, escape, started = 0, False, False, False
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    depth, in_string, escape, started = _scan_json_progress(
+                        delta, depth, in_string, escape, started
+                    )
+                    if started and depth <= 0:
+                        break
+            finally:
+                await stream.close()
+            return "".join(parts)
+
+        response = await client.chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -66,14 +170,140 @@ def call_llm(
         raise Exception(f"LLM call failed: {str(e)}")
 
 
+@traceable(name="llm_call")
+async def call_llm_async(
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4-turbo-preview",
+    temperature: float = 0.7,
+    response_format: Optional[Dict] = None,
+) -> str:
+    """Call OpenAI API with LangSmith tracing (async).
+
+    With LLM_PARALLEL set, calls route through the shared rate-limited
+    dispatcher so concurrent agent runs stay under the account's
+    RPM/TPM ceilings instead of tripping 429s.
+
+    Deterministic calls (temperature == 0) are served from the response
+    cache when the same model/messages/format have been seen before.
+    """
+    cache = key = None
+    if temperature == 0:
+        from app.services.llm_cache import LLMCache
+
+        cache = _get_response_cache()
+        key = LLMCache.key_for(model, messages, response_format)
+        hit = await cache.get(key)
+        if hit is not None:
+            return hit
+
+    if _LLM_PARALLEL:
+        global _dispatcher
+        if _dispatcher is None:
+            from app.services.llm_dispatcher import ParallelLLMDispatcher
+
+            _dispatcher = ParallelLLMDispatcher(call=_call_llm_direct)
+        result = await _dispatcher.submit(
+            messages,
+            model=model,
+            temperature=temperature,
+            response_format=response_format,
+        )
+    elif _LLM_COALESCE:
+        # The dispatcher already schedules centrally, so coalescing only
+        # applies on the direct path
+        global _batcher
+        if _batcher is None:
+            from app.services.llm_dispatcher import LLMBatcher
+
+            _batcher = LLMBatcher()
+        result = await _batcher.submit(
+            lambda: _call_llm_direct(
+                messages,
+                model=model,
+                temperature=temperature,
+                response_format=response_format,
+            )
+        )
+    else:
+        result = await _call_llm_direct(
+            messages,
+            model=model,
+            temperature=temperature,
+            response_format=response_format,
+        )
+
+    if cache is not None:
+        await cache.set(key, result)
+    return result
+
+
+def call_llm(
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4-turbo-preview",
+    temperature: float = 0.7,
+    response_format: Optional[Dict] = None,
+) -> str:
+    """Synchronous facade over call_llm_async for the agent pipeline"""
+    return asyncio.run(
+        call_llm_async(
+            messages,
+            model=model,
+            temperature=temperature,
+            response_format=response_format,
+        )
+    )
+
+
+async def stream_llm_async(
+    messages: List[Dict[str, str]],
+    model: str = "gpt-4-turbo-preview",
+    temperature: float = 0.7,
+) -> AsyncIterator[str]:
+    """Yield response text deltas as they arrive.
+
+    For callers that can render incrementally (e.g. chat UIs) this cuts
+    time-to-first-token to one network round trip. Deterministic caching
+    and dispatcher throttling don't apply here; use call_llm_async when
+    the full response is needed anyway.
+    """
+    client = _get_async_client()
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+    )
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        await stream.close()
+
+
+async def call_llm_batch(
+    messages_list: List[List[Dict[str, str]]], **kwargs
+) -> List[Any]:
+    """Fan out independent LLM calls concurrently.
+
+    Total latency collapses from the sum of per-call round trips to
+    roughly the slowest one. Failed calls come back as exceptions in the
+    result list rather than aborting the batch.
+    """
+    return await asyncio.gather(
+        *(call_llm_async(messages, **kwargs) for messages in messages_list),
+        return_exceptions=True,
+    )
+
+
 @traceable(name="structured_llm_call")
-def call_llm_structured(
+async def call_llm_structured_async(
     system_prompt: str,
     user_prompt: str,
     model: str = "gpt-4-turbo-preview",
     temperature: float = 0.7,
 ) -> Dict[str, Any]:
-    """Call LLM with structured JSON response"""
+    """Call LLM with structured JSON response (async)"""
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
@@ -81,7 +311,7 @@ def call_llm_structured(
 
     response_format = {"type": "json_object"}
 
-    response = call_llm(
+    response = await call_llm_async(
         messages=messages,
         model=model,
         temperature=temperature,
@@ -94,6 +324,20 @@ def call_llm_structured(
         return {"error": "Failed to parse JSON response", "raw": response}
 
 
+def call_llm_structured(
+    system_prompt: str,
+    user_prompt: str,
+    model: str = "gpt-4-turbo-preview",
+    temperature: float = 0.7,
+) -> Dict[str, Any]:
+    """Synchronous facade over call_llm_structured_async"""
+    return asyncio.run(
+        call_llm_structured_async(
+            system_prompt, user_prompt, model=model, temperature=temperature
+        )
+    )
+
+
 def create_agent_prompt(
     agent_name: str, context: str, task: str
 ) -> List[Dict[str, str]]:
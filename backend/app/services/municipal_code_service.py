@@ -4,15 +4,75 @@ Municipal code service for extracting zoning regulations, setbacks, and parking
 Uses LLM to extract structured data from municipal code PDFs and websites
 """
 
+import asyncio
+import hashlib
+import json
+import io
 import os
 import logging
+import re
+import time
+import httpx
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
-import pdfplumber  # Would need: poetry add pdfplumber
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
 logger = logging.getLogger(__name__)
 
+# Fetched documents and probe results go stale; extracted text is keyed
+# by content hash so it never does
+_FETCH_TTL = 7 * 86400
+
+# Text beyond the LLM prompt cap is never used; stop reading pages a
+# little past it
+_PDF_TEXT_BUDGET = 8500
+
+# Batch jobs finish within this window or OpenAI expires them
+_BATCH_COMPLETION_WINDOW = "24h"
+_BATCH_MODEL = "gpt-4-turbo-preview"
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Prompt text budget in tokens (char slicing was ~2-3x off either way)
+_PROMPT_TOKEN_BUDGET = 6000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _clip_for_prompt(text: str, max_tokens: int = _PROMPT_TOKEN_BUDGET) -> str:
+    """Normalize whitespace and clip extracted text to a token budget.
+
+    Municipal PDFs are 30-50% whitespace runs, so the regex collapse alone
+    reclaims that share of the budget. Clipping by tokens instead of
+    text[:8000] stops dense legal text from blowing the context window and
+    whitespace-heavy text from wasting it; when the tokenizer is
+    unavailable the old character slice applies.
+    """
+    text = _WHITESPACE_RE.sub(" ", text)
+    from app.services.llm_dispatcher import get_encoding
+
+    encoding = get_encoding(_BATCH_MODEL)
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) > max_tokens:
+            text = encoding.decode(tokens[:max_tokens])
+        return text
+    return text[:8000]
+
 
 class MunicipalCodeService:
     """Service for extracting municipal zoning code data"""
@@ -26,6 +86,34 @@ class MunicipalCodeService:
             logger.warning("LLM service not available")
             self.call_llm = None
 
+        self._openai = None
+
+        # Persistent fetch/parse cache so scheduled re-runs and dev
+        # iteration skip re-downloading and re-parsing the same municipal
+        # documents. Optional, like requests-cache in the census service.
+        if diskcache is not None:
+            self._cache = diskcache.Cache(
+                os.getenv("MUNI_CACHE_PATH", "muni_cache"), size_limit=int(2e9)
+            )
+        else:
+            self._cache = None
+
+    def _openai_client(self):
+        """Lazily build the sync OpenAI client used for Batch API calls"""
+        if self._openai is None:
+            from openai import OpenAI
+
+            from app.services.llm_service import HTTP_LIMITS, HTTP_TIMEOUT
+
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY environment variable is not set")
+            self._openai = OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+            )
+        return self._openai
+
     def extract_zoning_code(
         self, city: str, state: str, source_url: Optional[str] = None
     ) -> Optional[Dict]:
@@ -83,49 +171,182 @@ class MunicipalCodeService:
             f"https://library.municode.com/{state.lower()}/{city.lower().replace(' ', '_')}",
         ]
 
-        for url in patterns:
-            try:
-                response = requests.head(url, timeout=5, allow_redirects=True)
-                if response.status_code == 200:
+        return self._probe_urls(patterns)
+
+    def _probe_urls(self, urls: List[str]) -> Optional[str]:
+        """HEAD-probe candidate URLs concurrently; first (by list order) 200 wins.
+
+        The serial loop paid up to len(urls) x 5s worst case; probing in
+        parallel caps discovery at one timeout. Winners persist in the
+        disk cache so repeat runs skip the probe round entirely.
+        """
+        cache_key = ("probe", hashlib.sha256("|".join(urls).encode()).hexdigest())
+        if self._cache is not None:
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        async def _probe_all() -> Optional[str]:
+            # Pool connections so probes against the same host (the .gov
+            # patterns share one) reuse a TCP/TLS session, and cap the
+            # fan-out if the pattern list ever grows
+            async with httpx.AsyncClient(
+                timeout=5,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            ) as client:
+
+                async def _head(url: str) -> bool:
+                    try:
+                        response = await client.head(url)
+                        return response.status_code == 200
+                    except httpx.HTTPError:
+                        return False
+
+                results = await asyncio.gather(*(_head(u) for u in urls))
+            for url, ok in zip(urls, results):
+                if ok:
                     return url
-            except:
-                continue
+            return None
 
-        return None
+        winner = asyncio.run(_probe_all())
+        if winner and self._cache is not None:
+            self._cache.set(cache_key, winner, expire=_FETCH_TTL)
+        return winner
+
+    def _fetch_url(self, url: str) -> Tuple[bytes, str, Optional[str]]:
+        """Fetch a document, serving repeat requests from the disk cache.
+
+        Returns (content, content_type, encoding).
+        """
+        key = ("fetch", hashlib.sha256(url.encode()).hexdigest())
+        if self._cache is not None:
+            hit = self._cache.get(key)
+            if hit is not None:
+                return hit
+
+        from app.services._http import SESSION
+
+        response = SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        result = (
+            response.content,
+            response.headers.get("content-type", "").lower(),
+            response.encoding,
+        )
+        if self._cache is not None:
+            self._cache.set(key, result, expire=_FETCH_TTL)
+        return result
 
     def _extract_text_from_url(self, url: str) -> Optional[str]:
-        """Extract text content from URL (handles PDFs and HTML)"""
+        """Extract text content from URL (handles PDFs and HTML).
+
+        Extracted text caches under the content's SHA-256, so identical
+        documents served from different URLs (common for mirrored
+        municipal PDFs) parse once — and pdfplumber output, the most
+        CPU-expensive step here, is never recomputed for unchanged bytes.
+        """
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            content, content_type, encoding = self._fetch_url(url)
 
-            content_type = response.headers.get("content-type", "").lower()
+            content_hash = hashlib.sha256(content).hexdigest()
+            if self._cache is not None:
+                cached_text = self._cache.get(("text", content_hash))
+                if cached_text is not None:
+                    return cached_text
 
             if "pdf" in content_type:
-                return self._extract_text_from_pdf(response.content)
+                text = self._extract_text_from_pdf(content)
             else:
-                # HTML
-                soup = BeautifulSoup(response.text, "html.parser")
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                return soup.get_text()
+                text = self._extract_text_from_html(
+                    content.decode(encoding or "utf-8", "replace")
+                )
+
+            if text and self._cache is not None:
+                self._cache.set(("text", content_hash), text)
+            return text
 
         except Exception as e:
             logger.error(f"Failed to extract text from {url}: {e}")
             return None
 
-    def _extract_text_from_pdf(self, pdf_content: bytes) -> Optional[str]:
-        """Extract text from PDF content"""
+    @staticmethod
+    def _extract_text_from_html(html: str) -> str:
+        """Extract visible text from HTML.
+
+        Municipal code pages are often megabytes of markup; selectolax's
+        Lexbor engine parses them an order of magnitude faster than
+        BeautifulSoup's html.parser, so it runs first when installed.
+        BeautifulSoup remains the fallback — both when the wheel is
+        missing and for documents Lexbor cannot make sense of.
+        """
+        if LexborHTMLParser is not None:
+            try:
+                tree = LexborHTMLParser(html)
+                for tag in tree.css("script, style"):
+                    tag.decompose()
+                if tree.body is not None:
+                    return tree.body.text(separator=" ")
+            except Exception as e:
+                logger.debug(f"selectolax parse failed, using BeautifulSoup: {e}")
+
+        soup = BeautifulSoup(html, "html.parser")
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        return soup.get_text()
+
+    def _extract_text_from_pdf(
+        self, pdf_content: bytes, maxpages: int = 10
+    ) -> Optional[str]:
+        """Extract text from PDF content.
+
+        pypdfium2 (Chrome's PDFium engine) extracts text 5-10x faster
+        than pdfplumber's pure-Python pdfminer backend, so it runs first;
+        pdfplumber handles documents PDFium rejects and installs without
+        the pypdfium2 wheel.
+        """
+        if pdfium is not None:
+            try:
+                pdf = pdfium.PdfDocument(pdf_content)
+                try:
+                    parts = []
+                    total = 0
+                    for index in range(min(len(pdf), maxpages)):
+                        page = pdf[index]
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range() or ""
+                        textpage.close()
+                        page.close()
+                        parts.append(page_text)
+                        total += len(page_text)
+                        # Stop once the LLM prompt window is covered
+                        if total >= _PDF_TEXT_BUDGET:
+                            break
+                    return "\n".join(parts)
+                finally:
+                    pdf.close()
+            except pdfium.PdfiumError as e:
+                logger.warning(f"PDFium failed, falling back to pdfplumber: {e}")
+
         try:
             import pdfplumber
-            import io
 
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                text = ""
-                for page in pdf.pages[:10]:  # First 10 pages
-                    text += page.extract_text() + "\n"
-                return text
+            # detect_vertical off: zoning tables are horizontal text and
+            # vertical-text analysis roughly doubles extract_text() CPU
+            with pdfplumber.open(
+                io.BytesIO(pdf_content), laparams={"detect_vertical": False}
+            ) as pdf:
+                parts = []
+                total = 0
+                for page in pdf.pages[:maxpages]:
+                    page_text = page.extract_text() or ""
+                    parts.append(page_text)
+                    total += len(page_text)
+                    # Stop once the LLM prompt window is covered
+                    if total >= _PDF_TEXT_BUDGET:
+                        break
+                return "\n".join(parts)
         except ImportError:
             logger.warning(
                 "pdfplumber not installed. Install with: poetry add pdfplumber"
@@ -135,12 +356,10 @@ class MunicipalCodeService:
             logger.error(f"Failed to extract PDF text: {e}")
             return None
 
-    def _extract_with_llm(self, text: str, city: str, state: str) -> Optional[Dict]:
-        """Use LLM to extract structured zoning data from text"""
-        if not self.call_llm:
-            return None
-
-        prompt = f"""Extract zoning code information from the following municipal code text for {city}, {state}.
+    @staticmethod
+    def _zoning_prompt(text: str, city: str, state: str) -> str:
+        """Build the zoning extraction prompt (shared by direct and batch paths)"""
+        return f"""Extract zoning code information from the following municipal code text for {city}, {state}.
 
 Extract the following information:
 1. Zoning district codes and names (e.g., "C-2 Commercial", "M-1 Industrial")
@@ -164,11 +383,22 @@ For each zoning district found, provide:
 Return as JSON format with a "zoning_districts" array.
 
 Text to analyze:
-{text[:8000]}  # Limit to 8000 chars for LLM
+{_clip_for_prompt(text)}
 """
 
+    def _extract_with_llm(self, text: str, city: str, state: str) -> Optional[Dict]:
+        """Use LLM to extract structured zoning data from text"""
+        if not self.call_llm:
+            return None
+
+        prompt = self._zoning_prompt(text, city, state)
+
         try:
-            response = self.call_llm(prompt)
+            # temperature=0: extraction is deterministic, so repeated runs
+            # over the same code text hit the LLM response cache
+            response = self.call_llm(
+                [{"role": "user", "content": prompt}], temperature=0
+            )
             # Parse LLM response (would need JSON parsing)
             # For now, return structured format
             return {
@@ -221,15 +451,7 @@ Text to analyze:
             f"https://www.{city.lower().replace(' ', '')}.gov/development-fees",
         ]
 
-        for url in patterns:
-            try:
-                response = requests.head(url, timeout=5, allow_redirects=True)
-                if response.status_code == 200:
-                    return url
-            except:
-                continue
-
-        return None
+        return self._probe_urls(patterns)
 
     def _extract_fees_with_llm(self, text: str, city: str, state: str) -> List[Dict]:
         """Use LLM to extract impact fee data"""
@@ -253,13 +475,181 @@ For each fee type, provide:
 Return as JSON array.
 
 Text:
-{text[:8000]}
+{_clip_for_prompt(text)}
 """
 
         try:
-            response = self.call_llm(prompt)
+            response = self.call_llm(
+                [{"role": "user", "content": prompt}], temperature=0
+            )
             # Parse and return fees
             return []
         except Exception as e:
             logger.error(f"LLM fee extraction failed: {e}")
             return []
+
+    def submit_zoning_batch(
+        self, cities: List[Tuple[str, str]], db=None
+    ) -> Optional[str]:
+        """
+        Submit zoning extractions for many cities as one OpenAI batch.
+
+        One LLM request per city goes into a JSONL file submitted to the
+        Batch API (24h completion window): bulk backfills pay one upload
+        instead of N sequential completion round trips, at half the
+        per-token cost. Text fetching still happens here, synchronously —
+        only the LLM work is deferred to the batch.
+
+        Args:
+            cities: List of (city, state) pairs
+            db: Optional session; when given, the batch id is recorded in
+                llm_batches so a worker can resume polling after restart
+
+        Returns:
+            The OpenAI batch id, or None if no city yielded usable text
+        """
+        lines = []
+        for city, state in cities:
+            source_url = self._find_municipal_code_url(city, state)
+            if not source_url:
+                logger.warning(f"No municipal code URL for {city}, {state}")
+                continue
+            text = self._extract_text_from_url(source_url)
+            if not text:
+                continue
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": f"{city}|{state}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": _BATCH_MODEL,
+                            "messages": [
+                                {
+                                    "role": "user",
+                                    "content": self._zoning_prompt(text, city, state),
+                                }
+                            ],
+                            "temperature": 0,
+                            "response_format": {"type": "json_object"},
+                        },
+                    }
+                )
+            )
+
+        if not lines:
+            logger.warning("Zoning batch submitted with no extractable cities")
+            return None
+
+        client = self._openai_client()
+        batch_file = client.files.create(
+            file=io.BytesIO("\n".join(lines).encode()), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=_BATCH_COMPLETION_WINDOW,
+        )
+        logger.info(f"Submitted zoning batch {batch.id} ({len(lines)} cities)")
+
+        if db is not None:
+            from app.models.schemas import LLMBatch
+
+            db.add(
+                LLMBatch(
+                    batch_id=batch.id,
+                    kind="zoning",
+                    status=batch.status,
+                    input_file_id=batch_file.id,
+                )
+            )
+            db.commit()
+
+        return batch.id
+
+    def collect_zoning_batch(
+        self, batch_id: str, db=None, poll_interval: float = 30.0
+    ) -> Dict[Tuple[str, str], Dict]:
+        """
+        Wait for a zoning batch and parse its results.
+
+        Polls until the batch reaches a terminal status, downloads the
+        output file, and returns structured data per (city, state). With a
+        session, districts are upserted into zoning_codes and the
+        llm_batches row is updated.
+        """
+        client = self._openai_client()
+        while True:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_TERMINAL_STATUSES:
+                break
+            logger.debug(f"Zoning batch {batch_id} still {batch.status}")
+            time.sleep(poll_interval)
+
+        if db is not None:
+            from app.models.schemas import LLMBatch
+
+            row = db.query(LLMBatch).filter_by(batch_id=batch_id).first()
+            if row:
+                row.status = batch.status
+                row.output_file_id = batch.output_file_id
+                db.commit()
+
+        if batch.status != "completed":
+            logger.error(f"Zoning batch {batch_id} ended {batch.status}")
+            return {}
+
+        output = client.files.content(batch.output_file_id)
+        results: Dict[Tuple[str, str], Dict] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                parsed = json.loads(line)
+                city, state = parsed["custom_id"].split("|", 1)
+                content = parsed["response"]["body"]["choices"][0]["message"][
+                    "content"
+                ]
+                extracted = json.loads(content)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Skipping malformed batch line: {e}")
+                continue
+            results[(city, state)] = {
+                "city": city,
+                "state": state,
+                "zoning_districts": extracted.get("zoning_districts", []),
+            }
+
+        if db is not None:
+            self._upsert_zoning_results(db, results)
+
+        return results
+
+    @staticmethod
+    def _upsert_zoning_results(db, results: Dict[Tuple[str, str], Dict]) -> None:
+        """Insert new zoning districts, skipping codes already on file"""
+        from app.models.schemas import ZoningCode
+
+        saved = 0
+        for (city, state), data in results.items():
+            for district in data.get("zoning_districts", []):
+                try:
+                    existing = (
+                        db.query(ZoningCode)
+                        .filter_by(
+                            city=city,
+                            state=state,
+                            zone_code=district.get("zone_code"),
+                        )
+                        .first()
+                    )
+                    if existing:
+                        continue
+                    db.add(ZoningCode(city=city, state=state, **district))
+                    saved += 1
+                except Exception as e:
+                    logger.warning(f"Failed to add zoning code: {e}")
+                    continue
+        db.commit()
+        logger.info(f"Saved {saved} zoning districts from batch results")
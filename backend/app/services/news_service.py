@@ -3,11 +3,14 @@ News Monitoring Service - Collects news articles about Publix and competitors
 Uses NewsAPI and Google News API
 """
 
+import asyncio
 import os
+import httpx
 import requests
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import time
 from dotenv import load_dotenv
 import re
@@ -15,6 +18,113 @@ import re
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    from w3lib.url import canonicalize_url
+except ImportError:
+    canonicalize_url = None
+
+
+def _canonical_url(url: Optional[str]) -> str:
+    """Normalize a URL for deduplication.
+
+    w3lib's canonicalizer (already in the tree via scrapy) handles query
+    sorting, percent-encoding and fragment stripping; the stdlib fallback
+    covers the common syndication differences (case, query order,
+    fragments).
+    """
+    if not url:
+        return ""
+    if canonicalize_url is not None:
+        try:
+            return canonicalize_url(url)
+        except Exception:
+            return url
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+def _title_signature(title: Optional[str]) -> str:
+    """Whitespace-normalized lowercase title prefix.
+
+    Catches the same story syndicated under different URLs.
+    """
+    if not title:
+        return ""
+    return " ".join(title.lower().split())[:80]
+
+# One keyword table covering topic, sentiment, relevance and Publix-mention
+# detection. With pyahocorasick available all of it is matched in a single
+# C-level sweep per article instead of a Python substring search per keyword.
+_SCAN_KEYWORDS = (
+    ("opening", "topic", "expansion"),
+    ("new store", "topic", "expansion"),
+    ("coming soon", "topic", "expansion"),
+    ("closing", "topic", "closure"),
+    ("closing down", "topic", "closure"),
+    ("shutting", "topic", "closure"),
+    ("planning", "topic", "planning"),
+    ("proposed", "topic", "planning"),
+    ("zoning", "topic", "planning"),
+    ("announcement", "topic", "announcement"),
+    ("announced", "topic", "announcement"),
+    ("great", "pos", None),
+    ("excited", "pos", None),
+    ("welcome", "pos", None),
+    ("success", "pos", None),
+    ("growth", "pos", None),
+    ("oppose", "neg", None),
+    ("concern", "neg", None),
+    ("worried", "neg", None),
+    ("against", "neg", None),
+    ("protest", "neg", None),
+    ("store", "rel", None),
+    ("grocery", "rel", None),
+    ("supermarket", "rel", None),
+    ("retail", "rel", None),
+    ("shopping", "rel", None),
+    ("publix", "mention", None),
+)
+
+# Ties between matched topics resolve by the historical elif order
+_TOPIC_PRIORITY = {"expansion": 0, "closure": 1, "planning": 2, "announcement": 3}
+
+# ASCII-only lowercase table: every classifier keyword is ASCII, and
+# bytes.translate is a single C loop over a 256-entry table — cheaper
+# than str.lower's full-Unicode path on article-sized strings. UTF-8
+# multibyte sequences all have the high bit set, so they pass through
+# untouched.
+_ASCII_LOWER = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)), bytes(range(ord("a"), ord("z") + 1))
+)
+
+
+def _fold_text(text: str) -> str:
+    """Lowercase ASCII letters via bytes.translate for keyword scanning"""
+    return text.encode("utf-8", "ignore").translate(_ASCII_LOWER).decode(
+        "utf-8", "ignore"
+    )
+
+if ahocorasick is not None:
+    _SCAN_AUTOMATON = ahocorasick.Automaton()
+    for _word, _category, _value in _SCAN_KEYWORDS:
+        _SCAN_AUTOMATON.add_word(_word, (_word, _category, _value))
+    _SCAN_AUTOMATON.make_automaton()
+else:
+    _SCAN_AUTOMATON = None
+
 
 class NewsService:
     """Service for monitoring news about Publix and competitors"""
@@ -34,6 +144,28 @@ class NewsService:
         self.newsapi_url = "https://newsapi.org/v2/everything"
         self.google_news_url = "https://www.googleapis.com/customsearch/v1"
 
+        # Async client for the provider fan-out, built lazily per loop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop = None
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Lazily build the shared httpx client (rebound on a new loop)"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50),
+                timeout=10,
+                transport=httpx.AsyncHTTPTransport(retries=3),
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the async client's connections, if one was created"""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def search_publix_news(
         self, city: Optional[str] = None, state: Optional[str] = None, days: int = 30
     ) -> List[Dict]:
@@ -48,8 +180,12 @@ class NewsService:
         Returns:
             List of news article dictionaries
         """
-        articles = []
+        return asyncio.run(self.search_publix_news_async(city, state, days))
 
+    async def search_publix_news_async(
+        self, city: Optional[str] = None, state: Optional[str] = None, days: int = 30
+    ) -> List[Dict]:
+        """Async variant of search_publix_news: both providers in parallel"""
         # Build query
         query = "Publix"
         if city and state:
@@ -57,20 +193,8 @@ class NewsService:
         elif state:
             query += f" {state}"
 
-        # Try NewsAPI first
-        if self.newsapi_key:
-            articles.extend(self._search_newsapi(query, days))
-
-        # Try Google News as fallback
-        if not articles and self.google_api_key:
-            articles.extend(self._search_google_news(query, days))
-
-        # Filter and process articles
-        processed = []
-        for article in articles:
-            processed_article = self._process_article(article, city, state)
-            if processed_article:
-                processed.append(processed_article)
+        articles = await self._gather_articles(query, days)
+        processed = self.score_articles(articles, city, state)
 
         logger.info(f"Found {len(processed)} Publix news articles")
         return processed
@@ -94,8 +218,18 @@ class NewsService:
         Returns:
             List of news article dictionaries
         """
-        articles = []
+        return asyncio.run(
+            self.search_competitor_news_async(competitor, city, state, days)
+        )
 
+    async def search_competitor_news_async(
+        self,
+        competitor: str,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        days: int = 30,
+    ) -> List[Dict]:
+        """Async variant of search_competitor_news: both providers in parallel"""
         # Build query
         query = competitor
         if city and state:
@@ -103,25 +237,44 @@ class NewsService:
         elif state:
             query += f" opening store {state}"
 
-        # Try NewsAPI first
-        if self.newsapi_key:
-            articles.extend(self._search_newsapi(query, days))
-
-        # Try Google News as fallback
-        if not articles and self.google_api_key:
-            articles.extend(self._search_google_news(query, days))
-
-        # Filter and process articles
-        processed = []
-        for article in articles:
-            processed_article = self._process_article(article, city, state, competitor)
-            if processed_article:
-                processed.append(processed_article)
+        articles = await self._gather_articles(query, days)
+        processed = self.score_articles(articles, city, state, competitor)
 
         logger.info(f"Found {len(processed)} {competitor} news articles")
         return processed
 
-    def _search_newsapi(self, query: str, days: int) -> List[Dict]:
+    async def _gather_articles(self, query: str, days: int) -> List[Dict]:
+        """Query NewsAPI and Google News concurrently and merge by URL.
+
+        Previously Google only ran when NewsAPI came back empty — serial
+        latency and a coverage gap (a partial NewsAPI result suppressed
+        Google's articles entirely). Both now always run; duplicates are
+        dropped on canonicalized URL and on title signature (the same
+        story syndicated across outlets), with NewsAPI results winning
+        ties. Rejecting duplicates here means they never reach
+        _process_article or downstream storage.
+        """
+        newsapi_articles, google_articles = await asyncio.gather(
+            self._search_newsapi(query, days),
+            self._search_google_news(query, days),
+        )
+
+        merged = []
+        seen_urls = set()
+        seen_titles = set()
+        for article in newsapi_articles + google_articles:
+            url = _canonical_url(article.get("url"))
+            title_sig = _title_signature(article.get("title"))
+            if (url and url in seen_urls) or (title_sig and title_sig in seen_titles):
+                continue
+            if url:
+                seen_urls.add(url)
+            if title_sig:
+                seen_titles.add(title_sig)
+            merged.append(article)
+        return merged
+
+    async def _search_newsapi(self, query: str, days: int) -> List[Dict]:
         """Search using NewsAPI"""
         if not self.newsapi_key:
             return []
@@ -138,7 +291,7 @@ class NewsService:
                 "pageSize": 50,
             }
 
-            response = requests.get(self.newsapi_url, params=params, timeout=10)
+            response = await self._async_client().get(self.newsapi_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -150,7 +303,7 @@ class NewsService:
 
         return []
 
-    def _search_google_news(self, query: str, days: int) -> List[Dict]:
+    async def _search_google_news(self, query: str, days: int) -> List[Dict]:
         """Search using Google News (via Custom Search API)"""
         if not self.google_api_key:
             return []
@@ -169,7 +322,9 @@ class NewsService:
                 "num": 10,
             }
 
-            response = requests.get(self.google_news_url, params=params, timeout=10)
+            response = await self._async_client().get(
+                self.google_news_url, params=params
+            )
             response.raise_for_status()
             data = response.json()
 
@@ -192,6 +347,27 @@ class NewsService:
 
         return []
 
+    def score_articles(
+        self,
+        articles: List[Dict],
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        competitor: Optional[str] = None,
+    ) -> List[Dict]:
+        """Classify and score a batch of raw provider articles.
+
+        Single entry point for topic/sentiment/relevance scoring so both
+        search paths (and any future bulk backfill) share it. Each article
+        costs one lowercase and one keyword sweep; unusable articles
+        (missing title or URL) are dropped.
+        """
+        processed = []
+        for article in articles:
+            processed_article = self._process_article(article, city, state, competitor)
+            if processed_article:
+                processed.append(processed_article)
+        return processed
+
     def _process_article(
         self,
         article: Dict,
@@ -207,39 +383,65 @@ class NewsService:
         if not title or not url:
             return None
 
-        # Extract published date
+        # Extract published date. ciso8601 parses ISO-8601 in C and takes
+        # the Z suffix directly, so the common case costs no exception
+        # unwinds or intermediate strings; the stdlib chain remains as
+        # fallback when it isn't installed.
         published_str = article.get("publishedAt", "")
         published_date = None
         if published_str:
-            try:
-                # Try parsing ISO format
-                published_date = datetime.fromisoformat(
-                    published_str.replace("Z", "+00:00")
-                )
-            except:
+            if ciso8601 is not None:
                 try:
-                    # Try other formats
-                    published_date = datetime.strptime(
-                        published_str, "%Y-%m-%dT%H:%M:%S"
-                    )
-                except:
+                    published_date = ciso8601.parse_datetime(published_str)
+                except ValueError:
                     pass
+            else:
+                try:
+                    # Try parsing ISO format
+                    published_date = datetime.fromisoformat(
+                        published_str.replace("Z", "+00:00")
+                    )
+                except ValueError:
+                    try:
+                        # Try other formats
+                        published_date = datetime.strptime(
+                            published_str, "%Y-%m-%dT%H:%M:%S"
+                        )
+                    except ValueError:
+                        pass
+
+        # Topic, sentiment, relevance terms and Publix mention in one
+        # lowercase + one sweep of the text
+        text = _fold_text(title + " " + content)
+        topics, positive, negative, has_relevance_term, mentions = self._scan_text(
+            text
+        )
 
         # Determine topic
-        topic = self._classify_topic(title, content)
+        topic = (
+            min(topics, key=_TOPIC_PRIORITY.__getitem__) if topics else "general"
+        )
 
-        # Determine sentiment
-        sentiment = self._classify_sentiment(title, content)
+        # Determine sentiment (distinct matched words, as before)
+        if len(positive) > len(negative):
+            sentiment = "positive"
+        elif len(negative) > len(positive):
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
 
         # Check if mentions Publix
-        mentions_publix = (
-            ("publix" in title.lower() or "publix" in content.lower())
-            if not competitor
-            else False
-        )
+        mentions_publix = mentions if not competitor else False
 
-        # Calculate relevance score
-        relevance_score = self._calculate_relevance(title, content, city, state)
+        # Calculate relevance score (0.0 to 1.0)
+        relevance_score = 0.5  # Base score
+        if city and city.lower() in text:
+            relevance_score += 0.2
+        if state and state.lower() in text:
+            relevance_score += 0.2
+        if has_relevance_term:
+            relevance_score += 0.1
+        relevance_score = min(1.0, relevance_score)
 
         return {
             "title": title,
@@ -256,55 +458,41 @@ class NewsService:
             "relevance_score": relevance_score,
         }
 
-    def _classify_topic(self, title: str, content: str) -> str:
-        """Classify article topic"""
-        text = (title + " " + content).lower()
-
-        if any(word in text for word in ["opening", "new store", "coming soon"]):
-            return "expansion"
-        elif any(word in text for word in ["closing", "closing down", "shutting"]):
-            return "closure"
-        elif any(word in text for word in ["planning", "proposed", "zoning"]):
-            return "planning"
-        elif any(word in text for word in ["announcement", "announced"]):
-            return "announcement"
-        else:
-            return "general"
-
-    def _classify_sentiment(self, title: str, content: str) -> str:
-        """Classify article sentiment"""
-        text = (title + " " + content).lower()
-
-        positive_words = ["great", "excited", "welcome", "success", "growth"]
-        negative_words = ["oppose", "concern", "worried", "against", "protest"]
-
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
+    @staticmethod
+    def _scan_text(text: str):
+        """Match every classifier keyword against text in one pass.
 
-        if positive_count > negative_count:
-            return "positive"
-        elif negative_count > positive_count:
-            return "negative"
+        Returns (topics, positive_words, negative_words, has_relevance_term,
+        mentions_publix). Word sets hold distinct matches, preserving the
+        old distinct-word sentiment counting.
+        """
+        topics = set()
+        positive = set()
+        negative = set()
+        has_relevance_term = False
+        mentions = False
+
+        if _SCAN_AUTOMATON is not None:
+            matches = (payload for _, payload in _SCAN_AUTOMATON.iter(text))
         else:
-            return "neutral"
-
-    def _calculate_relevance(
-        self, title: str, content: str, city: Optional[str], state: Optional[str]
-    ) -> float:
-        """Calculate relevance score (0.0 to 1.0)"""
-        score = 0.5  # Base score
-
-        text = (title + " " + content).lower()
-
-        # Boost if mentions location
-        if city and city.lower() in text:
-            score += 0.2
-        if state and state.lower() in text:
-            score += 0.2
-
-        # Boost if mentions expansion-related terms
-        expansion_terms = ["store", "grocery", "supermarket", "retail", "shopping"]
-        if any(term in text for term in expansion_terms):
-            score += 0.1
+            # Fallback without pyahocorasick: same semantics, one Python
+            # substring check per keyword
+            matches = (
+                (word, category, value)
+                for word, category, value in _SCAN_KEYWORDS
+                if word in text
+            )
 
-        return min(1.0, score)
+        for word, category, value in matches:
+            if category == "topic":
+                topics.add(value)
+            elif category == "pos":
+                positive.add(word)
+            elif category == "neg":
+                negative.add(word)
+            elif category == "rel":
+                has_relevance_term = True
+            else:
+                mentions = True
+
+        return topics, positive, negative, has_relevance_term, mentions
@@ -5,6 +5,7 @@ Note: County GIS systems vary widely. This service provides a framework that can
 extended for specific county APIs.
 """
 
+import math
 import os
 import requests
 import logging
@@ -12,8 +13,37 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import time
 
+import numpy as np
+
+try:
+    from rtree import index as rtree_index
+except ImportError:
+    rtree_index = None
+
 logger = logging.getLogger(__name__)
 
+_EARTH_RADIUS_MILES = 3959.0
+
+
+def _haversine_vector(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles; accepts scalars or NumPy arrays.
+
+    Broadcasting does the pairing, so one parcel array against one
+    anchor point batches all the trig into C loops instead of per-call
+    Python math.
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(value, dtype=np.float64))
+        for value in (lat1, lon1, lat2, lon2)
+    )
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    )
+    return _EARTH_RADIUS_MILES * 2 * np.arcsin(np.sqrt(a))
+
 
 class ParcelService:
     """Service for collecting parcel data using Smarty API and county GIS systems"""
@@ -22,6 +52,10 @@ class ParcelService:
         self.db = db
         self.rate_limiter_delay = 1.0  # 1 second between requests
 
+        # Lazily built R-tree over parcel points for radius queries
+        self._parcel_index = None
+        self._indexed_parcels = None
+
         # Initialize Smarty service if available
         try:
             from app.services.smarty_service import SmartyService
@@ -177,28 +211,143 @@ class ParcelService:
             f"Getting parcels near ({latitude}, {longitude}) "
             f"within {radius_miles} miles, {min_acreage}-{max_acreage} acres"
         )
-        # Implementation depends on GIS system spatial query capabilities
-        return []
+        if self.db is None:
+            logger.warning("No database session - cannot search parcels near anchors")
+            return []
 
-    def _haversine_distance(
-        self, lat1: float, lon1: float, lat2: float, lon2: float
-    ) -> float:
-        """Calculate distance between two points in miles"""
-        import math
+        from app.models.schemas import Parcel
+
+        # Classic filter-and-refine: a cheap bounding-box prefilter picks
+        # candidates, then exact distances refine them in one vectorized
+        # pass. With rtree installed the prefilter is an in-process R-tree
+        # lookup (O(log N) per query, no DB round trip after the first
+        # call); otherwise it falls back to a range query on the indexed
+        # lat/lon columns.
+        delta_lat, delta_lon = self._radius_to_deltas(latitude, radius_miles)
+
+        if rtree_index is not None:
+            spatial_index, rows = self._get_parcel_index()
+            candidates = [
+                rows[position]
+                for position in spatial_index.intersection(
+                    (
+                        longitude - delta_lon,
+                        latitude - delta_lat,
+                        longitude + delta_lon,
+                        latitude + delta_lat,
+                    )
+                )
+            ]
+            candidates = [
+                parcel
+                for parcel in candidates
+                if parcel.acreage is not None
+                and min_acreage <= parcel.acreage <= max_acreage
+            ]
+        else:
+            candidates = (
+                self.db.query(Parcel)
+                .filter(
+                    Parcel.latitude.between(
+                        latitude - delta_lat, latitude + delta_lat
+                    ),
+                    Parcel.longitude.between(
+                        longitude - delta_lon, longitude + delta_lon
+                    ),
+                    Parcel.acreage.between(min_acreage, max_acreage),
+                )
+                .all()
+            )
+        return self._refine_by_distance(candidates, latitude, longitude, radius_miles)
+
+    def _get_parcel_index(self):
+        """Lazily build the R-tree over parcel points (degenerate rects).
+
+        Built once per service instance from the session's parcels, so K
+        anchor queries against N parcels cost one load plus K bbox
+        lookups instead of K table scans.
+        """
+        if self._parcel_index is None:
+            from app.models.schemas import Parcel
+
+            rows = (
+                self.db.query(Parcel)
+                .filter(Parcel.latitude.isnot(None), Parcel.longitude.isnot(None))
+                .all()
+            )
+            spatial_index = rtree_index.Index()
+            for position, parcel in enumerate(rows):
+                spatial_index.insert(
+                    position,
+                    (
+                        parcel.longitude,
+                        parcel.latitude,
+                        parcel.longitude,
+                        parcel.latitude,
+                    ),
+                )
+            self._parcel_index = spatial_index
+            self._indexed_parcels = rows
+            logger.info(f"Built parcel spatial index over {len(rows)} parcels")
+        return self._parcel_index, self._indexed_parcels
+
+    @staticmethod
+    def _radius_to_deltas(latitude: float, radius_miles: float):
+        """Convert a mile radius to lat/lon degree half-widths"""
+        delta_lat = radius_miles / 69.0
+        delta_lon = radius_miles / (
+            69.0 * max(math.cos(math.radians(latitude)), 0.01)
+        )
+        return delta_lat, delta_lon
 
-        R = 3959  # Earth radius in miles
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
+    @staticmethod
+    def _refine_by_distance(
+        candidates: List, latitude: float, longitude: float, radius_miles: float
+    ) -> List[Dict]:
+        """Exact haversine filter over candidate Parcel rows, vectorized.
 
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(math.radians(lat1))
-            * math.cos(math.radians(lat2))
-            * math.sin(dlon / 2) ** 2
+        No Python loop over the full candidate set: distances compute in
+        one NumPy pass and only in-radius rows are converted to dicts.
+        """
+        if not candidates:
+            return []
+
+        count = len(candidates)
+        lats = np.fromiter(
+            (p.latitude for p in candidates), dtype=np.float64, count=count
+        )
+        lons = np.fromiter(
+            (p.longitude for p in candidates), dtype=np.float64, count=count
         )
-        c = 2 * math.asin(math.sqrt(a))
+        distances = _haversine_vector(lats, lons, latitude, longitude)
+
+        results = []
+        for index in np.nonzero(distances <= radius_miles)[0]:
+            parcel = candidates[index]
+            results.append(
+                {
+                    "parcel_id": parcel.parcel_id,
+                    "address": parcel.address,
+                    "city": parcel.city,
+                    "state": parcel.state,
+                    "acreage": parcel.acreage,
+                    "current_zoning": parcel.current_zoning,
+                    "assessed_value": parcel.assessed_value,
+                    "land_use_code": parcel.land_use_code,
+                    "latitude": parcel.latitude,
+                    "longitude": parcel.longitude,
+                    "owner_name": parcel.owner_name,
+                    "owner_type": parcel.owner_type,
+                    "distance_miles": float(distances[index]),
+                }
+            )
+        return results
 
-        return R * c
+    def _haversine_distance(
+        self, lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> float:
+        """Calculate distance between two points in miles"""
+        return float(_haversine_vector(lat1, lon1, lat2, lon2))
 
 
 # County-specific implementations would extend this base class
@@ -5,6 +5,8 @@ Planning commission scraper for monitoring meeting agendas and identifying Publi
 import os
 import requests
 import logging
+
+from app.services._http import SESSION
 from typing import List, Dict, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -73,7 +75,7 @@ class PlanningCommissionScraper:
 
         for url in patterns:
             try:
-                response = requests.head(url, timeout=5, allow_redirects=True)
+                response = SESSION.head(url, timeout=5, allow_redirects=True)
                 if response.status_code == 200:
                     return url
             except:
@@ -84,7 +86,7 @@ class PlanningCommissionScraper:
     def _get_meeting_agendas(self, base_url: str, months_back: int) -> List[Dict]:
         """Get meeting agenda URLs"""
         try:
-            response = requests.get(base_url, timeout=10)
+            response = SESSION.get(base_url, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
@@ -117,7 +119,7 @@ class PlanningCommissionScraper:
             return []
 
         try:
-            response = requests.get(url, timeout=10)
+            response = SESSION.get(url, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
@@ -12,6 +12,7 @@ Documentation: https://www.smarty.com/docs
 
 import os
 import requests
+import httpx
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -48,6 +49,16 @@ class SmartyService:
 
         self.rate_limiter_delay = 0.1  # 100ms between requests
 
+        # Smarty's street API accepts up to 100 lookups per batch POST
+        self.batch_size = 100
+        self._batch_client: Optional[httpx.Client] = None
+
+    def _get_batch_client(self) -> httpx.Client:
+        """Lazily create a pooled HTTP client for batch lookups"""
+        if self._batch_client is None:
+            self._batch_client = httpx.Client(timeout=10)
+        return self._batch_client
+
     def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """Make authenticated request to Smarty API"""
         if not self.available:
@@ -105,23 +116,95 @@ class SmartyService:
         data = self._make_request(self.streets_url, params)
 
         if data and len(data) > 0:
-            result = data[0]
-            components = result.get("components", {})
-            metadata = result.get("metadata", {})
-
-            return {
-                "address": result.get("delivery_line_1", address),
-                "city": components.get("city_name", city),
-                "state": components.get("state_abbreviation", state),
-                "zip_code": components.get("zipcode", zip_code),
-                "latitude": metadata.get("latitude"),
-                "longitude": metadata.get("longitude"),
-                "precision": metadata.get("precision"),
-                "smarty_data": result,
-            }
+            return self._format_geocode_result(data[0], address, city, state, zip_code)
 
         return None
 
+    @staticmethod
+    def _format_geocode_result(
+        result: Dict,
+        address: str,
+        city: str,
+        state: str,
+        zip_code: Optional[str] = None,
+    ) -> Dict:
+        """Shape a raw Smarty street candidate into our geocode dict"""
+        components = result.get("components", {})
+        metadata = result.get("metadata", {})
+
+        return {
+            "address": result.get("delivery_line_1", address),
+            "city": components.get("city_name", city),
+            "state": components.get("state_abbreviation", state),
+            "zip_code": components.get("zipcode", zip_code),
+            "latitude": metadata.get("latitude"),
+            "longitude": metadata.get("longitude"),
+            "precision": metadata.get("precision"),
+            "smarty_data": result,
+        }
+
+    def geocode_addresses(
+        self, addresses: List[Dict[str, str]]
+    ) -> List[Optional[Dict]]:
+        """
+        Geocode many addresses via Smarty's batch street API
+
+        Sends up to 100 lookups per POST over a pooled connection instead of
+        one GET (plus rate-limit sleep) per address.
+
+        Args:
+            addresses: List of dicts with 'address', 'city', 'state', optional 'zip_code'
+
+        Returns:
+            List aligned with the input; None where an address had no match
+        """
+        if not self.available:
+            logger.warning("Smarty API not available - credentials missing")
+            return [None] * len(addresses)
+
+        results: List[Optional[Dict]] = [None] * len(addresses)
+        client = self._get_batch_client()
+        auth_params = {"auth-id": self.auth_id, "auth-token": self.api_key}
+
+        for start in range(0, len(addresses), self.batch_size):
+            batch = addresses[start : start + self.batch_size]
+            payload = []
+            for addr in batch:
+                lookup = {
+                    "street": addr.get("address", ""),
+                    "city": addr.get("city", ""),
+                    "state": addr.get("state", ""),
+                }
+                if addr.get("zip_code"):
+                    lookup["zipcode"] = addr["zip_code"]
+                payload.append(lookup)
+
+            try:
+                response = client.post(
+                    self.streets_url, params=auth_params, json=payload
+                )
+                response.raise_for_status()
+                candidates = response.json()
+            except httpx.HTTPError as e:
+                logger.error(f"Smarty batch geocode failed: {e}")
+                continue
+
+            # Each candidate carries the index of the lookup it answers
+            for candidate in candidates:
+                input_index = candidate.get("input_index")
+                if input_index is None:
+                    continue
+                addr = batch[input_index]
+                results[start + input_index] = self._format_geocode_result(
+                    candidate,
+                    addr.get("address", ""),
+                    addr.get("city", ""),
+                    addr.get("state", ""),
+                    addr.get("zip_code"),
+                )
+
+        return results
+
     def get_property_by_address(
         self, address: str, city: str, state: str, zip_code: Optional[str] = None
     ) -> Optional[Dict]:
@@ -248,15 +331,7 @@ class SmartyService:
         if not self.available:
             return []
 
-        properties = []
-        for addr in addresses:
-            prop = self.get_property_by_address(
-                address=addr.get("address", ""),
-                city=addr.get("city", ""),
-                state=addr.get("state", ""),
-                zip_code=addr.get("zip_code"),
-            )
-            if prop:
-                properties.append(prop)
-
-        return properties
+        # Property data currently resolves to geocoded data (see
+        # get_property_by_address), so the batch street API covers this in
+        # one request per 100 addresses.
+        return [prop for prop in self.geocode_addresses(addresses) if prop]
@@ -18,5 +18,6 @@ python -m alembic upgrade head || {
 echo "🌐 Starting FastAPI server on port $PORT..."
 # Use exec to replace shell process
 # Add --log-level info for better visibility
-exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --log-level info
+# uvloop/httptools (from uvicorn[standard]) speed up the event loop and HTTP parsing
+exec uvicorn app.main:app --host 0.0.0.0 --port "$PORT" --log-level info --loop uvloop --http httptools
 